@@ -0,0 +1,827 @@
+import asyncio
+import functools
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+
+import aiopg
+from cachetools import TTLCache
+from psycopg2.extras import RealDictCursor
+
+from config import config
+from database import (
+    ADD_LIKE_AND_MATCH_QUERY,
+    CLAIM_UPDATE_QUERY,
+    EXCLUDED_USER_IDS_QUERY,
+    HAS_LIKED_QUERY,
+    KV_DELETE_QUERY,
+    KV_GET_QUERY,
+    KV_PURGE_QUERY,
+    KV_SET_QUERY,
+    MATCHING_SNAPSHOT_QUERY,
+    PURGE_PROCESSED_UPDATES_QUERY,
+    PURGE_SWIPES_QUERY,
+    RECONCILE_COUNTERS_QUERY,
+    RECORD_LIKES_QUERY,
+    RECORD_SKIPS_QUERY,
+    RELEASE_UPDATE_QUERY,
+    USERS_STATS_QUERY,
+    build_candidate_page_query,
+    build_like_list_query,
+    build_nearby_candidates_query,
+    skip_cooldown_seconds,
+    split_candidate_page,
+    split_like_batch,
+    split_like_list_page,
+    split_nearby_page,
+)
+
+
+class AsyncDatabase:
+    """Asyncio-native PostgreSQL backend with a connection pool.
+
+    Exposes the same method names as ``database.Database`` but every query
+    method is a coroutine, so handlers can ``await`` them without blocking
+    the event loop. The schema itself is still created and migrated by the
+    synchronous ``Database`` at startup.
+    """
+
+    def __init__(self, minsize: int = None, maxsize: int = None, timeout: float = None):
+        self.minsize = minsize if minsize is not None else config.DB_POOL_MIN_SIZE
+        self.maxsize = maxsize if maxsize is not None else config.DB_POOL_MAX_SIZE
+        self.timeout = timeout if timeout is not None else config.DB_QUERY_TIMEOUT
+        self.pool = None
+        self._pool_lock = asyncio.Lock()
+
+    async def connect(self):
+        """Create the connection pool (safe to call more than once)"""
+        async with self._pool_lock:
+            if self.pool is not None:
+                return self.pool
+            try:
+                database_url = os.getenv('DATABASE_URL')
+
+                if database_url:
+                    # For Heroku and other cloud providers
+                    self.pool = await aiopg.create_pool(
+                        database_url,
+                        minsize=self.minsize,
+                        maxsize=self.maxsize,
+                        timeout=self.timeout,
+                        enable_hstore=False,
+                        sslmode='require'
+                    )
+                else:
+                    # For local development
+                    self.pool = await aiopg.create_pool(
+                        minsize=self.minsize,
+                        maxsize=self.maxsize,
+                        timeout=self.timeout,
+                        enable_hstore=False,
+                        host=config.DB_HOST,
+                        database=config.DB_NAME,
+                        user=config.DB_USER,
+                        password=config.DB_PASSWORD,
+                        port=config.DB_PORT
+                    )
+
+                logging.info(f"✅ Async PostgreSQL pool ready (size {self.minsize}-{self.maxsize})")
+                return self.pool
+            except Exception as e:
+                logging.error(f"❌ Error creating database pool: {e}")
+                raise
+
+    async def close(self):
+        """Close the connection pool and wait for connections to be released"""
+        if self.pool is not None:
+            self.pool.close()
+            await self.pool.wait_closed()
+            self.pool = None
+            logging.info("✅ Async PostgreSQL pool closed")
+
+    async def _get_pool(self):
+        if self.pool is None:
+            await self.connect()
+        return self.pool
+
+    async def _fetchone(self, query: str, params: tuple = None, dict_rows: bool = True):
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            cursor_factory = RealDictCursor if dict_rows else None
+            async with conn.cursor(cursor_factory=cursor_factory) as cursor:
+                await cursor.execute(query, params, timeout=self.timeout)
+                return await cursor.fetchone()
+
+    async def _fetchall(self, query: str, params: tuple = None, dict_rows: bool = True):
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            cursor_factory = RealDictCursor if dict_rows else None
+            async with conn.cursor(cursor_factory=cursor_factory) as cursor:
+                await cursor.execute(query, params, timeout=self.timeout)
+                return await cursor.fetchall()
+
+    async def _execute(self, query: str, params: tuple = None) -> int:
+        """Run a single write statement (autocommit) and return the affected row count"""
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                await cursor.execute(query, params, timeout=self.timeout)
+                return cursor.rowcount
+
+    async def add_user(self, user_id: int, username: str, first_name: str, last_name: str = ""):
+        """Add new user to database"""
+        try:
+            await self._execute('''
+                INSERT INTO users (user_id, username, first_name, last_name)
+                VALUES (%s, %s, %s, %s)
+                ON CONFLICT (user_id) DO NOTHING
+            ''', (user_id, username, first_name, last_name))
+        except Exception as e:
+            logging.error(f"Error adding user: {e}")
+
+    async def get_user(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """Get user data by user_id"""
+        try:
+            return await self._fetchone('SELECT * FROM users WHERE user_id = %s', (user_id,))
+        except Exception as e:
+            logging.error(f"Error getting user: {e}")
+            return None
+
+    async def get_users_for_matching(self, user_id: int, gender: str) -> List[Dict[str, Any]]:
+        """Get potential matches for a user (opposite gender, not liked/blocked/swiped)"""
+        # Get opposite gender
+        opposite_gender = "female" if gender.lower() == "male" else "male"
+
+        try:
+            return await self._fetchall('''
+                SELECT u.* FROM users u
+                WHERE u.gender = %s
+                AND u.user_id != %s
+                AND u.is_active = TRUE
+                AND u.user_id NOT IN (
+                    SELECT blocked_user_id FROM blocks WHERE user_id = %s
+                )
+                AND u.user_id NOT IN (
+                    SELECT liked_user_id FROM likes WHERE user_id = %s
+                )
+                AND u.photos IS NOT NULL
+                AND u.bio IS NOT NULL
+                AND u.photos != '[]'
+                AND u.bio != ''
+            ''', (opposite_gender, user_id, user_id, user_id))
+        except Exception as e:
+            logging.error(f"Error getting matches: {e}")
+            return []
+
+    async def get_candidate_page(self, user_id: int, gender: str, seed: str, cursor_token: str = None, limit: int = 20,
+                                 exclude_near: Tuple[float, float, float] = None,
+                                 preferences: dict = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Get one page of potential matches in a stable random order (see Database.get_candidate_page)"""
+        try:
+            # A token from before an upgrade doesn't parse: the pass starts over
+            query, params = build_candidate_page_query(user_id, gender, seed, cursor_token, limit,
+                                                       exclude_near, preferences)
+            rows = await self._fetchall(query, params)
+            return split_candidate_page(rows, limit)
+        except Exception as e:
+            logging.error(f"Error getting candidate page: {e}")
+            return [], None
+
+    async def get_nearby_candidates(self, user_id: int, gender: str, latitude: float, longitude: float, radius_km: float,
+                                    cursor_token: str = None, limit: int = 20,
+                                    preferences: dict = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Get one page of potential matches within ``radius_km``, nearest first (see Database.get_nearby_candidates)"""
+        try:
+            # A token from before an upgrade doesn't parse: the pass starts over
+            query, params = build_nearby_candidates_query(user_id, gender, latitude, longitude, radius_km,
+                                                          cursor_token, limit, preferences)
+            rows = await self._fetchall(query, params)
+            return split_nearby_page(rows, limit)
+        except Exception as e:
+            logging.error(f"Error getting nearby candidates: {e}")
+            return [], None
+
+    async def get_matching_snapshot(self) -> List[Dict[str, Any]]:
+        """Get the matching attributes of every browsable profile (for the in-memory index)"""
+        try:
+            return await self._fetchall(MATCHING_SNAPSHOT_QUERY)
+        except Exception as e:
+            logging.error(f"Error getting matching snapshot: {e}")
+            return []
+
+    async def get_users_by_ids(self, user_ids: List[int]) -> List[Dict[str, Any]]:
+        """Get active users by id, in the order the ids were given"""
+        if not user_ids:
+            return []
+        try:
+            rows = await self._fetchall('''
+                SELECT * FROM users
+                WHERE user_id = ANY(%s) AND is_active = TRUE
+            ''', (list(user_ids),))
+            rows = {row['user_id']: row for row in rows}
+            return [rows[user_id] for user_id in user_ids if user_id in rows]
+        except Exception as e:
+            logging.error(f"Error getting users by ids: {e}")
+            return []
+
+    async def get_excluded_user_ids(self, user_id: int) -> List[int]:
+        """Get ids the user already liked, blocked or recently skipped, sorted ascending"""
+        try:
+            rows = await self._fetchall(EXCLUDED_USER_IDS_QUERY, (user_id, user_id, user_id, skip_cooldown_seconds()),
+                                        dict_rows=False)
+            return [row[0] for row in rows]
+        except Exception as e:
+            logging.error(f"Error getting excluded users: {e}")
+            return []
+
+    async def add_like(self, user_id: int, liked_user_id: int) -> bool:
+        """Add a like between users"""
+        try:
+            rowcount = await self._execute('''
+                INSERT INTO likes (user_id, liked_user_id)
+                VALUES (%s, %s)
+                ON CONFLICT (user_id, liked_user_id) DO NOTHING
+            ''', (user_id, liked_user_id))
+            return rowcount > 0
+        except Exception as e:
+            logging.error(f"Error adding like: {e}")
+            return False
+
+    async def add_message(self, from_user_id: int, to_user_id: int, message_content: str, message_type: str = "text", media_file_id: str = None):
+        """Add message to database with type and media file ID support"""
+        query = """
+        INSERT INTO messages (from_user_id, to_user_id, message_text, message_type, media_file_id, created_at)
+        VALUES (%s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
+        """
+        try:
+            await self._execute(query, (from_user_id, to_user_id, message_content, message_type, media_file_id))
+            return True
+        except Exception as e:
+            logging.error(f"Error adding message: {e}")
+            return False
+
+    async def add_block(self, user_id: int, blocked_user_id: int) -> bool:
+        """Block a user"""
+        try:
+            rowcount = await self._execute('''
+                INSERT INTO blocks (user_id, blocked_user_id)
+                VALUES (%s, %s)
+                ON CONFLICT (user_id, blocked_user_id) DO NOTHING
+            ''', (user_id, blocked_user_id))
+            return rowcount > 0
+        except Exception as e:
+            logging.error(f"Error adding block: {e}")
+            return False
+
+    async def get_user_likes(self, user_id: int, cursor_token: str = None,
+                             limit: int = 5) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[str]]:
+        """Get one page of the users who liked the current user (see Database.get_user_likes)"""
+        try:
+            query, params = build_like_list_query('likers', user_id, cursor_token, limit)
+            rows = await self._fetchall(query, params)
+            return split_like_list_page(rows, limit, cursor_token)
+        except Exception as e:
+            logging.error(f"Error getting user likes: {e}")
+            return [], None, None
+
+    async def get_mutual_likes(self, user_id: int, cursor_token: str = None,
+                               limit: int = 5) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[str]]:
+        """Get one page of mutual matches, newest match first"""
+        try:
+            query, params = build_like_list_query('matches', user_id, cursor_token, limit)
+            rows = await self._fetchall(query, params)
+            return split_like_list_page(rows, limit, cursor_token)
+        except Exception as e:
+            logging.error(f"Error getting mutual likes: {e}")
+            return [], None, None
+
+    async def add_complaint(self, user_id: int, complaint_type: str, complaint_text: str, reported_user_id: int = None) -> bool:
+        """Add a user complaint to database"""
+        try:
+            await self._execute('''
+                INSERT INTO complaints (user_id, reported_user_id, complaint_type, complaint_text)
+                VALUES (%s, %s, %s, %s)
+            ''', (user_id, reported_user_id, complaint_type, complaint_text))
+            return True
+        except Exception as e:
+            logging.error(f"Error adding complaint: {e}")
+            return False
+
+    async def delete_user_account(self, user_id: int) -> bool:
+        """Delete user account and all associated data"""
+        try:
+            # PostgreSQL handles CASCADE deletion automatically due to foreign key constraints
+            rowcount = await self._execute('DELETE FROM users WHERE user_id = %s', (user_id,))
+            return rowcount > 0
+        except Exception as e:
+            logging.error(f"Error deleting user account: {e}")
+            return False
+
+    async def update_user_language(self, user_id: int, language: str) -> bool:
+        """Update user's preferred language"""
+        try:
+            rowcount = await self._execute('''
+                UPDATE users SET language = %s WHERE user_id = %s
+            ''', (language, user_id))
+            return rowcount > 0
+        except Exception as e:
+            logging.error(f"Error updating language: {e}")
+            return False
+
+    async def get_user_likes_count(self, user_id: int) -> int:
+        """Get count of how many people liked the user"""
+        try:
+            # Maintained by the likes_counters_* triggers
+            row = await self._fetchone('SELECT likes_count FROM users WHERE user_id = %s', (user_id,), dict_rows=False)
+            return row[0] if row else 0
+        except Exception as e:
+            logging.error(f"Error getting user likes count: {e}")
+            return 0
+
+    async def get_user_matches_count(self, user_id: int) -> int:
+        """Get count of user's mutual matches"""
+        try:
+            # Maintained by the likes_counters_* triggers
+            row = await self._fetchone('SELECT matches_count FROM users WHERE user_id = %s', (user_id,), dict_rows=False)
+            return row[0] if row else 0
+        except Exception as e:
+            logging.error(f"Error getting user matches count: {e}")
+            return 0
+
+    async def reconcile_counters(self) -> int:
+        """Rebuild like/match counters from the likes table; returns rows corrected"""
+        try:
+            return await self._execute(RECONCILE_COUNTERS_QUERY)
+        except Exception as e:
+            logging.error(f"Error reconciling counters: {e}")
+            return 0
+
+    async def get_users_stats(self, user_ids: List[int]) -> Dict[int, Dict[str, int]]:
+        """Get likes, matches and coins for several users in one query"""
+        if not user_ids:
+            return {}
+        try:
+            rows = await self._fetchall(USERS_STATS_QUERY, (list(user_ids),))
+            return {row.pop('user_id'): dict(row) for row in rows}
+        except Exception as e:
+            logging.error(f"Error getting users stats: {e}")
+            return {}
+
+    async def get_user_coins(self, user_id: int) -> int:
+        """Get user's coin balance"""
+        try:
+            row = await self._fetchone('SELECT coins FROM users WHERE user_id = %s', (user_id,), dict_rows=False)
+            return row[0] if row else 0
+        except Exception as e:
+            logging.error(f"Error getting user coins: {e}")
+            return 0
+
+    async def add_user_coins(self, user_id: int, coins: int) -> bool:
+        """Add coins to user's balance"""
+        try:
+            rowcount = await self._execute('''
+                UPDATE users
+                SET coins = coins + %s
+                WHERE user_id = %s
+            ''', (coins, user_id))
+            return rowcount > 0
+        except Exception as e:
+            logging.error(f"Error adding user coins: {e}")
+            return False
+
+    async def deduct_user_coins(self, user_id: int, coins: int) -> bool:
+        """Deduct coins from user's balance"""
+        try:
+            rowcount = await self._execute('''
+                UPDATE users
+                SET coins = coins - %s
+                WHERE user_id = %s AND coins >= %s
+            ''', (coins, user_id, coins))
+            return rowcount > 0
+        except Exception as e:
+            logging.error(f"Error deducting user coins: {e}")
+            return False
+
+    async def add_payment_request(self, user_id: int, package_name: str, coins_amount: int, price: float, screenshot_file_id: str) -> int:
+        """Add a new payment request"""
+        try:
+            row = await self._fetchone('''
+                INSERT INTO payments (user_id, package_name, coins_amount, price, screenshot_file_id)
+                VALUES (%s, %s, %s, %s, %s)
+                RETURNING id
+            ''', (user_id, package_name, coins_amount, price, screenshot_file_id), dict_rows=False)
+            return row[0]
+        except Exception as e:
+            logging.error(f"Error adding payment request: {e}")
+            return -1
+
+    async def get_payment_request(self, payment_id: int) -> Optional[Dict[str, Any]]:
+        """Get payment request by ID"""
+        try:
+            return await self._fetchone('''
+                SELECT p.*, u.first_name, u.username
+                FROM payments p
+                LEFT JOIN users u ON p.user_id = u.user_id
+                WHERE p.id = %s
+            ''', (payment_id,))
+        except Exception as e:
+            logging.error(f"Error getting payment request: {e}")
+            return None
+
+    async def update_payment_status(self, payment_id: int, status: str, admin_id: int, notes: str = None) -> bool:
+        """Update payment status (approve/reject)"""
+        try:
+            rowcount = await self._execute('''
+                UPDATE payments
+                SET status = %s, processed_at = CURRENT_TIMESTAMP, processed_by = %s, admin_notes = %s
+                WHERE id = %s
+            ''', (status, admin_id, notes, payment_id))
+            return rowcount > 0
+        except Exception as e:
+            logging.error(f"Error updating payment status: {e}")
+            return False
+
+    async def get_pending_payments(self) -> List[Dict[str, Any]]:
+        """Get all pending payment requests"""
+        try:
+            return await self._fetchall('''
+                SELECT p.*, u.first_name, u.username
+                FROM payments p
+                LEFT JOIN users u ON p.user_id = u.user_id
+                WHERE p.status = 'pending'
+                ORDER BY p.created_at DESC
+            ''')
+        except Exception as e:
+            logging.error(f"Error getting pending payments: {e}")
+            return []
+
+    async def update_user_profile(self, user_id: int, **kwargs):
+        """Update user profile with any provided fields"""
+        if not kwargs:
+            return False
+
+        try:
+            # Build the SET clause dynamically based on provided kwargs
+            set_parts = []
+            values = []
+
+            for key, value in kwargs.items():
+                set_parts.append(f"{key} = %s")
+                values.append(value)
+
+            values.append(user_id)
+            set_clause = ", ".join(set_parts)
+
+            await self._execute(f"""
+                UPDATE users SET {set_clause}
+                WHERE user_id = %s
+            """, tuple(values))
+            logging.info(f"✅ Updated user {user_id} profile with: {kwargs}")
+            return True
+
+        except Exception as e:
+            logging.error(f"❌ Error updating user profile: {e}")
+            return False
+
+    async def kv_get(self, key: str) -> Optional[str]:
+        """Get a stored value (None when missing or expired)"""
+        try:
+            row = await self._fetchone(KV_GET_QUERY, (key,), dict_rows=False)
+            return row[0] if row else None
+        except Exception as e:
+            logging.error(f"Error reading key {key}: {e}")
+            return None
+
+    async def kv_set(self, key: str, value: str, ttl: int = None) -> bool:
+        """Store a value, expiring after ``ttl`` seconds (never when None)"""
+        try:
+            await self._execute(KV_SET_QUERY, (key, value, ttl))
+            return True
+        except Exception as e:
+            logging.error(f"Error writing key {key}: {e}")
+            return False
+
+    async def kv_delete(self, key: str) -> bool:
+        """Remove a stored value"""
+        try:
+            await self._execute(KV_DELETE_QUERY, (key,))
+            return True
+        except Exception as e:
+            logging.error(f"Error deleting key {key}: {e}")
+            return False
+
+    async def kv_purge_expired(self) -> int:
+        """Delete expired values; returns how many were removed"""
+        try:
+            return await self._execute(KV_PURGE_QUERY)
+        except Exception as e:
+            logging.error(f"Error purging expired keys: {e}")
+            return 0
+
+    async def record_skips(self, pairs: List[Tuple[int, int]]) -> int:
+        """Record (user_id, skipped_user_id) pairs in one statement; returns rows written"""
+        if not pairs:
+            return 0
+        try:
+            user_ids, target_ids = zip(*pairs)
+            return await self._execute(RECORD_SKIPS_QUERY, (list(user_ids), list(target_ids)))
+        except Exception as e:
+            logging.error(f"Error recording skips: {e}")
+            return 0
+
+    async def add_like_and_match(self, user_id: int, liked_user_id: int) -> Tuple[bool, bool]:
+        """Add a like; returns (added, mutual) (see Database.add_like_and_match)"""
+        try:
+            added, mutual = await self._fetchone(ADD_LIKE_AND_MATCH_QUERY, (user_id, liked_user_id), dict_rows=False)
+            return added, mutual
+        except Exception as e:
+            logging.error(f"Error adding like: {e}")
+            return False, False
+
+    async def has_liked(self, user_id: int, liked_user_id: int) -> bool:
+        """Whether user_id has liked liked_user_id"""
+        try:
+            return await self._fetchone(HAS_LIKED_QUERY, (user_id, liked_user_id), dict_rows=False) is not None
+        except Exception as e:
+            logging.error(f"Error checking like: {e}")
+            return False
+
+    async def record_likes(self, pairs: List[Tuple[int, int]]) -> Optional[int]:
+        """Insert (user_id, liked_user_id) pairs; returns rows inserted, None on failure"""
+        if not pairs:
+            return 0
+        try:
+            inserted = 0
+            for part in split_like_batch(pairs):
+                user_ids, liked_ids = zip(*part)
+                inserted += await self._execute(RECORD_LIKES_QUERY, (list(user_ids), list(liked_ids)))
+            return inserted
+        except Exception as e:
+            logging.error(f"Error recording likes: {e}")
+            return None
+
+    async def purge_swipes(self) -> int:
+        """Delete skips older than the re-show cooldown; returns how many were removed"""
+        try:
+            return await self._execute(PURGE_SWIPES_QUERY, (skip_cooldown_seconds(),))
+        except Exception as e:
+            logging.error(f"Error purging swipes: {e}")
+            return 0
+
+    async def claim_update(self, update_id: int) -> bool:
+        """Record an update as handled; False if it already was (a redelivery)"""
+        try:
+            return await self._execute(CLAIM_UPDATE_QUERY, (update_id,)) == 1
+        except Exception as e:
+            # Better to risk a repeat than to drop a first delivery
+            logging.error(f"Error claiming update: {e}")
+            return True
+
+    async def release_update(self, update_id: int) -> bool:
+        """Forget a claimed update whose handler failed, so a redelivery runs it again"""
+        try:
+            await self._execute(RELEASE_UPDATE_QUERY, (update_id,))
+            return True
+        except Exception as e:
+            logging.error(f"Error releasing update: {e}")
+            return False
+
+    async def purge_processed_updates(self) -> int:
+        """Delete handled-update records past the redelivery window; returns how many were removed"""
+        try:
+            return await self._execute(PURGE_PROCESSED_UPDATES_QUERY, (config.PROCESSED_UPDATES_TTL,))
+        except Exception as e:
+            logging.error(f"Error purging processed updates: {e}")
+            return 0
+
+
+class ThreadedDatabase:
+    """Executor-backed proxy around the synchronous ``database.Database``.
+
+    Every public method of the wrapped instance is exposed as a coroutine
+    that runs on a bounded ``ThreadPoolExecutor``. Each worker thread uses
+    its own connection from a psycopg2 ``ThreadedConnectionPool``, so
+    queries overlap without touching the SQL.
+    """
+
+    def __init__(self, sync_db, max_workers: int = None, timeout: float = None):
+        self.sync_db = sync_db
+        self.max_workers = max_workers or config.DB_THREAD_POOL_SIZE
+        self.timeout = timeout if timeout is not None else config.DB_QUERY_TIMEOUT
+        self.executor = None
+
+    async def connect(self):
+        """Start the worker threads and their connection pool"""
+        if self.executor is not None:
+            return
+        self.sync_db.enable_pool(1, self.max_workers, statement_timeout=self.timeout)
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="db")
+        logging.info(f"✅ Database thread executor ready ({self.max_workers} workers)")
+
+    async def close(self):
+        """Wait for running queries, then release the threads and connections"""
+        if self.executor is None:
+            return
+        executor, self.executor = self.executor, None
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, functools.partial(executor.shutdown, wait=True))
+        self.sync_db.close_pool()
+
+    def __getattr__(self, name):
+        attr = getattr(self.sync_db, name)
+        if name.startswith('_') or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def call(*args, **kwargs):
+            if self.executor is None:
+                await self.connect()
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, functools.partial(attr, *args, **kwargs))
+
+        return call
+
+
+class ProfileCache(TTLCache):
+    """TTL cache dropping the least recently used entry when full, counting evictions"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.evictions = 0
+
+    def popitem(self):
+        # Only called to make room: expired entries are dropped by expire()
+        self.evictions += 1
+        return super().popitem()
+
+
+class CachedDatabase:
+    """Read-through cache of user rows in front of an awaitable backend.
+
+    ``get_user`` (and so ``get_user_language``) runs at the top of nearly
+    every handler. Rows are kept in a bounded LRU + TTL cache, and every method
+    in ``USER_WRITES`` drops the user's entry once it has run. Likes drop
+    both users' entries, since the triggers change their counters. Writes made
+    by other processes show up within ``ttl`` seconds. Candidate pages and
+    ``get_users_by_ids`` fill the same cache, so browsing sessions keep only
+    ids and look the rows up as they are shown. Everything else is passed
+    straight through to the backend.
+    """
+
+    # Methods that change the row of the user id passed as first argument
+    USER_WRITES = frozenset({
+        'add_user',
+        'update_user_profile',
+        'update_user_language',
+        'add_user_coins',
+        'deduct_user_coins',
+        'delete_user_account',
+    })
+    # Methods that change the like/match counters of the two users passed first
+    PAIR_WRITES = frozenset({
+        'add_like',
+        'add_like_and_match',
+    })
+
+    def __init__(self, backend, maxsize: int = None, ttl: float = None):
+        self.backend = backend
+        self.users = ProfileCache(
+            maxsize=maxsize or config.USER_CACHE_SIZE,
+            ttl=ttl if ttl is not None else config.USER_CACHE_TTL,
+        )
+        # Bumped on every invalidation so a read racing a write isn't cached
+        self.invalidations = 0
+        self.hits = 0
+        self.misses = 0
+
+    async def get_user(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """Get user data by user_id"""
+        try:
+            user = self.users[user_id]
+            self.hits += 1
+        except KeyError:
+            self.misses += 1
+            invalidations = self.invalidations
+            user = await self.backend.get_user(user_id)
+            # None is also what a failed query returns: only rows are cached
+            if user is not None and invalidations == self.invalidations:
+                self.users[user_id] = user
+        # Handlers may modify the row they get back
+        return dict(user) if user is not None else None
+
+    async def get_users_by_ids(self, user_ids: List[int]) -> List[Dict[str, Any]]:
+        """Get active users by id, in the given order, querying only uncached ones"""
+        found = {}
+        missing = []
+        for user_id in user_ids:
+            try:
+                found[user_id] = self.users[user_id]
+            except KeyError:
+                missing.append(user_id)
+        self.hits += len(user_ids) - len(missing)
+        self.misses += len(missing)
+        if missing:
+            invalidations = self.invalidations
+            rows = await self.backend.get_users_by_ids(missing)
+            self.remember_users(rows, invalidations)
+            found.update((row['user_id'], row) for row in rows)
+        return [dict(found[user_id]) for user_id in user_ids
+                if found.get(user_id) and found[user_id].get('is_active')]
+
+    async def get_candidate_page(self, *args, **kwargs):
+        """Candidate pages are full user rows: keep them for showing the profiles"""
+        invalidations = self.invalidations
+        profiles, next_cursor = await self.backend.get_candidate_page(*args, **kwargs)
+        self.remember_users(profiles, invalidations)
+        return profiles, next_cursor
+
+    async def get_nearby_candidates(self, *args, **kwargs):
+        """Same as get_candidate_page, for nearby pages"""
+        invalidations = self.invalidations
+        profiles, next_cursor = await self.backend.get_nearby_candidates(*args, **kwargs)
+        self.remember_users(profiles, invalidations)
+        return profiles, next_cursor
+
+    async def record_likes(self, pairs: List[Tuple[int, int]]) -> Optional[int]:
+        """Insert like pairs, then forget both users of each pair"""
+        try:
+            return await self.backend.record_likes(pairs)
+        finally:
+            for user_id, liked_user_id in pairs:
+                self.invalidate_user(user_id)
+                self.invalidate_user(liked_user_id)
+
+    async def reconcile_counters(self) -> int:
+        """Rebuild the counters, then forget every cached row"""
+        try:
+            return await self.backend.reconcile_counters()
+        finally:
+            self.invalidations += 1
+            # Not users.clear(): it goes through popitem() and would count evictions
+            for user_id in list(self.users):
+                self.users.pop(user_id, None)
+
+    def remember_users(self, rows: List[Dict[str, Any]], invalidations: int):
+        """Cache rows read while no user was invalidated"""
+        if invalidations == self.invalidations:
+            for row in rows:
+                self.users[row['user_id']] = row
+
+    def invalidate_user(self, user_id: int):
+        """Forget the cached row of a user"""
+        self.invalidations += 1
+        self.users.pop(user_id, None)
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Counters for monitoring the user cache"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self.users),
+            'maxsize': self.users.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.users.evictions,
+            'invalidations': self.invalidations,
+        }
+
+    def __getattr__(self, name):
+        attr = getattr(self.backend, name)
+        if name in self.PAIR_WRITES:
+            @functools.wraps(attr)
+            async def pair_write(user_id, other_user_id, *args, **kwargs):
+                try:
+                    return await attr(user_id, other_user_id, *args, **kwargs)
+                finally:
+                    self.invalidate_user(user_id)
+                    self.invalidate_user(other_user_id)
+
+            return pair_write
+        if name not in self.USER_WRITES:
+            return attr
+
+        @functools.wraps(attr)
+        async def write(user_id, *args, **kwargs):
+            try:
+                return await attr(user_id, *args, **kwargs)
+            finally:
+                self.invalidate_user(user_id)
+
+        return write
+
+
+def create_database():
+    """Build the awaitable backend selected by ``config.DB_BACKEND``"""
+    if config.DB_BACKEND == 'threaded':
+        # The schema is migrated by db.connect() in BotManager.on_startup
+        from database import db as sync_db
+        backend = ThreadedDatabase(sync_db)
+    else:
+        backend = AsyncDatabase()
+    if config.USER_CACHE_SIZE > 0:
+        backend = CachedDatabase(backend)
+    return backend
+
+
+db = create_database()
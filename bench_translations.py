@@ -0,0 +1,28 @@
+import sys
+import os
+import timeit
+
+# Add current directory to Python path
+sys.path.append(os.path.dirname(__file__))
+
+from utils.translations import TRANSLATIONS, build_catalog, get_text
+
+CALLS = 200_000
+
+def per_call(statement, number=CALLS):
+    """Average cost of one call in microseconds"""
+    return timeit.timeit(statement, number=number) / number * 1_000_000
+
+cases = {
+    "plain key": lambda: get_text('like_sent', 'amharic'),
+    "formatted key": lambda: get_text('welcome_back', 'oromo', first_name='Abebe'),
+    "missing language": lambda: get_text('like_sent', 'french'),
+    "missing key": lambda: get_text('no_such_key', 'english'),
+}
+
+print("Benchmarking get_text...")
+for name, call in cases.items():
+    print(f"⏱️ {name}: {per_call(call):.3f} µs/call")
+
+# Paid once at import
+print(f"📚 Building the catalog: {per_call(lambda: build_catalog(TRANSLATIONS), 200):.1f} µs")
@@ -1,13 +1,23 @@
 import asyncio
 import logging
-import time
+import signal
 import sys
 from aiogram import Bot, Dispatcher
-from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler
 from aiohttp import web
 
 from config import config
-from database import db
+import database
+from async_database import db
+from front import FrontDispatcher
+from polling import PollingRunner
+from middlewares.dedup import once_middleware, update_dedup
+from middlewares.serial import user_serial
+from middlewares.user import UserMiddleware
+from storage import KVStorage, kv_store
+from utils.matching_index import matching_index
+from utils.send_queue import send_queue
+from utils.swipes import swipe_buffer
 
 # Import handlers
 from handlers.start import router as start_router
@@ -22,127 +32,272 @@ logging.basicConfig(
 )
 
 class BotManager:
+    """Runs the bot until told to stop, then shuts it down in order.
+
+    Stopping: no new updates are taken, the updates in progress finish (up
+    to ``SHUTDOWN_DRAIN_TIMEOUT``), buffered likes and skips are written,
+    queued messages go out, and only then are the pools closed. The
+    webhook stays set, so Telegram keeps updates for the next start.
+    Background jobs that fail are restarted on their own; the bot keeps
+    serving meanwhile.
+    """
     def __init__(self):
-        self.max_restarts = 10
-        self.restart_delay = 5  # seconds
-        self.restart_count = 0
-        self.last_restart = 0
+        self.restart_delay = 5  # seconds before a failed component is started again
+        self.background_tasks = []
+        # Set when running as one of several workers behind the front dispatcher
+        self.worker_index = config.WORKER_INDEX if config.WORKER_INDEX >= 0 else None
         
     async def on_startup(self, bot: Bot):
         """Actions to perform on bot startup"""
-        print("🤖 Ethiopia Connect Bot Starting with Webhook...")
+        if self.worker_index is None:
+            print("🤖 Ethiopia Connect Bot Starting with Webhook...")
+        else:
+            print(f"🤖 Ethiopia Connect Bot worker {self.worker_index} starting...")
         print("📊 Database initialized:", config.DB_NAME)
         
+        # Migrate the schema, then open the async connection pool used by the
+        # handlers (waiting out a database restart)
+        while True:
+            try:
+                database.db.connect()
+                await db.connect()
+                break
+            except Exception as e:
+                logging.error(f"Error connecting to the database, retrying in {self.restart_delay}s: {e}")
+                await asyncio.sleep(self.restart_delay)
+        
+        # Start delivering queued outbound messages
+        send_queue.start(bot)
+        
+        # Build the in-memory candidate index and keep it fresh
+        if config.MATCHING_INDEX_ENABLED:
+            await matching_index.load()
+            self.supervise("matching index refresh", matching_index.refresh_forever)
+        
+        # Write likes and skips in batches
+        self.supervise("swipe buffer", swipe_buffer.flush_forever)
+        
+        # Database-wide upkeep runs in a single process
+        if not self.worker_index:
+            # Correct any drift in the trigger-maintained like/match counters
+            self.supervise("counter reconciliation", self.reconcile_counters_forever)
+            
+            # Drop expired FSM state, browsing sessions and skips
+            self.supervise("kv store purge", self.purge_kv_store_forever)
+        
+        # The front dispatcher owns the webhook
+        if self.worker_index is not None:
+            return
+        
+        if config.BOT_MODE == 'polling':
+            # getUpdates is refused while a webhook is set
+            await bot.delete_webhook()
+            print("✅ Webhook removed, polling for updates")
+            return
+        
         # Set webhook
         webhook_url = f"{config.WEBHOOK_URL}{config.WEBHOOK_PATH}"
         await bot.set_webhook(
             url=webhook_url,
-            drop_pending_updates=True
+            drop_pending_updates=False  # updates sent while we were down are still wanted
         )
         print(f"✅ Webhook set to: {webhook_url}")
         
     async def on_shutdown(self, bot: Bot):
         """Actions to perform on bot shutdown"""
         print("🛑 Bot is shutting down...")
-        await bot.delete_webhook()
-        print("✅ Webhook deleted")
         
-    async def setup_bot(self):
-        """Setup bot with webhook configuration"""
-        try:
-            # Initialize bot and dispatcher
-            bot = Bot(token=config.BOT_TOKEN)
-            dp = Dispatcher()
-            
-            # Register startup and shutdown handlers
-            dp.startup.register(self.on_startup)
-            dp.shutdown.register(self.on_shutdown)
-            
-            # Include routers
-            print("🔄 Loading routers...")
-            dp.include_router(start_router)
-            dp.include_router(profile_router)
-            dp.include_router(matching_router)
-            dp.include_router(commands_router)
-            print("✅ All routers loaded!")
-            
-            # Create aiohttp application
-            app = web.Application()
-            webhook_requests_handler = SimpleRequestHandler(
-                dispatcher=dp,
-                bot=bot,
-            )
-            
-            # Register webhook handler
-            webhook_requests_handler.register(app, path=config.WEBHOOK_PATH)
-            setup_application(app, dp, bot=bot)
-            
-            return app, bot
-            
-        except Exception as e:
-            print(f"❌ Bot setup failed: {e}")
-            logging.error(f"Bot setup error: {e}", exc_info=True)
-            raise
+        # Let a flush in progress finish before its task is cancelled
+        async with swipe_buffer.lock:
+            for task in self.background_tasks:
+                task.cancel()
+            await asyncio.gather(*self.background_tasks, return_exceptions=True)
+        self.background_tasks = []
+        
+        # Write the likes and skips still waiting in the buffer
+        await swipe_buffer.flush()
+        
+        # Let queued messages go out before closing the session
+        await send_queue.stop()
+        print("✅ Send queue drained")
+        
+        await kv_store.close()
+        
+        if hasattr(db, 'cache_stats'):
+            logging.info(f"📊 User cache: {db.cache_stats()}")
+        logging.info(f"📊 Update queues: {user_serial.stats()}")
+        logging.info(f"📊 Repeated updates dropped: {update_dedup.duplicates} "
+                     f"(+{once_middleware.duplicates} by once-only handlers)")
+        await db.close()
+        print("✅ Database pool closed")
+        
+    def supervise(self, name: str, run_forever):
+        """Run a background job, starting it again whenever it fails"""
+        async def supervisor():
+            while True:
+                try:
+                    await run_forever()
+                    return
+                except Exception as e:
+                    logging.error(f"❌ {name} failed, restarting in {self.restart_delay}s: {e}", exc_info=True)
+                    await asyncio.sleep(self.restart_delay)
+        self.background_tasks.append(asyncio.create_task(supervisor(), name=name))
+        
+    async def reconcile_counters_forever(self):
+        """Periodically rebuild like/match counters from the likes table"""
+        while True:
+            await asyncio.sleep(config.COUNTER_RECONCILE_SECONDS)
+            fixed = await db.reconcile_counters()
+            if fixed:
+                logging.warning(f"⚠️ Reconciled like/match counters for {fixed} users")
+        
+    async def purge_kv_store_forever(self):
+        """Periodically delete expired key-value entries, skips past their cooldown and old handled updates"""
+        while True:
+            await asyncio.sleep(config.KV_PURGE_SECONDS)
+            try:
+                await kv_store.purge_expired()
+            except Exception as e:
+                logging.error(f"Error purging key-value store: {e}")
+            await db.purge_swipes()
+            await db.purge_processed_updates()
+        
+    def create_dispatcher(self):
+        """Bot and dispatcher with the middlewares and routers, for either update source"""
+        # Initialize bot and dispatcher
+        bot = Bot(token=config.BOT_TOKEN)
+        # FSM state lives in the shared key-value store (survives restarts)
+        dp = Dispatcher(storage=KVStorage(kv_store))
+        
+        # Register startup and shutdown handlers
+        dp.startup.register(self.on_startup)
+        dp.shutdown.register(self.on_shutdown)
+        
+        # Drop redelivered updates, then handle one update at a time per
+        # user, ahead of the FSM middleware so each update sees the state
+        # the previous one left
+        dp.update.outer_middleware.unregister(dp.fsm)
+        dp.update.outer_middleware(update_dedup)
+        dp.update.outer_middleware(user_serial)
+        dp.update.outer_middleware(dp.fsm)
+        user_serial.fsm = dp.fsm
+        
+        # Handlers flagged @flags.once record their update before running
+        dp.message.middleware(once_middleware)
+        dp.callback_query.middleware(once_middleware)
+        
+        # Load the sender's user row once per handled message/callback
+        dp.message.middleware(UserMiddleware())
+        dp.callback_query.middleware(UserMiddleware())
+        
+        # Include routers
+        print("🔄 Loading routers...")
+        dp.include_router(start_router)
+        dp.include_router(profile_router)
+        dp.include_router(matching_router)
+        dp.include_router(commands_router)
+        print("✅ All routers loaded!")
+        return bot, dp
+        
+    def create_webhook_app(self, bot: Bot, dp: Dispatcher, stop: asyncio.Event) -> web.Application:
+        """aiohttp application feeding webhook calls to the dispatcher"""
+        @web.middleware
+        async def refuse_when_stopping(request: web.Request, handler):
+            # Kept-alive connections outlive the listening socket: send those
+            # updates back to Telegram, which retries them after the restart
+            if stop.is_set():
+                return web.Response(status=503)
+            return await handler(request)
+        
+        app = web.Application(middlewares=[refuse_when_stopping])
+        webhook_requests_handler = SimpleRequestHandler(
+            dispatcher=dp,
+            bot=bot,
+        )
+        
+        # Register webhook handler
+        webhook_requests_handler.register(app, path=config.WEBHOOK_PATH)
+        return app
             
-    async def run_webhook(self):
-        """Run the bot with webhook"""
+    async def run_webhook(self, stop: asyncio.Event):
+        """Run the bot with webhook until ``stop`` is set"""
+        bot, dp = self.create_dispatcher()
+        await dp.emit_startup(bot=bot)
+        
+        # Start web server
+        runner = web.AppRunner(self.create_webhook_app(bot, dp, stop))
+        await runner.setup()
+        
+        # Workers only take updates from the front dispatcher
+        if self.worker_index is None:
+            host, port = config.WEBAPP_HOST, config.WEBAPP_PORT
+        else:
+            host, port = '127.0.0.1', config.WORKER_BASE_PORT + self.worker_index
+        site = web.TCPSite(
+            runner, 
+            host=host, 
+            port=port
+        )
+        
+        await site.start()
+        print(f"🚀 Webhook server started on {host}:{port}")
+        print("📝 Bot is ready to receive updates via webhook!")
+        
         try:
-            app, bot = await self.setup_bot()
+            await stop.wait()
+        finally:
+            # Refuse new connections (Telegram retries them), then finish what was accepted
+            await site.stop()
+            await user_serial.drain(config.SHUTDOWN_DRAIN_TIMEOUT)
+            await dp.emit_shutdown(bot=bot)
+            await runner.cleanup()
+            await bot.session.close()
             
-            # Start web server
-            runner = web.AppRunner(app)
-            await runner.setup()
-            
-            site = web.TCPSite(
-                runner, 
-                host=config.WEBAPP_HOST, 
-                port=config.WEBAPP_PORT
-            )
-            
-            await site.start()
-            print(f"🚀 Webhook server started on {config.WEBAPP_HOST}:{config.WEBAPP_PORT}")
-            print("📝 Bot is ready to receive updates via webhook!")
-            
-            # Run forever
-            await asyncio.Future()  # run forever
-            
-        except KeyboardInterrupt:
-            print("⏹️ Bot stopped by user")
-            return False
-        except Exception as e:
-            print(f"❌ Webhook bot crashed with error: {e}")
-            logging.error(f"Webhook bot crash: {e}", exc_info=True)
-            return True
-            
-    async def start_with_restart(self):
-        """Main loop with auto-restart capability"""
-        while self.restart_count < self.max_restarts:
-            current_time = time.time()
-            
-            # Rate limiting for restarts
-            if current_time - self.last_restart < self.restart_delay:
-                await asyncio.sleep(self.restart_delay)
-                
-            self.last_restart = current_time
-            self.restart_count += 1
-            
-            print(f"🔄 Attempt {self.restart_count}/{self.max_restarts} to start bot...")
-            
-            should_restart = await self.run_webhook()
+    async def run_polling(self, stop: asyncio.Event):
+        """Run the bot with long polling (for hosts without inbound HTTPS) until ``stop`` is set"""
+        bot, dp = self.create_dispatcher()
+        runner = PollingRunner(dp, bot)
+        await dp.emit_startup(bot=bot)
+        print(f"🚀 Polling started ({runner.batch_size} updates per batch, "
+              f"{runner.concurrency} handled at once)")
+        
+        polling = asyncio.create_task(runner.run())
+        stopping = asyncio.create_task(stop.wait())
+        try:
+            # A failure of the polling loop itself (e.g. a revoked token) ends the run
+            await asyncio.wait([polling, stopping], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            stopping.cancel()
+            polling.cancel()
+            await asyncio.gather(polling, return_exceptions=True)
+            # Finish the updates in hand before the shutdown hooks close the pools
+            await runner.stop()
+            await dp.emit_shutdown(bot=bot)
+            await bot.session.close()
+        if not polling.cancelled() and polling.exception():
+            raise polling.exception()
             
-            if not should_restart:
-                break  # Exit loop if we shouldn't restart
-                
-            if self.restart_count < self.max_restarts:
-                print(f"⏰ Restarting in {self.restart_delay} seconds...")
-                await asyncio.sleep(self.restart_delay)
-            else:
-                print("🚫 Maximum restart attempts reached. Giving up.")
-                break
+    async def run(self, stop: asyncio.Event):
+        """Serve updates from the configured source until ``stop`` is set"""
+        if config.BOT_MODE == 'polling':
+            await self.run_polling(stop)
+        else:
+            await self.run_webhook(stop)
+        print("✅ Bot stopped cleanly")
 
 async def main():
+    # SIGTERM (deploys, the front dispatcher) and Ctrl+C both shut down in order
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+    
+    if config.BOT_MODE != 'polling' and config.WEBHOOK_WORKERS > 1 and config.WORKER_INDEX < 0:
+        # Route updates to worker processes by user
+        await FrontDispatcher().run(stop)
+        return
     bot_manager = BotManager()
-    await bot_manager.start_with_restart()
+    await bot_manager.run(stop)
 
 if __name__ == "__main__":
     try:
@@ -17,16 +17,83 @@ class Config:
     DB_USER = os.getenv('DB_USER', 'root')
     DB_PASSWORD = os.getenv('DB_PASSWORD', '*@#$')
     DB_PORT = os.getenv('DB_PORT', '5432')
-    
+    # Awaitable database backend used by the handlers:
+    # 'async' (aiopg pool) or 'threaded' (psycopg2 on a thread pool)
+    DB_BACKEND = os.getenv('DB_BACKEND', 'async')
+    DB_THREAD_POOL_SIZE = int(os.getenv('DB_THREAD_POOL_SIZE', 8))
+    DB_POOL_MIN_SIZE = int(os.getenv('DB_POOL_MIN_SIZE', 1))
+    DB_POOL_MAX_SIZE = int(os.getenv('DB_POOL_MAX_SIZE', 10))
+    DB_QUERY_TIMEOUT = float(os.getenv('DB_QUERY_TIMEOUT', 10))  # seconds per query
+    # Cached user rows (0 disables the cache)
+    USER_CACHE_SIZE = int(os.getenv('USER_CACHE_SIZE', 10000))
+    USER_CACHE_TTL = float(os.getenv('USER_CACHE_TTL', 60))  # seconds
+    # Updates of one user are handled one at a time; more than this many waiting are dropped
+    USER_QUEUE_DEPTH = int(os.getenv('USER_QUEUE_DEPTH', 5))
+    # ...except messages of a user in a conversation (an album sent while registering)
+    USER_FSM_QUEUE_DEPTH = int(os.getenv('USER_FSM_QUEUE_DEPTH', 30))
+    # Repeated deliveries of an update are dropped: recent ids are kept in memory,
+    # and handlers flagged @flags.once record theirs in the database
+    RECENT_UPDATES_SIZE = int(os.getenv('RECENT_UPDATES_SIZE', 10000))
+    PROCESSED_UPDATES_TTL = int(os.getenv('PROCESSED_UPDATES_TTL', 48 * 3600))  # seconds, past Telegram's retries
+
     # Bot settings
     MAX_PHOTOS: int = 5
     MIN_AGE: int = 18
     MAX_AGE: int = 100
+    MATCH_PAGE_SIZE: int = 20  # Candidates fetched per page while browsing
+    LIKES_PAGE_SIZE = int(os.getenv('LIKES_PAGE_SIZE', 5))  # Profiles per page of /matches and /likes
+    # Fixes every random candidate order (browsing passes, index shuffle), e.g. for tests
+    MATCH_RANDOM_SEED = os.getenv('MATCH_RANDOM_SEED')
+    # In-memory candidate index (utils/matching_index.py)
+    MATCHING_INDEX_ENABLED = os.getenv('MATCHING_INDEX_ENABLED', 'true').lower() == 'true'
+    MATCHING_INDEX_REFRESH_SECONDS = int(os.getenv('MATCHING_INDEX_REFRESH_SECONDS', 300))
+    MATCHING_INDEX_MAX_USERS = int(os.getenv('MATCHING_INDEX_MAX_USERS', 50000))  # cached exclusion lists
+    # Users who shared a location see profiles within GEO_RADIUS_KM first, nearest first
+    GEO_MATCHING_ENABLED = os.getenv('GEO_MATCHING_ENABLED', 'true').lower() == 'true'
+    GEO_RADIUS_KM = float(os.getenv('GEO_RADIUS_KM', 50))
+    GEO_CELL_KM = float(os.getenv('GEO_CELL_KM', 5))  # Grid cell size of the matching index
+    # Skipped profiles stay out of a user's candidates this long (0: show again right away)
+    SKIP_COOLDOWN_HOURS = float(os.getenv('SKIP_COOLDOWN_HOURS', 72))
+    # Likes and skips (utils/swipes.py): 'buffered' (batched write-behind) or 'immediate' (written per click)
+    SWIPE_WRITE_MODE = os.getenv('SWIPE_WRITE_MODE', 'buffered')
+    SWIPE_FLUSH_SECONDS = float(os.getenv('SWIPE_FLUSH_SECONDS', 2))  # Buffered likes/skips are written this often
+    SWIPE_FLUSH_ROWS = int(os.getenv('SWIPE_FLUSH_ROWS', 500))  # ...or as soon as this many are waiting
+    MATCHING_EXCLUSIONS_TTL = int(os.getenv('MATCHING_EXCLUSIONS_TTL', 3600))  # seconds before reloading a user's exclusions
+    # Seconds a stopping bot waits for the updates in progress
+    SHUTDOWN_DRAIN_TIMEOUT = float(os.getenv('SHUTDOWN_DRAIN_TIMEOUT', 30))
+    COUNTER_RECONCILE_SECONDS = int(os.getenv('COUNTER_RECONCILE_SECONDS', 3600))  # like/match counter rebuild
+    # Outbound send queue (utils/send_queue.py); Telegram allows ~30 msg/s overall, ~1 msg/s per chat
+    SEND_WORKERS = int(os.getenv('SEND_WORKERS', 8))
+    SEND_GLOBAL_RATE = float(os.getenv('SEND_GLOBAL_RATE', 25))
+    SEND_CHAT_RATE = float(os.getenv('SEND_CHAT_RATE', 1))
+    SEND_CHAT_BURST = int(os.getenv('SEND_CHAT_BURST', 3))
+    SEND_MAX_RETRIES = int(os.getenv('SEND_MAX_RETRIES', 3))
+    SEND_MAX_IDLE_CHATS = 10000  # Per-chat buckets kept before idle ones are dropped
+    # FSM state and browsing sessions (storage.py): 'postgres', 'memory' or 'redis'
+    KV_BACKEND = os.getenv('KV_BACKEND', 'postgres')
+    REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+    KV_MEMORY_MAX_KEYS = int(os.getenv('KV_MEMORY_MAX_KEYS', 100000))
+    FSM_TTL = int(os.getenv('FSM_TTL', 7 * 24 * 3600))  # seconds an unfinished dialog is kept
+    SESSION_TTL = int(os.getenv('SESSION_TTL', 24 * 3600))  # seconds a browsing session is kept
+    KV_PURGE_SECONDS = int(os.getenv('KV_PURGE_SECONDS', 600))
     # In config.py for development
     WEBHOOK_URL = "https://dating-bot-lz3t.onrender.com"  # Get from: ngrok http 8080
     WEBHOOK_PATH = "/webhook"
     WEBAPP_HOST = "0.0.0.0"
     WEBAPP_PORT = 8080
+    # Where updates come from: 'webhook' (needs a public HTTPS URL) or 'polling' (polling.py)
+    BOT_MODE = os.getenv('BOT_MODE', 'webhook')
+    POLLING_BATCH_SIZE = int(os.getenv('POLLING_BATCH_SIZE', 100))  # getUpdates limit, 1-100
+    POLLING_TIMEOUT = int(os.getenv('POLLING_TIMEOUT', 30))  # seconds Telegram holds getUpdates open
+    POLLING_CONCURRENCY = int(os.getenv('POLLING_CONCURRENCY', 64))  # updates handled at once
+    POLLING_MAX_PENDING_SENDS = int(os.getenv('POLLING_MAX_PENDING_SENDS', 1000))  # pause fetching above
+    # Several processes (front.py): a front process on WEBAPP_PORT routes each
+    # user's updates to one of WEBHOOK_WORKERS workers on WORKER_BASE_PORT + index
+    WEBHOOK_WORKERS = int(os.getenv('WEBHOOK_WORKERS', 1))
+    WORKER_BASE_PORT = int(os.getenv('WORKER_BASE_PORT', 8081))
+    WORKER_INDEX = int(os.getenv('WORKER_INDEX', -1))  # set by the front process; -1: not a worker
+    WORKER_FORWARD_TIMEOUT = float(os.getenv('WORKER_FORWARD_TIMEOUT', 30))  # seconds
+    WORKER_RESTART_DELAY = 5  # seconds before a worker that exited is started again
     # Add to your config.py or at the top of handlers file
     COIN_CONFIG = {
         'message_cost': 2,           # Coins per message
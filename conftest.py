@@ -0,0 +1,2 @@
+# test_handlers.py is a script (python test_handlers.py), not a pytest module
+collect_ignore = ["test_handlers.py"]
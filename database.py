@@ -1,35 +1,438 @@
+import hashlib
 import logging
+import threading
+from datetime import datetime
 import psycopg2
 from psycopg2.extras import RealDictCursor
-from typing import List, Dict, Any, Optional
+from psycopg2.pool import ThreadedConnectionPool
+from typing import List, Dict, Any, Optional, Tuple
 from config import config
+from migrations import migrate
+from utils.geo import EARTH_RADIUS_KM, bounding_box
 import os
 
+# Eligibility of a candidate row ``u`` for the viewer (params: candidate_params)
+CANDIDATE_CONDITIONS = '''
+        AND u.user_id != %s
+        AND u.is_active = TRUE
+        AND NOT EXISTS (
+            SELECT 1 FROM blocks b WHERE b.user_id = %s AND b.blocked_user_id = u.user_id
+        )
+        AND NOT EXISTS (
+            SELECT 1 FROM likes l WHERE l.user_id = %s AND l.liked_user_id = u.user_id
+        )
+        AND NOT EXISTS (
+            SELECT 1 FROM swipes s WHERE s.user_id = %s AND s.target_user_id = u.user_id
+            AND s.swiped_at > NOW() - %s * INTERVAL '1 second'
+        )
+        AND u.photos IS NOT NULL
+        AND u.bio IS NOT NULL
+        AND u.photos != '[]'
+        AND u.bio != ''
+'''
+
+def candidate_params(user_id: int) -> list:
+    """Params of CANDIDATE_CONDITIONS"""
+    return [user_id, user_id, user_id, user_id, skip_cooldown_seconds()]
+
+def skip_cooldown_seconds() -> float:
+    """How long a skipped profile stays out of the user's candidates"""
+    return config.SKIP_COOLDOWN_HOURS * 3600
+
+# Haversine distance in km from a point to the row's location (params: lat, lat, lon)
+DISTANCE_KM_SQL = f'''
+    {EARTH_RADIUS_KM} * 2 * ASIN(LEAST(1, SQRT(
+        POWER(SIN(RADIANS(u.latitude - %s) / 2), 2)
+        + COS(RADIANS(%s)) * COS(RADIANS(u.latitude)) * POWER(SIN(RADIANS(u.longitude - %s) / 2), 2)
+    )))
+'''
+
+def build_preference_conditions(preferences: dict = None):
+    """SQL conditions (and their params) for a viewer's matching preferences.
+
+    ``preferences`` holds min_age/max_age and lists of lowercased religions
+    and cities; missing or empty entries don't filter.
+    """
+    conditions, params = [], []
+    if preferences:
+        if preferences.get('min_age'):
+            conditions.append("AND u.age >= %s")
+            params.append(preferences['min_age'])
+        if preferences.get('max_age'):
+            conditions.append("AND u.age <= %s")
+            params.append(preferences['max_age'])
+        if preferences.get('religions'):
+            conditions.append("AND LOWER(TRIM(u.religion)) = ANY(%s)")
+            params.append(list(preferences['religions']))
+        if preferences.get('cities'):
+            conditions.append("AND LOWER(TRIM(u.city)) = ANY(%s)")
+            params.append(list(preferences['cities']))
+    return "\n        ".join(conditions), params
+
+def seed_start(seed: str) -> float:
+    """Point in [0, 1) where the random_key walk of a browsing pass starts"""
+    digest = hashlib.blake2b(seed.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') / 2 ** 64
+
+def build_candidate_page_query(user_id: int, gender: str, seed: str, cursor_token: str = None, limit: int = 20,
+                               exclude_near: Tuple[float, float, float] = None, preferences: dict = None):
+    """Build the keyset query behind get_candidate_page (shared by every backend).
+
+    Every profile has a fixed ``random_key`` in [0, 1). A pass walks the
+    keys upwards from the point ``seed`` picks, then wraps around to 0 for
+    a second lap, both along idx_users_gender_random_key, so a page reads
+    about ``limit`` rows however many candidates there are. Raises
+    ValueError for a cursor token it can't read.
+    """
+    # Get opposite gender
+    opposite_gender = "female" if gender.lower() == "male" else "male"
+    start = seed_start(seed)
+    
+    lap, last_key, last_user_id = 0, None, None
+    if cursor_token:
+        lap, last_key, last_user_id = cursor_token.split(":")
+        lap, last_key, last_user_id = int(lap), float(last_key), int(last_user_id)
+    
+    filters = [CANDIDATE_CONDITIONS]
+    filter_params = candidate_params(user_id)
+    wanted, wanted_params = build_preference_conditions(preferences)
+    filters.append(wanted)
+    filter_params += wanted_params
+    if exclude_near:
+        # Skip the profiles a nearby pass already showed
+        latitude, longitude, radius_km = exclude_near
+        filters.append(f"AND NOT COALESCE({DISTANCE_KM_SQL} <= %s, FALSE)")
+        filter_params += [latitude, latitude, longitude, radius_km]
+    filters = "\n".join(filters)
+    
+    branches, params = [], []
+    for branch_lap, bound in ((0, "u.random_key >= %s"), (1, "u.random_key < %s")):
+        if branch_lap < lap:
+            continue
+        keyset = ""
+        branch_params = [branch_lap, opposite_gender, start, *filter_params]
+        if branch_lap == lap and last_key is not None:
+            keyset = "AND (u.random_key, u.user_id) > (%s, %s)"
+            branch_params += [last_key, last_user_id]
+        branch_params.append(limit)
+        branches.append(f'''
+            (SELECT u.*, %s AS lap FROM users u
+            WHERE u.gender = %s
+            AND {bound}
+            {filters}
+            {keyset}
+            ORDER BY u.random_key, u.user_id
+            LIMIT %s)
+        ''')
+        params += branch_params
+    params.append(limit)
+    
+    query = f"SELECT * FROM ({'UNION ALL'.join(branches)}) page ORDER BY lap, random_key, user_id LIMIT %s"
+    return query, tuple(params)
+
+def split_candidate_page(rows: list, limit: int):
+    """Strip the lap numbers from a candidate page and build the next cursor token"""
+    next_cursor = None
+    if rows and len(rows) >= limit:
+        last = rows[-1]
+        next_cursor = f"{last['lap']}:{last['random_key']!r}:{last['user_id']}"
+    profiles = []
+    for row in rows:
+        row = dict(row)
+        row.pop('lap', None)
+        profiles.append(row)
+    return profiles, next_cursor
+
+def build_nearby_candidates_query(user_id: int, gender: str, latitude: float, longitude: float,
+                                  radius_km: float, cursor_token: str = None, limit: int = 20,
+                                  preferences: dict = None):
+    """Build the keyset query behind get_nearby_candidates (shared by every backend)"""
+    opposite_gender = "female" if gender.lower() == "male" else "male"
+    # The bounding box is what idx_users_gender_location narrows on
+    min_lat, max_lat, min_lon, max_lon = bounding_box(latitude, longitude, radius_km)
+    wanted, wanted_params = build_preference_conditions(preferences)
+    
+    params = [latitude, latitude, longitude, opposite_gender, *candidate_params(user_id),
+              *wanted_params, min_lat, max_lat, min_lon, max_lon, radius_km]
+    keyset = ""
+    if cursor_token:
+        last_distance, last_user_id = cursor_token.split(":")
+        keyset = "AND (distance_km, user_id) > (%s, %s)"
+        params += [float(last_distance), int(last_user_id)]
+    params.append(limit)
+    
+    query = f'''
+        SELECT * FROM (
+            SELECT u.*, {DISTANCE_KM_SQL} AS distance_km FROM users u
+            WHERE u.gender = %s
+            {CANDIDATE_CONDITIONS}
+            {wanted}
+            AND u.latitude BETWEEN %s AND %s
+            AND u.longitude BETWEEN %s AND %s
+        ) nearby
+        WHERE distance_km <= %s
+        {keyset}
+        ORDER BY distance_km, user_id
+        LIMIT %s
+    '''
+    return query, tuple(params)
+
+def split_nearby_page(rows: list, limit: int):
+    """Strip the distances from a nearby page and build the next cursor token"""
+    next_cursor = None
+    if rows and len(rows) >= limit:
+        next_cursor = f"{rows[-1]['distance_km']!r}:{rows[-1]['user_id']}"
+    profiles = []
+    for row in rows:
+        # Rows are cached and shared: the distance only means something to this viewer
+        row = dict(row)
+        row.pop('distance_km', None)
+        profiles.append(row)
+    return profiles, next_cursor
+
+# /matches and /likes lists: the columns the profile cards show, plus the like time.
+# Params: user id, user id (the blocks check).
+LIKE_LIST_QUERIES = {
+    # Users who liked this user, by the time of their like
+    'likers': '''
+        SELECT u.user_id, u.first_name, u.age, u.language, u.city, u.religion, u.bio, u.photos,
+               l.created_at AS liked_at
+        FROM likes l
+        INNER JOIN users u ON u.user_id = l.user_id
+        WHERE l.liked_user_id = %s
+        AND u.is_active = TRUE
+        AND NOT EXISTS (
+            SELECT 1 FROM blocks b WHERE b.user_id = %s AND b.blocked_user_id = u.user_id
+        )
+    ''',
+    # Mutual matches, by the time the second like completed the match
+    'matches': '''
+        SELECT u.user_id, u.first_name, u.age, u.language, u.city, u.religion, u.bio, u.photos,
+               GREATEST(l1.created_at, l2.created_at) AS liked_at
+        FROM likes l1
+        INNER JOIN likes l2 ON l2.user_id = l1.liked_user_id AND l2.liked_user_id = l1.user_id
+        INNER JOIN users u ON u.user_id = l1.liked_user_id
+        WHERE l1.user_id = %s
+        AND u.is_active = TRUE
+        AND NOT EXISTS (
+            SELECT 1 FROM blocks b WHERE b.user_id = %s AND b.blocked_user_id = u.user_id
+        )
+    ''',
+}
+LIKE_CURSOR_TIME_FORMAT = '%Y%m%d%H%M%S%f'  # compact, cursors go into callback data
+
+def build_like_list_query(kind: str, user_id: int, cursor_token: str = None, limit: int = 5):
+    """Build one page of a like list (``kind``: 'likers' or 'matches'), newest first.
+
+    ``cursor_token`` is "n:<time>:<user_id>" for the page after that row
+    (older likes) or "p:<time>:<user_id>" for the page before it. One row
+    more than ``limit`` is fetched to tell whether the list goes on.
+    """
+    params = [user_id, user_id]
+    keyset, order = "", "DESC"
+    if cursor_token:
+        direction, liked_at, last_user_id = cursor_token.split(':')
+        if direction not in ('n', 'p'):
+            raise ValueError(f"bad like list cursor: {cursor_token}")
+        keyset = "WHERE (liked_at, user_id) < (%s, %s)" if direction == 'n' else \
+                 "WHERE (liked_at, user_id) > (%s, %s)"
+        order = "DESC" if direction == 'n' else "ASC"
+        params += [datetime.strptime(liked_at, LIKE_CURSOR_TIME_FORMAT), int(last_user_id)]
+    params.append(limit + 1)
+    query = f'''
+        SELECT * FROM ({LIKE_LIST_QUERIES[kind]}) page {keyset}
+        ORDER BY liked_at {order}, user_id {order} LIMIT %s
+    '''
+    return query, tuple(params)
+
+def like_cursor(direction: str, row: dict) -> str:
+    return f"{direction}:{row['liked_at'].strftime(LIKE_CURSOR_TIME_FORMAT)}:{row['user_id']}"
+
+def split_like_list_page(rows: list, limit: int, cursor_token: str = None):
+    """Trim a like list page to ``limit`` rows, newest first, and build the cursors around it"""
+    more = len(rows) > limit
+    rows = list(rows[:limit])
+    if cursor_token and cursor_token.startswith('p:'):
+        rows.reverse()
+        # We came from the next page
+        has_prev, has_next = more, True
+    else:
+        has_prev, has_next = bool(cursor_token), more
+    if not rows:
+        return [], None, None
+    prev_cursor = like_cursor('p', rows[0]) if has_prev else None
+    next_cursor = like_cursor('n', rows[-1]) if has_next else None
+    return rows, prev_cursor, next_cursor
+
+# Every browsable profile with the attributes the in-memory matching index buckets on
+MATCHING_SNAPSHOT_QUERY = '''
+    SELECT user_id, gender, city, religion, age, latitude, longitude FROM users
+    WHERE is_active = TRUE
+    AND gender IS NOT NULL
+    AND photos IS NOT NULL
+    AND bio IS NOT NULL
+    AND photos != '[]'
+    AND bio != ''
+'''
+
+# Ids a user has liked, blocked or recently skipped (excluded from their candidates)
+EXCLUDED_USER_IDS_QUERY = '''
+    SELECT liked_user_id FROM likes WHERE user_id = %s
+    UNION
+    SELECT blocked_user_id FROM blocks WHERE user_id = %s
+    UNION
+    SELECT target_user_id FROM swipes
+    WHERE user_id = %s AND swiped_at > NOW() - %s * INTERVAL '1 second'
+    ORDER BY 1
+'''
+
+# Likes received, mutual matches and coins for a batch of users (one row per existing user)
+USERS_STATS_QUERY = '''
+    SELECT user_id,
+           likes_count AS likes,
+           matches_count AS matches,
+           COALESCE(coins, 0) AS coins
+    FROM users
+    WHERE user_id = ANY(%s)
+'''
+
+# Recount the trigger-maintained counters from likes, touching only rows that drifted
+RECONCILE_COUNTERS_QUERY = '''
+    WITH received AS (
+        SELECT liked_user_id AS user_id, COUNT(*) AS n FROM likes GROUP BY liked_user_id
+    ), mutual AS (
+        SELECT l1.liked_user_id AS user_id, COUNT(*) AS n FROM likes l1
+        INNER JOIN likes l2 ON l1.user_id = l2.liked_user_id AND l1.liked_user_id = l2.user_id
+        GROUP BY l1.liked_user_id
+    ), actual AS (
+        SELECT u.user_id, COALESCE(r.n, 0) AS likes_count, COALESCE(m.n, 0) AS matches_count
+        FROM users u
+        LEFT JOIN received r ON r.user_id = u.user_id
+        LEFT JOIN mutual m ON m.user_id = u.user_id
+    )
+    UPDATE users u
+    SET likes_count = a.likes_count, matches_count = a.matches_count
+    FROM actual a
+    WHERE u.user_id = a.user_id
+    AND (u.likes_count, u.matches_count) IS DISTINCT FROM (a.likes_count, a.matches_count)
+'''
+
+# Key-value store backing FSM state and browsing sessions (see storage.py)
+KV_GET_QUERY = '''
+    SELECT value FROM kv_store
+    WHERE key = %s AND (expires_at IS NULL OR expires_at > NOW())
+'''
+KV_SET_QUERY = '''
+    INSERT INTO kv_store (key, value, expires_at)
+    VALUES (%s, %s, NOW() + %s * INTERVAL '1 second')
+    ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value, expires_at = EXCLUDED.expires_at
+'''
+KV_DELETE_QUERY = 'DELETE FROM kv_store WHERE key = %s'
+KV_PURGE_QUERY = 'DELETE FROM kv_store WHERE expires_at <= NOW()'
+
+# Skips as one multi-row upsert (params: user ids, target ids); pairs whose
+# users are gone are dropped instead of failing the whole batch
+RECORD_SKIPS_QUERY = '''
+    INSERT INTO swipes (user_id, target_user_id)
+    SELECT s.user_id, s.target_user_id
+    FROM UNNEST(%s::BIGINT[], %s::BIGINT[]) AS s(user_id, target_user_id)
+    WHERE EXISTS (SELECT 1 FROM users WHERE user_id = s.user_id)
+    AND EXISTS (SELECT 1 FROM users WHERE user_id = s.target_user_id)
+    ON CONFLICT (user_id, target_user_id) DO UPDATE SET swiped_at = NOW()
+'''
+# Likes as one multi-row insert (params: user ids, liked ids), same rules as RECORD_SKIPS_QUERY
+RECORD_LIKES_QUERY = '''
+    INSERT INTO likes (user_id, liked_user_id)
+    SELECT s.user_id, s.liked_user_id
+    FROM UNNEST(%s::BIGINT[], %s::BIGINT[]) AS s(user_id, liked_user_id)
+    WHERE EXISTS (SELECT 1 FROM users WHERE user_id = s.user_id)
+    AND EXISTS (SELECT 1 FROM users WHERE user_id = s.liked_user_id)
+    ORDER BY LEAST(s.user_id, s.liked_user_id), GREATEST(s.user_id, s.liked_user_id)
+    ON CONFLICT (user_id, liked_user_id) DO NOTHING
+'''
+HAS_LIKED_QUERY = 'SELECT 1 FROM likes WHERE user_id = %s AND liked_user_id = %s'
+# (added, mutual) for one like; see migration 11
+ADD_LIKE_AND_MATCH_QUERY = 'SELECT added, mutual FROM add_like_and_match(%s, %s)'
+
+def split_like_batch(pairs: List[Tuple[int, int]]) -> List[List[Tuple[int, int]]]:
+    """Split likes so that no statement holds both A->B and B->A.
+
+    The counter triggers run after the whole statement: with both
+    directions in one insert, each row would see the other and the match
+    would be counted twice.
+    """
+    batch = set(pairs)
+    first = [pair for pair in pairs if pair[0] < pair[1] or (pair[1], pair[0]) not in batch]
+    second = [pair for pair in pairs if pair[0] > pair[1] and (pair[1], pair[0]) in batch]
+    return [part for part in (first, second) if part]
+
+PURGE_SWIPES_QUERY = "DELETE FROM swipes WHERE swiped_at <= NOW() - %s * INTERVAL '1 second'"
+
+# Updates handled by once-only handlers (see middlewares/dedup.py); inserts nothing for a repeat
+CLAIM_UPDATE_QUERY = 'INSERT INTO processed_updates (update_id) VALUES (%s) ON CONFLICT (update_id) DO NOTHING'
+RELEASE_UPDATE_QUERY = 'DELETE FROM processed_updates WHERE update_id = %s'
+PURGE_PROCESSED_UPDATES_QUERY = "DELETE FROM processed_updates WHERE processed_at <= NOW() - %s * INTERVAL '1 second'"
+
 class Database:
     def __init__(self):
-        self.conn = self.get_connection()
-        self.create_tables()
-        self.create_payment_tables()
-        self.migrate_tables()
+        self.pool = None
+        self._local = threading.local()
+        self._conn = None  # opened by connect(), not on import
+    
+    def connect(self):
+        """Open the shared connection and bring the schema up to date (safe to call more than once)"""
+        if self._conn is not None and not self._conn.closed:
+            return
+        conn = self.get_connection()
+        try:
+            migrate(conn)
+        except Exception:
+            conn.close()
+            raise
+        self._conn = conn
+    
+    @property
+    def conn(self):
+        """Connection for the calling thread.
+
+        Without a pool every call shares the startup connection. Once
+        ``enable_pool`` has been called each thread checks out its own
+        pooled connection on first use and keeps it. The first use connects
+        and migrates if ``connect`` hasn't been called yet.
+        """
+        if self._conn is None:
+            self.connect()
+        if self.pool is None:
+            return self._conn
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or conn.closed:
+            conn = self.pool.getconn()
+            self._local.conn = conn
+        return conn
+    
+    def get_connection_args(self):
+        """Connection arguments for psycopg2.connect and the connection pool"""
+        # Get database URL from environment variable (for production)
+        database_url = os.getenv('DATABASE_URL')
+        
+        if database_url:
+            # For Heroku and other cloud providers
+            return (database_url,), {'sslmode': 'require'}
+        
+        # For local development
+        return (), {
+            'host': config.DB_HOST,
+            'database': config.DB_NAME,
+            'user': config.DB_USER,
+            'password': config.DB_PASSWORD,
+            'port': config.DB_PORT
+        }
     
     def get_connection(self):
         """Get PostgreSQL database connection"""
         try:
-            # Get database URL from environment variable (for production)
-            database_url = os.getenv('DATABASE_URL')
-            
-            if database_url:
-                # For Heroku and other cloud providers
-                conn = psycopg2.connect(database_url, sslmode='require')
-            else:
-                # For local development
-                conn = psycopg2.connect(
-                    host=config.DB_HOST,
-                    database=config.DB_NAME,
-                    user=config.DB_USER,
-                    password=config.DB_PASSWORD,
-                    port=config.DB_PORT
-                )
+            args, kwargs = self.get_connection_args()
+            conn = psycopg2.connect(*args, **kwargs)
             
             logging.info("✅ Connected to PostgreSQL database")
             return conn
@@ -37,133 +440,27 @@ class Database:
             logging.error(f"❌ Error connecting to database: {e}")
             raise
     
-    def create_tables(self):
-        """Create necessary tables for the bot"""
-        cursor = self.conn.cursor()
-        
-        # Users table with all possible columns
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS users (
-                user_id BIGINT PRIMARY KEY,
-                username TEXT,
-                first_name TEXT,
-                last_name TEXT,
-                language TEXT DEFAULT 'english',
-                phone TEXT,
-                age INTEGER,
-                gender TEXT,
-                religion TEXT,
-                city TEXT,
-                latitude REAL,
-                longitude REAL,
-                bio TEXT,
-                photos TEXT,
-                is_active BOOLEAN DEFAULT TRUE,
-                coins INTEGER DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Likes table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS likes (
-                id SERIAL PRIMARY KEY,
-                user_id BIGINT,
-                liked_user_id BIGINT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users (user_id) ON DELETE CASCADE,
-                FOREIGN KEY (liked_user_id) REFERENCES users (user_id) ON DELETE CASCADE,
-                UNIQUE(user_id, liked_user_id)
-            )
-        ''')
-        
-        # Messages table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS messages (
-                id SERIAL PRIMARY KEY,
-                from_user_id BIGINT,
-                to_user_id BIGINT,
-                message_text TEXT,
-                message_type VARCHAR(20) DEFAULT 'text',
-                media_file_id TEXT,
-                is_read BOOLEAN DEFAULT FALSE,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (from_user_id) REFERENCES users (user_id) ON DELETE CASCADE,
-                FOREIGN KEY (to_user_id) REFERENCES users (user_id) ON DELETE CASCADE
-            )
-        ''')
-        
-        # Blocks table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS blocks (
-                id SERIAL PRIMARY KEY,
-                user_id BIGINT,
-                blocked_user_id BIGINT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users (user_id) ON DELETE CASCADE,
-                FOREIGN KEY (blocked_user_id) REFERENCES users (user_id) ON DELETE CASCADE,
-                UNIQUE(user_id, blocked_user_id)
-            )
-        ''')
-        
-        # Complaints table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS complaints (
-                id SERIAL PRIMARY KEY,
-                user_id BIGINT,
-                reported_user_id BIGINT,
-                complaint_type TEXT,
-                complaint_text TEXT,
-                status TEXT DEFAULT 'pending',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (user_id) REFERENCES users (user_id) ON DELETE CASCADE,
-                FOREIGN KEY (reported_user_id) REFERENCES users (user_id) ON DELETE CASCADE
-            )
-        ''')
-        
-        self.conn.commit()
-        cursor.close()
+    def enable_pool(self, minconn: int, maxconn: int, statement_timeout: float = None):
+        """Switch to one pooled connection per thread (for executor-backed use)"""
+        if self.pool is not None:
+            return
+        args, kwargs = self.get_connection_args()
+        if statement_timeout:
+            kwargs['options'] = f"-c statement_timeout={int(statement_timeout * 1000)}"
+        try:
+            self.pool = ThreadedConnectionPool(minconn, maxconn, *args, **kwargs)
+            logging.info(f"✅ PostgreSQL thread pool ready (size {minconn}-{maxconn})")
+        except Exception as e:
+            logging.error(f"❌ Error creating database thread pool: {e}")
+            raise
     
-    def migrate_tables(self):
-        """Add missing columns to existing tables"""
-        cursor = self.conn.cursor()
-        
-        # Check and add missing columns to users table
-        columns_to_check = [
-            ('last_name', 'TEXT'),
-            ('language', 'TEXT'),
-            ('phone', 'TEXT'),
-            ('age', 'INTEGER'),
-            ('gender', 'TEXT'),
-            ('religion', 'TEXT'),
-            ('city', 'TEXT'),
-            ('latitude', 'REAL'),
-            ('longitude', 'REAL'),
-            ('bio', 'TEXT'),
-            ('photos', 'TEXT'),
-            ('is_active', 'BOOLEAN'),
-            ('coins', 'INTEGER')
-        ]
-        
-        for column_name, column_type in columns_to_check:
-            try:
-                cursor.execute(f'''
-                    DO $$ 
-                    BEGIN 
-                        IF NOT EXISTS (
-                            SELECT 1 FROM information_schema.columns 
-                            WHERE table_name='users' AND column_name='{column_name}'
-                        ) THEN
-                            ALTER TABLE users ADD COLUMN {column_name} {column_type};
-                        END IF;
-                    END $$;
-                ''')
-                logging.info(f"Checked/added column {column_name} to users table")
-            except Exception as e:
-                logging.warning(f"Could not add column {column_name}: {e}")
-        
-        self.conn.commit()
-        cursor.close()
+    def close_pool(self):
+        """Close every pooled connection and fall back to the shared connection"""
+        if self.pool is not None:
+            self.pool.closeall()
+            self.pool = None
+            self._local = threading.local()
+            logging.info("✅ PostgreSQL thread pool closed")
     
     def add_user(self, user_id: int, username: str, first_name: str, last_name: str = ""):
         """Add new user to database"""
@@ -189,6 +486,7 @@ class Database:
             return cursor.fetchone()
         except Exception as e:
             logging.error(f"Error getting user: {e}")
+            self.conn.rollback()
             return None
         finally:
             cursor.close()
@@ -221,10 +519,106 @@ class Database:
             return cursor.fetchall()
         except Exception as e:
             logging.error(f"Error getting matches: {e}")
+            self.conn.rollback()
             return []
         finally:
             cursor.close()
     
+    def get_candidate_page(self, user_id: int, gender: str, seed: str, cursor_token: str = None, limit: int = 20,
+                           exclude_near: Tuple[float, float, float] = None,
+                           preferences: dict = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Get one page of potential matches in a stable random order.
+
+        The order is fixed by ``seed`` (one per browsing session) and pages
+        are fetched by keyset, so only ``limit`` rows are read per call.
+        Returns the rows and the cursor token for the next page (None when
+        this was the last page). ``exclude_near`` is a (latitude, longitude,
+        radius_km) circle whose profiles are left out; ``preferences`` are the
+        viewer's filters (see build_preference_conditions).
+        """
+        cursor = self.conn.cursor(cursor_factory=RealDictCursor)
+        
+        try:
+            # A token from before an upgrade doesn't parse: the pass starts over
+            query, params = build_candidate_page_query(user_id, gender, seed, cursor_token, limit,
+                                                       exclude_near, preferences)
+            cursor.execute(query, params)
+            return split_candidate_page(cursor.fetchall(), limit)
+        except Exception as e:
+            logging.error(f"Error getting candidate page: {e}")
+            self.conn.rollback()
+            return [], None
+        finally:
+            cursor.close()
+
+    def get_nearby_candidates(self, user_id: int, gender: str, latitude: float, longitude: float, radius_km: float,
+                              cursor_token: str = None, limit: int = 20,
+                              preferences: dict = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Get one page of potential matches within ``radius_km``, nearest first.
+
+        Pages are fetched by keyset on (distance, user_id); returns the rows
+        and the cursor token for the next page (None when this was the last).
+        """
+        cursor = self.conn.cursor(cursor_factory=RealDictCursor)
+        
+        try:
+            # A token from before an upgrade doesn't parse: the pass starts over
+            query, params = build_nearby_candidates_query(user_id, gender, latitude, longitude, radius_km,
+                                                          cursor_token, limit, preferences)
+            cursor.execute(query, params)
+            return split_nearby_page(cursor.fetchall(), limit)
+        except Exception as e:
+            logging.error(f"Error getting nearby candidates: {e}")
+            self.conn.rollback()
+            return [], None
+        finally:
+            cursor.close()
+
+    def get_matching_snapshot(self) -> List[Dict[str, Any]]:
+        """Get the matching attributes of every browsable profile (for the in-memory index)"""
+        cursor = self.conn.cursor(cursor_factory=RealDictCursor)
+        try:
+            cursor.execute(MATCHING_SNAPSHOT_QUERY)
+            return cursor.fetchall()
+        except Exception as e:
+            logging.error(f"Error getting matching snapshot: {e}")
+            self.conn.rollback()
+            return []
+        finally:
+            cursor.close()
+
+    def get_users_by_ids(self, user_ids: List[int]) -> List[Dict[str, Any]]:
+        """Get active users by id, in the order the ids were given"""
+        if not user_ids:
+            return []
+        cursor = self.conn.cursor(cursor_factory=RealDictCursor)
+        try:
+            cursor.execute('''
+                SELECT * FROM users
+                WHERE user_id = ANY(%s) AND is_active = TRUE
+            ''', (list(user_ids),))
+            rows = {row['user_id']: row for row in cursor.fetchall()}
+            return [rows[user_id] for user_id in user_ids if user_id in rows]
+        except Exception as e:
+            logging.error(f"Error getting users by ids: {e}")
+            self.conn.rollback()
+            return []
+        finally:
+            cursor.close()
+
+    def get_excluded_user_ids(self, user_id: int) -> List[int]:
+        """Get ids the user already liked, blocked or recently skipped, sorted ascending"""
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(EXCLUDED_USER_IDS_QUERY, (user_id, user_id, user_id, skip_cooldown_seconds()))
+            return [row[0] for row in cursor.fetchall()]
+        except Exception as e:
+            logging.error(f"Error getting excluded users: {e}")
+            self.conn.rollback()
+            return []
+        finally:
+            cursor.close()
+
     def add_like(self, user_id: int, liked_user_id: int) -> bool:
         """Add a like between users"""
         cursor = self.conn.cursor()
@@ -279,48 +673,37 @@ class Database:
         finally:
             cursor.close()
 
-    def get_user_likes(self, user_id: int) -> List[Dict[str, Any]]:
-        """Get users who liked the current user"""
+    def get_user_likes(self, user_id: int, cursor_token: str = None,
+                       limit: int = 5) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[str]]:
+        """Get one page of the users who liked the current user, newest like first.
+
+        Returns the rows and the cursor tokens of the previous and next pages
+        (None at either end of the list).
+        """
         cursor = self.conn.cursor(cursor_factory=RealDictCursor)
         try:
-            cursor.execute('''
-                SELECT u.* FROM users u
-                INNER JOIN likes l ON u.user_id = l.user_id
-                WHERE l.liked_user_id = %s
-                AND u.user_id NOT IN (
-                    SELECT blocked_user_id FROM blocks WHERE user_id = %s
-                )
-                AND u.is_active = TRUE
-            ''', (user_id, user_id))
-            
-            return cursor.fetchall()
+            query, params = build_like_list_query('likers', user_id, cursor_token, limit)
+            cursor.execute(query, params)
+            return split_like_list_page(cursor.fetchall(), limit, cursor_token)
         except Exception as e:
             logging.error(f"Error getting user likes: {e}")
-            return []
+            self.conn.rollback()
+            return [], None, None
         finally:
             cursor.close()
 
-    def get_mutual_likes(self, user_id: int) -> List[Dict[str, Any]]:
-        """Get mutual matches (users who liked each other)"""
+    def get_mutual_likes(self, user_id: int, cursor_token: str = None,
+                         limit: int = 5) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[str]]:
+        """Get one page of mutual matches (users who liked each other), newest match first"""
         cursor = self.conn.cursor(cursor_factory=RealDictCursor)
         try:
-            cursor.execute('''
-                SELECT u.* FROM users u
-                WHERE u.user_id IN (
-                    SELECT l1.user_id FROM likes l1
-                    INNER JOIN likes l2 ON l1.user_id = l2.liked_user_id AND l1.liked_user_id = l2.user_id
-                    WHERE l1.liked_user_id = %s
-                )
-                AND u.user_id NOT IN (
-                    SELECT blocked_user_id FROM blocks WHERE user_id = %s
-                )
-                AND u.is_active = TRUE
-            ''', (user_id, user_id))
-            
-            return cursor.fetchall()
+            query, params = build_like_list_query('matches', user_id, cursor_token, limit)
+            cursor.execute(query, params)
+            return split_like_list_page(cursor.fetchall(), limit, cursor_token)
         except Exception as e:
             logging.error(f"Error getting mutual likes: {e}")
-            return []
+            self.conn.rollback()
+            return [], None, None
         finally:
             cursor.close()
 
@@ -377,13 +760,13 @@ class Database:
         """Get count of how many people liked the user"""
         cursor = self.conn.cursor()
         try:
-            cursor.execute('''
-                SELECT COUNT(*) FROM likes 
-                WHERE liked_user_id = %s
-            ''', (user_id,))
-            return cursor.fetchone()[0]
+            # Maintained by the likes_counters_* triggers
+            cursor.execute('SELECT likes_count FROM users WHERE user_id = %s', (user_id,))
+            result = cursor.fetchone()
+            return result[0] if result else 0
         except Exception as e:
             logging.error(f"Error getting user likes count: {e}")
+            self.conn.rollback()
             return 0
         finally:
             cursor.close()
@@ -392,20 +775,46 @@ class Database:
         """Get count of user's mutual matches"""
         cursor = self.conn.cursor()
         try:
-            cursor.execute('''
-                SELECT COUNT(*) FROM (
-                    SELECT l1.user_id FROM likes l1
-                    INNER JOIN likes l2 ON l1.user_id = l2.liked_user_id AND l1.liked_user_id = l2.user_id
-                    WHERE l1.liked_user_id = %s
-                ) AS matches
-            ''', (user_id,))
-            return cursor.fetchone()[0]
+            # Maintained by the likes_counters_* triggers
+            cursor.execute('SELECT matches_count FROM users WHERE user_id = %s', (user_id,))
+            result = cursor.fetchone()
+            return result[0] if result else 0
         except Exception as e:
             logging.error(f"Error getting user matches count: {e}")
+            self.conn.rollback()
+            return 0
+        finally:
+            cursor.close()
+
+    def reconcile_counters(self) -> int:
+        """Rebuild like/match counters from the likes table; returns rows corrected"""
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(RECONCILE_COUNTERS_QUERY)
+            self.conn.commit()
+            return cursor.rowcount
+        except Exception as e:
+            logging.error(f"Error reconciling counters: {e}")
+            self.conn.rollback()
             return 0
         finally:
             cursor.close()
 
+    def get_users_stats(self, user_ids: List[int]) -> Dict[int, Dict[str, int]]:
+        """Get likes, matches and coins for several users in one query"""
+        if not user_ids:
+            return {}
+        cursor = self.conn.cursor(cursor_factory=RealDictCursor)
+        try:
+            cursor.execute(USERS_STATS_QUERY, (list(user_ids),))
+            return {row.pop('user_id'): dict(row) for row in cursor.fetchall()}
+        except Exception as e:
+            logging.error(f"Error getting users stats: {e}")
+            self.conn.rollback()
+            return {}
+        finally:
+            cursor.close()
+
     def get_user_coins(self, user_id: int) -> int:
         """Get user's coin balance"""
         cursor = self.conn.cursor()
@@ -415,6 +824,7 @@ class Database:
             return result[0] if result else 0
         except Exception as e:
             logging.error(f"Error getting user coins: {e}")
+            self.conn.rollback()
             return 0
         finally:
             cursor.close()
@@ -457,31 +867,6 @@ class Database:
         finally:
             cursor.close()
 
-    def create_payment_tables(self):
-        """Create payment-related tables"""
-        cursor = self.conn.cursor()
-        
-        # Payments table for tracking payment requests
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS payments (
-                id SERIAL PRIMARY KEY,
-                user_id BIGINT,
-                package_name TEXT,
-                coins_amount INTEGER,
-                price REAL,
-                status TEXT DEFAULT 'pending', -- pending, approved, rejected
-                screenshot_file_id TEXT,
-                admin_notes TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                processed_at TIMESTAMP,
-                processed_by BIGINT,
-                FOREIGN KEY (user_id) REFERENCES users (user_id) ON DELETE CASCADE
-            )
-        ''')
-        
-        self.conn.commit()
-        cursor.close()
-
     def add_payment_request(self, user_id: int, package_name: str, coins_amount: int, price: float, screenshot_file_id: str) -> int:
         """Add a new payment request"""
         cursor = self.conn.cursor()
@@ -516,6 +901,7 @@ class Database:
             return cursor.fetchone()
         except Exception as e:
             logging.error(f"Error getting payment request: {e}")
+            self.conn.rollback()
             return None
         finally:
             cursor.close()
@@ -554,6 +940,7 @@ class Database:
             return cursor.fetchall()
         except Exception as e:
             logging.error(f"Error getting pending payments: {e}")
+            self.conn.rollback()
             return []
         finally:
             cursor.close()
@@ -591,4 +978,187 @@ class Database:
         finally:
             cursor.close()
 
+
+    def kv_get(self, key: str) -> Optional[str]:
+        """Get a stored value (None when missing or expired)"""
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(KV_GET_QUERY, (key,))
+            result = cursor.fetchone()
+            return result[0] if result else None
+        except Exception as e:
+            logging.error(f"Error reading key {key}: {e}")
+            self.conn.rollback()
+            return None
+        finally:
+            cursor.close()
+
+    def kv_set(self, key: str, value: str, ttl: int = None) -> bool:
+        """Store a value, expiring after ``ttl`` seconds (never when None)"""
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(KV_SET_QUERY, (key, value, ttl))
+            self.conn.commit()
+            return True
+        except Exception as e:
+            logging.error(f"Error writing key {key}: {e}")
+            self.conn.rollback()
+            return False
+        finally:
+            cursor.close()
+
+    def kv_delete(self, key: str) -> bool:
+        """Remove a stored value"""
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(KV_DELETE_QUERY, (key,))
+            self.conn.commit()
+            return True
+        except Exception as e:
+            logging.error(f"Error deleting key {key}: {e}")
+            self.conn.rollback()
+            return False
+        finally:
+            cursor.close()
+
+    def kv_purge_expired(self) -> int:
+        """Delete expired values; returns how many were removed"""
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(KV_PURGE_QUERY)
+            self.conn.commit()
+            return cursor.rowcount
+        except Exception as e:
+            logging.error(f"Error purging expired keys: {e}")
+            self.conn.rollback()
+            return 0
+        finally:
+            cursor.close()
+
+    def record_skips(self, pairs: List[Tuple[int, int]]) -> int:
+        """Record (user_id, skipped_user_id) pairs in one statement; returns rows written"""
+        if not pairs:
+            return 0
+        cursor = self.conn.cursor()
+        try:
+            user_ids, target_ids = zip(*pairs)
+            cursor.execute(RECORD_SKIPS_QUERY, (list(user_ids), list(target_ids)))
+            self.conn.commit()
+            return cursor.rowcount
+        except Exception as e:
+            logging.error(f"Error recording skips: {e}")
+            self.conn.rollback()
+            return 0
+        finally:
+            cursor.close()
+
+    def add_like_and_match(self, user_id: int, liked_user_id: int) -> Tuple[bool, bool]:
+        """Add a like; returns (added, mutual), mutual when the other user had liked them back.
+
+        Of two users liking each other at the same moment, exactly one gets
+        mutual=True.
+        """
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(ADD_LIKE_AND_MATCH_QUERY, (user_id, liked_user_id))
+            added, mutual = cursor.fetchone()
+            self.conn.commit()
+            return added, mutual
+        except Exception as e:
+            logging.error(f"Error adding like: {e}")
+            self.conn.rollback()
+            return False, False
+        finally:
+            cursor.close()
+
+    def has_liked(self, user_id: int, liked_user_id: int) -> bool:
+        """Whether user_id has liked liked_user_id"""
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(HAS_LIKED_QUERY, (user_id, liked_user_id))
+            return cursor.fetchone() is not None
+        except Exception as e:
+            logging.error(f"Error checking like: {e}")
+            self.conn.rollback()
+            return False
+        finally:
+            cursor.close()
+
+    def record_likes(self, pairs: List[Tuple[int, int]]) -> Optional[int]:
+        """Insert (user_id, liked_user_id) pairs in one transaction; returns rows inserted, None on failure"""
+        if not pairs:
+            return 0
+        cursor = self.conn.cursor()
+        try:
+            inserted = 0
+            for part in split_like_batch(pairs):
+                user_ids, liked_ids = zip(*part)
+                cursor.execute(RECORD_LIKES_QUERY, (list(user_ids), list(liked_ids)))
+                inserted += cursor.rowcount
+            self.conn.commit()
+            return inserted
+        except Exception as e:
+            logging.error(f"Error recording likes: {e}")
+            self.conn.rollback()
+            return None
+        finally:
+            cursor.close()
+
+    def purge_swipes(self) -> int:
+        """Delete skips older than the re-show cooldown; returns how many were removed"""
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(PURGE_SWIPES_QUERY, (skip_cooldown_seconds(),))
+            self.conn.commit()
+            return cursor.rowcount
+        except Exception as e:
+            logging.error(f"Error purging swipes: {e}")
+            self.conn.rollback()
+            return 0
+        finally:
+            cursor.close()
+
+    def claim_update(self, update_id: int) -> bool:
+        """Record an update as handled; False if it already was (a redelivery)"""
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(CLAIM_UPDATE_QUERY, (update_id,))
+            self.conn.commit()
+            return cursor.rowcount == 1
+        except Exception as e:
+            # Better to risk a repeat than to drop a first delivery
+            logging.error(f"Error claiming update: {e}")
+            self.conn.rollback()
+            return True
+        finally:
+            cursor.close()
+
+    def release_update(self, update_id: int) -> bool:
+        """Forget a claimed update whose handler failed, so a redelivery runs it again"""
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(RELEASE_UPDATE_QUERY, (update_id,))
+            self.conn.commit()
+            return True
+        except Exception as e:
+            logging.error(f"Error releasing update: {e}")
+            self.conn.rollback()
+            return False
+        finally:
+            cursor.close()
+
+    def purge_processed_updates(self) -> int:
+        """Delete handled-update records past the redelivery window; returns how many were removed"""
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(PURGE_PROCESSED_UPDATES_QUERY, (config.PROCESSED_UPDATES_TTL,))
+            self.conn.commit()
+            return cursor.rowcount
+        except Exception as e:
+            logging.error(f"Error purging processed updates: {e}")
+            self.conn.rollback()
+            return 0
+        finally:
+            cursor.close()
+
 db = Database()
\ No newline at end of file
@@ -0,0 +1,125 @@
+import asyncio
+import json
+import logging
+import os
+import sys
+from typing import List, Optional
+
+import aiohttp
+from aiogram import Bot
+from aiohttp import web
+
+from config import config
+from utils.sharding import pick_worker, update_shard_key
+
+BOT_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bot.py')
+
+
+class FrontDispatcher:
+    """Receive Telegram's webhook calls and pass each update to a worker process.
+
+    Runs ``WEBHOOK_WORKERS`` copies of the bot (``bot.py`` with
+    ``WORKER_INDEX`` set), each listening on ``127.0.0.1`` at
+    ``WORKER_BASE_PORT + index``. Updates are routed by sender with
+    ``pick_worker``, so all of a user's updates are handled by one process
+    and its in-memory state (update queue, caches) stays local. Workers
+    that exit are started again.
+    """
+
+    def __init__(self, workers: int = None):
+        self.workers = workers or config.WEBHOOK_WORKERS
+        self.processes: List[Optional[asyncio.subprocess.Process]] = [None] * self.workers
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.watchers: List[asyncio.Task] = []
+        self.stopping = False
+        self.forwarded = [0] * self.workers
+        self.failed = 0
+
+    @staticmethod
+    def worker_url(index: int) -> str:
+        return f"http://127.0.0.1:{config.WORKER_BASE_PORT + index}{config.WEBHOOK_PATH}"
+
+    async def handle_update(self, request: web.Request) -> web.Response:
+        """Forward one webhook call to the worker owning its user"""
+        body = await request.read()
+        try:
+            update = json.loads(body)
+        except ValueError:
+            return web.Response(status=400)
+
+        index = pick_worker(update_shard_key(update), self.workers)
+        try:
+            async with self.session.post(self.worker_url(index), data=body,
+                                         headers={'Content-Type': 'application/json'}) as response:
+                self.forwarded[index] += 1
+                return web.Response(status=response.status, body=await response.read(),
+                                    content_type=response.content_type)
+        except aiohttp.ClientError as e:
+            # Not 200: Telegram sends the update again later
+            self.failed += 1
+            logging.error(f"Error forwarding update to worker {index}: {e}")
+            return web.Response(status=503)
+
+    async def watch_worker(self, index: int):
+        """Run worker ``index`` and start it again whenever it exits"""
+        env = dict(
+            os.environ,
+            WORKER_INDEX=str(index),
+            # Telegram's limit is per bot: the workers share it
+            SEND_GLOBAL_RATE=str(config.SEND_GLOBAL_RATE / self.workers),
+        )
+        while not self.stopping:
+            process = await asyncio.create_subprocess_exec(sys.executable, BOT_SCRIPT, env=env)
+            self.processes[index] = process
+            print(f"👷 Worker {index} started (pid {process.pid}, port {config.WORKER_BASE_PORT + index})")
+            code = await process.wait()
+            if self.stopping:
+                break
+            logging.warning(f"⚠️ Worker {index} exited with code {code}, restarting")
+            await asyncio.sleep(config.WORKER_RESTART_DELAY)
+
+    async def on_startup(self, app: web.Application):
+        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=config.WORKER_FORWARD_TIMEOUT))
+        self.watchers = [asyncio.create_task(self.watch_worker(index)) for index in range(self.workers)]
+
+        bot = Bot(token=config.BOT_TOKEN)
+        try:
+            webhook_url = f"{config.WEBHOOK_URL}{config.WEBHOOK_PATH}"
+            await bot.set_webhook(url=webhook_url, drop_pending_updates=False)
+            print(f"✅ Webhook set to: {webhook_url}")
+        finally:
+            await bot.session.close()
+
+    async def on_shutdown(self, app: web.Application):
+        # The webhook stays set: Telegram keeps retrying until we're back
+        self.stopping = True
+        # Workers drain their updates and buffers on SIGTERM
+        for process in self.processes:
+            if process is not None and process.returncode is None:
+                process.terminate()
+        await asyncio.gather(*(process.wait() for process in self.processes if process is not None))
+        for task in self.watchers:
+            task.cancel()
+        await self.session.close()
+        logging.info(f"📊 Updates forwarded per worker: {self.forwarded}, failed: {self.failed}")
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post(config.WEBHOOK_PATH, self.handle_update)
+        app.on_startup.append(self.on_startup)
+        app.on_shutdown.append(self.on_shutdown)
+        return app
+
+    async def run(self, stop: asyncio.Event):
+        """Serve the webhook until ``stop`` is set"""
+        runner = web.AppRunner(self.create_app())
+        await runner.setup()
+        site = web.TCPSite(runner, host=config.WEBAPP_HOST, port=config.WEBAPP_PORT)
+        await site.start()
+        print(f"🚀 Front dispatcher on {config.WEBAPP_HOST}:{config.WEBAPP_PORT}, {self.workers} workers")
+        try:
+            await stop.wait()
+        finally:
+            self.stopping = True  # workers exiting from here on stay down
+            # Stops accepting first, then on_shutdown stops the workers
+            await runner.cleanup()
@@ -1,9 +1,9 @@
-from aiogram import Router, F
+from aiogram import Router, F, flags
 from aiogram.types import Message, CallbackQuery, InputMediaPhoto
 from aiogram.filters import Command
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.fsm.context import FSMContext
-from database import db
+from async_database import db
 from config import config
 from keyboards.reply import get_language_keyboard, remove_keyboard
 from keyboards.inline import (
@@ -13,8 +13,13 @@ from keyboards.inline import (
     get_profile_actions_keyboard,
     get_confirm_delete_keyboard, 
     get_coin_packages_keyboard,
+    get_page_navigation_keyboard,
 )
+from middlewares.serial import user_serial
+from storage import kv_store
 from utils.helpers import format_profile_html, format_profile_safe, parse_photos, user_state
+from utils.matching_index import matching_index
+from utils.send_queue import ADMIN, send_queue
 from utils.translations import get_text, get_user_language  # ✅ ADD THIS IMPORT
 
 router = Router()
@@ -42,32 +47,34 @@ from handlers.profile_display import start_profile_session, show_profile_by_inde
 @router.message(Command("who_liked_me"))
 @router.message(Command("likers"))
 async def who_liked_me(message: Message):
-    user_lang = get_user_language(message.from_user.id, db)
+    user_lang = await get_user_language(message.from_user.id, db)
     user_id = message.from_user.id
-    likes = db.get_user_likes(user_id)
+    free_display_count = config.COIN_CONFIG['free_likers_display']
+    # Total count (kept up to date by the likes triggers)
+    likes_count = await db.get_user_likes_count(user_id)
+    
+    # Only the free likers are loaded, if any are shown for free
+    free_likers, next_cursor = [], None
+    if free_display_count > 0:
+        free_likers, _, next_cursor = await db.get_user_likes(user_id, limit=free_display_count)
+        likes_count = max(likes_count, len(free_likers))
     
-    if not likes:
+    if not likes_count:
         await message.answer(
             get_text('no_likes_yet', user_lang),
             reply_markup=get_find_new_people_keyboard(user_lang)
         )
         return
     
-    # Show total count
-    await message.answer(get_text('likes_count', user_lang, count=len(likes)))
-    
-    # Show only free likers (first 3)
-    free_likers = likes[:config.COIN_CONFIG['free_likers_display']]
+    await message.answer(get_text('likes_count', user_lang, count=likes_count))
     
-    if free_likers:
-        
-        # Display the free likers with VIEW buttons (not like/skip)
-        for i, user in enumerate(free_likers):
-            await display_liker_profile(message, user, i+1, user_lang)
+    # Display the free likers with VIEW buttons (not like/skip)
+    for i, user in enumerate(free_likers):
+        await display_liker_profile(message, user, i+1, user_lang)
     
     # If there are more likers, show premium option
-    if len(likes) > config.COIN_CONFIG['free_likers_display']:
-        remaining_count = len(likes) - config.COIN_CONFIG['free_likers_display']
+    if next_cursor or likes_count > len(free_likers):
+        remaining_count = max(likes_count - len(free_likers), 1)
         await message.answer(
             get_text('more_likers_available', user_lang, 
                     count=remaining_count, cost=config.COIN_CONFIG['view_all_likers_cost']),
@@ -78,10 +85,10 @@ async def who_liked_me(message: Message):
 async def find_matches_from_likes(callback: CallbackQuery):
     """Handle the find new people button from likes command"""
     user_id = callback.from_user.id
-    user_lang = get_user_language(user_id, db)
+    user_lang = await get_user_language(user_id, db)
     
     # Check if user is properly registered
-    user_data = db.get_user(user_id)
+    user_data = await db.get_user(user_id)
     
     if not user_data:
         await callback.answer(get_text('incomplete_registration', user_lang), show_alert=True)
@@ -102,7 +109,7 @@ async def find_matches_from_likes(callback: CallbackQuery):
     await browse_profiles_for_user(callback, user_id)
 
 async def display_liker_profile(message: Message, user: dict, number: int, user_lang: str):
-    """Display a single liker's profile"""
+    """Display a single liker's profile (queued, so listing many likers returns at once)"""
     profile_text = f"{get_text('liker_number', user_lang, number=number)}\n\n"
     profile_text += format_profile_html(user, user_lang)
     
@@ -113,26 +120,28 @@ async def display_liker_profile(message: Message, user: dict, number: int, user_
         media_group.append(InputMediaPhoto(media=photos[0], caption=profile_text))
         media_group.append(InputMediaPhoto(media=photos[1]))
         
-        await message.bot.send_media_group(chat_id=message.chat.id, media=media_group)
+        send_queue.send_media_group(message.chat.id, media_group)
         
         extra_photos_text = ""
         if len(photos) > 2:
             extra_photos_text = f" (+{len(photos)-2} more photos)"
         
-        await message.answer(
+        send_queue.send_message(
+            message.chat.id,
             get_text('someone_liked_back', user_lang, extra_photos=extra_photos_text),
             reply_markup=get_profile_actions_keyboard(user['user_id'])
         )
         
     elif photos:
-        await message.bot.send_photo(
-            chat_id=message.chat.id,
-            photo=photos[0],
+        send_queue.send_photo(
+            message.chat.id,
+            photos[0],
             caption=profile_text,
             reply_markup=get_profile_actions_keyboard(user['user_id'])
         )
     else:
-        await message.answer(
+        send_queue.send_message(
+            message.chat.id,
             profile_text,
             reply_markup=get_profile_actions_keyboard(user['user_id'])
         )
@@ -140,12 +149,13 @@ async def display_liker_profile(message: Message, user: dict, number: int, user_
 # Premium command to view all likers
 @router.message(Command("view_all_likers"))
 @router.message(F.text == "👀 View All Likers")
+@flags.once
 async def view_all_likers(message: Message):
-    user_lang = get_user_language(message.from_user.id, db)
+    user_lang = await get_user_language(message.from_user.id, db)
     user_id = message.from_user.id
     
     # Check if user has enough coins
-    user_info = db.get_user(user_id)
+    user_info = await db.get_user(user_id)
     user_coins = user_info.get('coins', 0)
     cost = config.COIN_CONFIG['view_all_likers_cost']
     
@@ -156,28 +166,31 @@ async def view_all_likers(message: Message):
         )
         return
     
-    likes = db.get_user_likes(user_id)
-    
-    if not likes:
-        await message.answer(get_text('no_likes_yet', user_lang))
-        return
-    
-    # Calculate which likers to show (only the unseen ones)
+    # Find where the unseen likers start (right after the free ones)
     free_display_count = config.COIN_CONFIG['free_likers_display']
-    unseen_likers = likes[free_display_count:]
-    
-    if not unseen_likers:
-        await message.answer(get_text('no_more_likers', user_lang))
-        return
+    if free_display_count > 0:
+        free_likers, _, unseen_cursor = await db.get_user_likes(user_id, limit=free_display_count)
+        
+        if not free_likers:
+            await message.answer(get_text('no_likes_yet', user_lang))
+            return
+        
+        if not unseen_cursor:
+            await message.answer(get_text('no_more_likers', user_lang))
+            return
+    else:
+        # None are free: the paid pages start at the top of the list
+        unseen_cursor = None
+        if not await db.get_user_likes_count(user_id):
+            await message.answer(get_text('no_likes_yet', user_lang))
+            return
     
     # Deduct coins
-    if db.deduct_user_coins(user_id, cost):
-        
-        # Display only unseen likers with correct numbering
-        for i, user in enumerate(unseen_likers):
-            # Number them starting from free_display_count + 1
-            display_number = free_display_count + i + 1
-            await display_liker_profile(message, user, display_number, user_lang)
+    if await db.deduct_user_coins(user_id, cost):
+        # Paging through the likers stays open for a session
+        await kv_store.set(likers_unlocked_key(user_id), True, config.SESSION_TTL)
+        # Display the unseen likers a page at a time, numbered after the free ones
+        await send_like_list_page(message, user_id, user_lang, 'likers', unseen_cursor, free_display_count)
     else:
         await message.answer(get_text('coin_deduction_failed', user_lang))
 
@@ -185,70 +198,151 @@ async def view_all_likers(message: Message):
 @router.message(Command("matches"))
 @router.message(Command("my_matches"))
 async def my_matches(message: Message):
-    user_lang = get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
+    user_lang = await get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
     user_id = message.from_user.id
-    matches = db.get_mutual_likes(user_id)
     
-    if not matches:
+    # First page of matches, newest first
+    shown = await send_like_list_page(message, user_id, user_lang, 'matches', intro=True)
+    if not shown:
         await message.answer(get_text('no_matches_yet', user_lang))
+
+def likers_unlocked_key(user_id: int) -> str:
+    """Set while the user may page through the likers they paid for"""
+    return f"likers_unlocked:{user_id}"
+
+async def send_like_list_page(message: Message, user_id: int, user_lang: str, kind: str,
+                              cursor_token: str = None, offset: int = 0, limit: int = None,
+                              intro: bool = False) -> list:
+    """Queue one page of matches or likers (``kind``) with previous/next buttons.
+
+    ``offset`` is the number of profiles before this page, for numbering
+    them; likers never page back into the free ones. Returns the profiles
+    shown (none when the list is empty).
+    """
+    limit = limit or config.LIKES_PAGE_SIZE
+    if kind == 'matches':
+        profiles, prev_cursor, next_cursor = await db.get_mutual_likes(user_id, cursor_token, limit)
+        first_offset = 0
+    else:
+        profiles, prev_cursor, next_cursor = await db.get_user_likes(user_id, cursor_token, limit)
+        first_offset = config.COIN_CONFIG['free_likers_display']
+    
+    if not profiles:
+        return profiles
+    
+    if kind == 'matches':
+        if intro:
+            matches_count = max(await db.get_user_matches_count(user_id), len(profiles))
+            await message.answer(get_text('matches_count', user_lang, count=matches_count))
+        # All their stats from one query
+        stats = await db.get_users_stats([match['user_id'] for match in profiles])
+        for i, match in enumerate(profiles):
+            await display_match_profile(message, match, offset + i + 1, user_lang, stats.get(match['user_id'], {}))
+    else:
+        for i, user in enumerate(profiles):
+            await display_liker_profile(message, user, offset + i + 1, user_lang)
+    
+    # Callback data: "<kind>_page:<offset>:<limit>:<cursor>"
+    prev_data = next_data = None
+    if prev_cursor and offset > first_offset:
+        prev_offset = max(first_offset, offset - config.LIKES_PAGE_SIZE)
+        prev_data = f"{kind}_page:{prev_offset}:{offset - prev_offset}:{prev_cursor}"
+    if next_cursor:
+        next_data = f"{kind}_page:{offset + len(profiles)}:{config.LIKES_PAGE_SIZE}:{next_cursor}"
+    if prev_data or next_data:
+        send_queue.send_message(
+            message.chat.id,
+            get_text('list_page', user_lang, first=offset + 1, last=offset + len(profiles)),
+            reply_markup=get_page_navigation_keyboard(prev_data, next_data)
+        )
+    return profiles
+
+@router.callback_query(F.data.startswith("matches_page:") | F.data.startswith("likers_page:"))
+async def like_list_page(callback: CallbackQuery):
+    """Handle the previous/next buttons of /matches and /view_all_likers"""
+    user_id = callback.from_user.id
+    user_lang = await get_user_language(user_id, db)
+    try:
+        prefix, offset, limit, cursor_token = callback.data.split(':', 3)
+        offset, limit = int(offset), int(limit)
+        if offset < 0:
+            raise ValueError(f"negative offset {offset}")
+    except ValueError:
+        # Stale or tampered button
+        await callback.answer(get_text('error_try_again', user_lang), show_alert=True)
+        return
+    kind = prefix[:-len('_page')]
+    # The page size comes from the client: never fetch more than a page
+    limit = min(max(limit, 1), config.LIKES_PAGE_SIZE)
+    
+    if kind == 'likers' and not await kv_store.get(likers_unlocked_key(user_id)):
+        await callback.answer(
+            get_text('more_likers_available', user_lang, cost=config.COIN_CONFIG['view_all_likers_cost']),
+            show_alert=True
+        )
         return
     
-    await message.answer(get_text('matches_count', user_lang, count=len(matches)))
+    await callback.answer()
+    shown = await send_like_list_page(callback.message, user_id, user_lang, kind, cursor_token, offset, limit)
+    if not shown:
+        # The list changed since that page was sent
+        await callback.message.answer(
+            get_text('no_matches_yet' if kind == 'matches' else 'no_more_likers', user_lang)
+        )
+
+async def display_match_profile(message: Message, match: dict, number: int, user_lang: str, stats: dict):
+    """Display a single match's profile (queued, like display_liker_profile)"""
+    profile_text = f"{get_text('match_number', user_lang, number=number)}\n\n"
+    profile_text += await format_profile_safe(match, user_lang, stats)
     
-    # Show each match (limited to 5)
-    for i, match in enumerate(matches[:5]):
-        profile_text = f"{get_text('match_number', user_lang, number=i+1)}\n\n"
-        profile_text += format_profile_safe(match, user_lang)
-        
-        photos = parse_photos(match.get('photos', '[]'))
+    photos = parse_photos(match.get('photos', '[]'))
+    
+    if photos and len(photos) >= 2:
+        # Send first 2 photos as media group
+        media_group = []
         
-        if photos and len(photos) >= 2:
-            # Send first 2 photos as media group
-            media_group = []
-            
-            # First photo with profile caption
-            media_group.append(
-                InputMediaPhoto(
-                    media=photos[0],
-                    caption=profile_text
-                )
-            )
-            
-            # Second photo without caption
-            media_group.append(
-                InputMediaPhoto(media=photos[1])
-            )
-            
-            await message.bot.send_media_group(
-                chat_id=message.chat.id,
-                media=media_group
-            )
-            
-            # If there are more than 2 photos, mention it
-            extra_photos_text = ""
-            if len(photos) > 2:
-                extra_photos_text = f" (+{len(photos)-2} more photos)"
-            
-            # Send action buttons
-            await message.answer(
-                get_text('its_a_match', user_lang, extra_photos=extra_photos_text),
-                reply_markup=get_profile_actions_keyboard(match['user_id'])
-            )
-            
-        elif photos:
-            # Only one photo
-            await message.bot.send_photo(
-                chat_id=message.chat.id,
-                photo=photos[0],
-                caption=profile_text,
-                reply_markup=get_profile_actions_keyboard(match['user_id'])
-            )
-        else:
-            # No photos
-            await message.answer(
-                profile_text,
-                reply_markup=get_profile_actions_keyboard(match['user_id'])
+        # First photo with profile caption
+        media_group.append(
+            InputMediaPhoto(
+                media=photos[0],
+                caption=profile_text
             )
+        )
+        
+        # Second photo without caption
+        media_group.append(
+            InputMediaPhoto(media=photos[1])
+        )
+        
+        send_queue.send_media_group(message.chat.id, media_group)
+        
+        # If there are more than 2 photos, mention it
+        extra_photos_text = ""
+        if len(photos) > 2:
+            extra_photos_text = f" (+{len(photos)-2} more photos)"
+        
+        # Send action buttons
+        send_queue.send_message(
+            message.chat.id,
+            get_text('its_a_match', user_lang, extra_photos=extra_photos_text),
+            reply_markup=get_profile_actions_keyboard(match['user_id'])
+        )
+        
+    elif photos:
+        # Only one photo
+        send_queue.send_photo(
+            message.chat.id,
+            photos[0],
+            caption=profile_text,
+            reply_markup=get_profile_actions_keyboard(match['user_id'])
+        )
+    else:
+        # No photos
+        send_queue.send_message(
+            message.chat.id,
+            profile_text,
+            reply_markup=get_profile_actions_keyboard(match['user_id'])
+        )
 
 # ============================================================================
 # ADDITIONAL FEATURES COMMANDS
@@ -259,7 +353,7 @@ async def my_matches(message: Message):
 @router.message(Command("complaint"))
 async def complaint_command(message: Message, state: FSMContext):
     """Handle /complain command with number-based menu"""
-    user_lang = get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
+    user_lang = await get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
     
     await message.answer(
         get_text('complain_prompt', user_lang),
@@ -270,7 +364,7 @@ async def complaint_command(message: Message, state: FSMContext):
 @router.message(ComplaintStates.choosing_type, F.text.regexp(r'^[1-8]$'))
 async def handle_complaint_type_number(message: Message, state: FSMContext):
     """Handle complaint type selection by number"""
-    user_lang = get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
+    user_lang = await get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
     
     complaint_types = {
         "1": get_text('complaint_type_1', user_lang),
@@ -296,7 +390,7 @@ async def handle_complaint_type_number(message: Message, state: FSMContext):
 @router.message(ComplaintStates.choosing_type)
 async def handle_invalid_complaint_number(message: Message, state: FSMContext):
     """Handle invalid number input for complaint type"""
-    user_lang = get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
+    user_lang = await get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
     
     if message.text == "/cancel":
         await state.clear()
@@ -306,9 +400,10 @@ async def handle_invalid_complaint_number(message: Message, state: FSMContext):
     await message.answer(get_text('invalid_complaint_number', user_lang))
 
 @router.message(ComplaintStates.entering_details)
+@flags.once
 async def handle_complaint_details(message: Message, state: FSMContext):
     """Handle complaint details input"""
-    user_lang = get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
+    user_lang = await get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
     
     if message.text == "/cancel":
         await state.clear()
@@ -329,7 +424,7 @@ async def handle_complaint_details(message: Message, state: FSMContext):
     complaint_type = user_data.get('complaint_type')
     
     # Save complaint to database
-    success = db.add_complaint(
+    success = await db.add_complaint(
         user_id=message.from_user.id,
         complaint_type=complaint_type,
         complaint_text=complaint_text
@@ -337,7 +432,7 @@ async def handle_complaint_details(message: Message, state: FSMContext):
     
     if success:
         # Notify admin (keep in English for admin)
-        user_info = db.get_user(message.from_user.id)
+        user_info = await db.get_user(message.from_user.id)
         username = f"@{user_info['username']}" if user_info.get('username') else "No username"
         
         admin_message = get_text('admin_complaint_notification', 'english',
@@ -348,11 +443,8 @@ async def handle_complaint_details(message: Message, state: FSMContext):
                                text=complaint_text,
                                time=message.date.strftime('%Y-%m-%d %H:%M:%S'))
         
-        try:
-            if config.ADMIN_ID:
-                await message.bot.send_message(config.ADMIN_ID, admin_message)
-        except Exception as e:
-            print(f"Failed to notify admin: {e}")
+        if config.ADMIN_ID:
+            send_queue.send_message(config.ADMIN_ID, admin_message, priority=ADMIN)
         
         await message.answer(get_text('complaint_submitted', user_lang))
     else:
@@ -365,8 +457,8 @@ async def handle_complaint_details(message: Message, state: FSMContext):
 @router.message(Command("lang"))
 async def language_command(message: Message):
     """Handle /language command with reply buttons"""
-    user_lang = get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
-    user_data = db.get_user(message.from_user.id)
+    user_lang = await get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
+    user_data = await db.get_user(message.from_user.id)
     current_language = user_data.get('language', 'english') if user_data else 'english'
     
     language_names = {
@@ -386,7 +478,7 @@ async def language_command(message: Message):
 @router.message(F.text.in_(["🇬🇧 English", "🇪🇹 Amharic", "🇪🇹 Affan Oromo", "🇪🇹 Tigrigna"]))
 async def handle_language_selection_reply(message: Message):
     """Handle language selection from reply buttons"""
-    user_lang = get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
+    user_lang = await get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
     
     language_map = {
         "🇬🇧 English": "english",
@@ -400,7 +492,7 @@ async def handle_language_selection_reply(message: Message):
         return
     
     # Update user language in database
-    success = db.update_user_language(message.from_user.id, language_code)
+    success = await db.update_user_language(message.from_user.id, language_code)
     
     if success:
         language_names = {
@@ -427,7 +519,7 @@ async def handle_language_selection_reply(message: Message):
 @router.message(Command("premium"))
 async def buy_coins_command(message: Message):
     """Handle /buycoins command"""
-    user_lang = get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
+    user_lang = await get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
     
     await message.answer(
         get_text('buy_coins', user_lang),
@@ -437,7 +529,7 @@ async def buy_coins_command(message: Message):
 @router.callback_query(F.data.startswith("coins_"))
 async def handle_coin_selection(callback: CallbackQuery, state: FSMContext):
     """Handle coin package selection and request payment screenshot"""
-    user_lang = get_user_language(callback.from_user.id, db)  # ✅ GET USER LANGUAGE
+    user_lang = await get_user_language(callback.from_user.id, db)  # ✅ GET USER LANGUAGE
     
     package_map = {
         "coins_10000": {"coins": 10000, "price": 100, "name": "10000 Coins"},
@@ -472,6 +564,7 @@ async def handle_coin_selection(callback: CallbackQuery, state: FSMContext):
 
 # Admin Command to Add Coins to Users
 @router.message(Command("addcoin"))
+@flags.once
 async def add_coins_admin(message: Message):
     """Admin command to add coins to users"""
     # Check if user is admin
@@ -491,15 +584,15 @@ async def add_coins_admin(message: Message):
         reason = " ".join(parts[3:]) if len(parts) > 3 else "Admin added coins for you."
         
         # Check if user exists
-        user_data = db.get_user(user_id)
+        user_data = await db.get_user(user_id)
         if not user_data:
             await message.answer(get_text('user_not_found', 'english'))
             return
         
-        success = db.add_user_coins(user_id, coin_amount)
+        success = await db.add_user_coins(user_id, coin_amount)
         
         if success:
-            new_balance = db.get_user_coins(user_id)
+            new_balance = await db.get_user_coins(user_id)
             await message.answer(
                 get_text('coins_added_success', 'english',
                         first_name=user_data['first_name'],
@@ -510,11 +603,11 @@ async def add_coins_admin(message: Message):
             )
             
             # Notify user in their language
-            user_lang = get_user_language(user_id, db)
+            user_lang = await get_user_language(user_id, db)
             try:
-                await message.bot.send_message(
-                    chat_id=user_id,
-                    text=get_text('coins_added_user_notification', user_lang,
+                await send_queue.send_message(
+                    user_id,
+                    get_text('coins_added_user_notification', user_lang,
                                  amount=coin_amount,
                                  balance=new_balance,
                                  reason=reason)
@@ -530,16 +623,17 @@ async def add_coins_admin(message: Message):
         await message.answer(f"❌ Error: {e}")
 
 @router.message(PaymentStates.waiting_for_screenshot, F.photo)
+@flags.once
 async def handle_payment_screenshot(message: Message, state: FSMContext):
     """Handle payment screenshot submission"""
-    user_lang = get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
+    user_lang = await get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
     user_data = await state.get_data()
     
     # Get the highest quality photo (screenshot)
     screenshot_file_id = message.photo[-1].file_id
     
     # Store payment request in database
-    payment_id = db.add_payment_request(
+    payment_id = await db.add_payment_request(
         user_id=message.from_user.id,
         package_name=user_data['selected_package'],
         coins_amount=user_data['coins_amount'],
@@ -553,7 +647,7 @@ async def handle_payment_screenshot(message: Message, state: FSMContext):
         return
     
     # Get user info for admin notification
-    user_info = db.get_user(message.from_user.id)
+    user_info = await db.get_user(message.from_user.id)
     username = f"@{user_info['username']}" if user_info.get('username') else "No username"
     
     # Prepare admin notification (in English)
@@ -572,9 +666,10 @@ async def handle_payment_screenshot(message: Message, state: FSMContext):
     # Forward screenshot to admin with approval buttons
     try:
         if config.ADMIN_ID:
-            await message.bot.send_photo(
-                chat_id=config.ADMIN_ID,
-                photo=screenshot_file_id,
+            await send_queue.send_photo(
+                config.ADMIN_ID,
+                screenshot_file_id,
+                priority=ADMIN,
                 caption=admin_caption,
                 reply_markup=get_payment_approval_keyboard(payment_id)
             )
@@ -590,12 +685,13 @@ async def handle_payment_screenshot(message: Message, state: FSMContext):
 @router.message(PaymentStates.waiting_for_screenshot)
 async def handle_invalid_screenshot(message: Message):
     """Handle non-photo messages during screenshot submission"""
-    user_lang = get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
+    user_lang = await get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
     
     await message.answer(get_text('invalid_screenshot', user_lang))
 
 # Payment approval handlers (keep admin messages in English)
 @router.callback_query(F.data.startswith("approve_payment_"))
+@flags.once
 async def approve_payment(callback: CallbackQuery):
     """Admin approves a payment"""
     if callback.from_user.id != config.ADMIN_ID:
@@ -603,7 +699,7 @@ async def approve_payment(callback: CallbackQuery):
         return
     
     payment_id = int(callback.data.split("_")[2])
-    payment = db.get_payment_request(payment_id)
+    payment = await db.get_payment_request(payment_id)
     
     if not payment:
         await callback.answer(get_text('user_not_found', 'english'))
@@ -621,23 +717,20 @@ async def approve_payment(callback: CallbackQuery):
     
     try:
         # Add coins to user
-        success = db.add_user_coins(payment['user_id'], payment['coins_amount'])
+        success = await db.add_user_coins(payment['user_id'], payment['coins_amount'])
         
         if success:
             # Update payment status
-            db.update_payment_status(payment_id, 'approved', callback.from_user.id, "Payment verified and approved")
+            await db.update_payment_status(payment_id, 'approved', callback.from_user.id, "Payment verified and approved")
             
             # Notify user in their language
-            user_lang = get_user_language(payment['user_id'], db)
-            try:
-                await callback.bot.send_message(
-                    chat_id=payment['user_id'],
-                    text=get_text('payment_approved_user', user_lang,
-                                 amount=payment['coins_amount'],
-                                 balance=db.get_user_coins(payment['user_id']))
-                )
-            except Exception as e:
-                print(f"Failed to notify user: {e}")
+            user_lang = await get_user_language(payment['user_id'], db)
+            send_queue.send_message(
+                payment['user_id'],
+                get_text('payment_approved_user', user_lang,
+                         amount=payment['coins_amount'],
+                         balance=await db.get_user_coins(payment['user_id']))
+            )
             
             await callback.message.edit_caption(
                 caption=f"✅ Payment Approved\n\n{callback.message.caption}\n\nApproved by: {callback.from_user.id}",
@@ -647,11 +740,12 @@ async def approve_payment(callback: CallbackQuery):
         else:
             await callback.answer(get_text('coins_added_failed', 'english'))
     except Exception as e:
-        db.update_payment_status(payment_id, 'pending', None, f"Error during processing: {str(e)}")
+        await db.update_payment_status(payment_id, 'pending', None, f"Error during processing: {str(e)}")
         await callback.answer("❌ Error processing payment. Please try again.")
         print(f"Payment approval error: {e}")
 
 @router.callback_query(F.data.startswith("reject_payment_"))
+@flags.once
 async def reject_payment(callback: CallbackQuery):
     """Admin rejects a payment"""
     if callback.from_user.id != config.ADMIN_ID:
@@ -659,24 +753,18 @@ async def reject_payment(callback: CallbackQuery):
         return
     
     payment_id = int(callback.data.split("_")[2])
-    payment = db.get_payment_request(payment_id)
+    payment = await db.get_payment_request(payment_id)
     
     if not payment:
         await callback.answer(get_text('user_not_found', 'english'))
         return
     
     # Update payment status
-    db.update_payment_status(payment_id, 'rejected', callback.from_user.id, "Payment rejected by admin")
+    await db.update_payment_status(payment_id, 'rejected', callback.from_user.id, "Payment rejected by admin")
     
     # Notify user in their language
-    user_lang = get_user_language(payment['user_id'], db)
-    try:
-        await callback.bot.send_message(
-            chat_id=payment['user_id'],
-            text=get_text('payment_rejected_user', user_lang)
-        )
-    except Exception as e:
-        print(f"Failed to notify user: {e}")
+    user_lang = await get_user_language(payment['user_id'], db)
+    send_queue.send_message(payment['user_id'], get_text('payment_rejected_user', user_lang))
     
     await callback.message.edit_caption(
         caption=f"❌ Payment Rejected\n\n{callback.message.caption}\n\nRejected by: {callback.from_user.id}",
@@ -687,7 +775,7 @@ async def reject_payment(callback: CallbackQuery):
 @router.callback_query(F.data == "cancel_payment")
 async def cancel_payment(callback: CallbackQuery, state: FSMContext):
     """Cancel payment process"""
-    user_lang = get_user_language(callback.from_user.id, db)  # ✅ GET USER LANGUAGE
+    user_lang = await get_user_language(callback.from_user.id, db)  # ✅ GET USER LANGUAGE
     
     await state.clear()
     await callback.message.edit_text(
@@ -704,7 +792,7 @@ async def view_pending_payments(message: Message):
         await message.answer(get_text('admin_only', 'english'))
         return
     
-    pending_payments = db.get_pending_payments()
+    pending_payments = await db.get_pending_payments()
     
     if not pending_payments:
         await message.answer(get_text('no_pending_payments', 'english'))
@@ -728,13 +816,37 @@ async def view_pending_payments(message: Message):
             reply_markup=get_payment_approval_keyboard(payment['id'])
         )
 
+# Admin command to check the user cache (keep in English)
+@router.message(Command("cache_stats"))
+async def cache_stats_command(message: Message):
+    """Admin command to show user cache counters"""
+    if message.from_user.id != config.ADMIN_ID:
+        await message.answer(get_text('admin_only', 'english'))
+        return
+    
+    if not hasattr(db, 'cache_stats'):
+        await message.answer(get_text('cache_disabled', 'english'))
+        return
+    
+    await message.answer(get_text('cache_stats', 'english', **db.cache_stats()))
+
+# Admin command to check the per-user update queues (keep in English)
+@router.message(Command("queue_stats"))
+async def queue_stats_command(message: Message):
+    """Admin command to show per-user update queue counters"""
+    if message.from_user.id != config.ADMIN_ID:
+        await message.answer(get_text('admin_only', 'english'))
+        return
+    
+    await message.answer(get_text('queue_stats', 'english', **user_serial.stats()))
+
 # Delete Account Command
 @router.message(Command("deleteaccount"))
 @router.message(Command("delete"))
 @router.message(Command("removeaccount"))
 async def delete_account_command(message: Message, state: FSMContext):
     """Handle /deleteaccount command"""
-    user_lang = get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
+    user_lang = await get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
     
     await message.answer(
         get_text('delete_account_warning', user_lang),
@@ -743,29 +855,29 @@ async def delete_account_command(message: Message, state: FSMContext):
     await state.set_state(DeleteAccountStates.confirming)
 
 @router.callback_query(DeleteAccountStates.confirming, F.data == "confirm_delete_yes")
+@flags.once
 async def confirm_delete_yes(callback: CallbackQuery, state: FSMContext):
     """Handle account deletion confirmation"""
-    user_lang = get_user_language(callback.from_user.id, db)  # ✅ GET USER LANGUAGE
+    user_lang = await get_user_language(callback.from_user.id, db)  # ✅ GET USER LANGUAGE
     user_id = callback.from_user.id
     
     # Delete user account
-    success = db.delete_user_account(user_id)
+    success = await db.delete_user_account(user_id)
     
     if success:
+        matching_index.remove_user(user_id)
         await callback.message.edit_text(
             get_text('account_deleted_success', user_lang),
             reply_markup=None
         )
         
         # Notify admin (in English)
-        try:
-            if config.ADMIN_ID:
-                await callback.bot.send_message(
-                    config.ADMIN_ID,
-                    get_text('admin_account_deleted', 'english', user_id=user_id)
-                )
-        except Exception as e:
-            print(f"Failed to notify admin: {e}")
+        if config.ADMIN_ID:
+            send_queue.send_message(
+                config.ADMIN_ID,
+                get_text('admin_account_deleted', 'english', user_id=user_id),
+                priority=ADMIN
+            )
             
     else:
         await callback.message.edit_text(
@@ -779,7 +891,7 @@ async def confirm_delete_yes(callback: CallbackQuery, state: FSMContext):
 @router.callback_query(DeleteAccountStates.confirming, F.data == "confirm_delete_no")
 async def confirm_delete_no(callback: CallbackQuery, state: FSMContext):
     """Handle account deletion cancellation"""
-    user_lang = get_user_language(callback.from_user.id, db)  # ✅ GET USER LANGUAGE
+    user_lang = await get_user_language(callback.from_user.id, db)  # ✅ GET USER LANGUAGE
     
     await callback.message.edit_text(
         get_text('account_deletion_cancelled', user_lang),
@@ -795,7 +907,7 @@ async def confirm_delete_no(callback: CallbackQuery, state: FSMContext):
 @router.message(Command("cancel"))
 async def cancel_operation(message: Message, state: FSMContext):
     """Cancel any ongoing operation"""
-    user_lang = get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
+    user_lang = await get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
     
     current_state = await state.get_state()
     if current_state is None:
@@ -803,14 +915,14 @@ async def cancel_operation(message: Message, state: FSMContext):
         return
     
     await state.clear()
-    user_state.clear_state(message.from_user.id)
+    await user_state.clear_state(message.from_user.id)
     await message.answer(get_text('operation_cancelled', user_lang))
 
 # Cancel handlers for inline operations
 @router.callback_query(F.data == "cancel_operation")
 async def cancel_inline_operation(callback: CallbackQuery, state: FSMContext):
     """Cancel any ongoing operation from inline button"""
-    user_lang = get_user_language(callback.from_user.id, db)  # ✅ GET USER LANGUAGE
+    user_lang = await get_user_language(callback.from_user.id, db)  # ✅ GET USER LANGUAGE
     
     await state.clear()
     await callback.message.edit_text(
@@ -822,6 +934,6 @@ async def cancel_inline_operation(callback: CallbackQuery, state: FSMContext):
 @router.message(Command("help"))
 async def help_command(message: Message):
     """Show help message with all commands"""
-    user_lang = get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
+    user_lang = await get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
     
     await message.answer(get_text('help_text', user_lang))
\ No newline at end of file
@@ -1,14 +1,17 @@
 import logging
-import random as rd
 import time
-from aiogram import Router, F
+from array import array
+from aiogram import Router, F, flags
 from aiogram.types import Message, CallbackQuery
 from aiogram.filters import Command
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.fsm.context import FSMContext
 from aiogram.types import InputMediaPhoto
+from aiogram.methods import (
+    SendAnimation, SendAudio, SendDocument, SendMessage, SendPhoto, SendSticker, SendVideo, SendVoice
+)
 
-from database import db
+from async_database import db
 from config import config
 from handlers.commands import display_liker_profile
 from keyboards.inline import (
@@ -17,7 +20,14 @@ from keyboards.inline import (
     get_message_actions_keyboard, 
     get_cancel_keyboard
 )
-from utils.helpers import format_profile_html, format_profile_safe, parse_photos, user_state
+from utils.candidates import get_candidate_ids
+from utils.helpers import (
+    format_profile_html, format_profile_safe, new_match_seed, notify_match, pack_ids, parse_photos, unpack_ids,
+    user_state
+)
+from utils.matching_index import matching_index
+from utils.send_queue import send_queue
+from utils.swipes import swipe_buffer
 from utils.translations import get_text, get_user_language  # ✅ ADD THIS IMPORT
 
 router = Router()
@@ -26,14 +36,50 @@ class MessageStates(StatesGroup):
     waiting_for_message = State()
     waiting_for_media_message = State()  # For non-text messages
 
+async def start_match_session(user_id: int, gender: str) -> array:
+    """Start a new randomized browsing pass and return the ids of its first page"""
+    seed = new_match_seed(user_id)
+    matches, next_cursor = await get_candidate_ids(user_id, gender, seed, limit=config.MATCH_PAGE_SIZE)
+    
+    await user_state.update_data(
+        user_id,
+        {
+            "match_ids": pack_ids(matches),
+            "current_index": 0,
+            "match_seed": seed,
+            "match_cursor": next_cursor
+        }
+    )
+    return matches
+
+async def load_next_match_page(user_id: int) -> array:
+    """Pull the next page of the current pass into the session (empty when the pass is over)"""
+    session = await user_state.get_data(user_id)
+    seed, cursor = session.get('match_seed'), session.get('match_cursor')
+    user_data = await db.get_user(user_id)
+    if not seed or not cursor or not user_data or not user_data.get('gender'):
+        return array('q')
+    
+    matches, next_cursor = await get_candidate_ids(user_id, user_data['gender'], seed, cursor,
+                                                   config.MATCH_PAGE_SIZE)
+    await user_state.update_data(
+        user_id,
+        {
+            "match_ids": pack_ids(matches),
+            "current_index": 0,
+            "match_cursor": next_cursor
+        }
+    )
+    return matches
+
 # Reusable function to show browse profiles that can be called from complete registration function
 async def show_browse_profiles(message: Message, user_id: int = None):
     """Reusable function to show browse profiles"""
     if user_id is None:
         user_id = message.from_user.id
         
-    user_lang = get_user_language(user_id, db)
-    user_data = db.get_user(user_id)
+    user_lang = await get_user_language(user_id, db)
+    user_data = await db.get_user(user_id)
     
     if not user_data:
         await message.answer(get_text('incomplete_registration', user_lang))
@@ -47,38 +93,25 @@ async def show_browse_profiles(message: Message, user_id: int = None):
         await message.answer(get_text('incomplete_profile', user_lang))
         return False
     
-    # Get potential matches
-    matches = db.get_users_for_matching(user_id, user_data['gender'])
-        
-    if not isinstance(matches, list):
-        await message.answer("❌ Error: Could not load matches")
-        return False
+    # Get the first page of potential matches
+    matches = await start_match_session(user_id, user_data['gender'])
     
     if not matches:
         await message.answer(get_text('no_matches_found', user_lang))
         return False
     
-    # ✅ Now shuffle the actual list
-    rd.shuffle(matches)
-    
-    user_state.update_data(
-        user_id,
-        {
-            "current_matches": matches,
-            "current_index": 0
-        }
-    )
-    
     # Show first match
-    await show_next_profile(message, matches, 0)
+    await show_next_profile(message, matches, 0, user_lang, user_id)
     return True
 
 @router.message(F.text == "🔍 Find Matches")
 @router.message(Command("search"))
-async def browse_profiles(message: Message):
+async def browse_profiles(message: Message, user_lang: str = None, db_user: dict = None):
     user_id = message.from_user.id
-    user_lang = get_user_language(user_id, db)
-    user_data = db.get_user(user_id)
+    # Loaded by UserMiddleware when called as a handler
+    if user_lang is None:
+        user_lang = await get_user_language(user_id, db)
+    user_data = db_user or await db.get_user(user_id)
     
     if not user_data:
         await message.answer(get_text('incomplete_registration', user_lang))
@@ -92,40 +125,43 @@ async def browse_profiles(message: Message):
         await message.answer(get_text('incomplete_profile', user_lang))
         return
     
-    # Get potential matches - MAKE SURE IT'S CALLED AS A FUNCTION
-    matches = db.get_users_for_matching(user_id, user_data['gender'])
-        
-    # Check if matches is actually a list
-    if not isinstance(matches, list):
-        await message.answer("❌ Error: Could not load matches")
-        return
+    # Get the first page of potential matches
+    matches = await start_match_session(user_id, user_data['gender'])
     
     if not matches:
         await message.answer(get_text('no_matches_found', user_lang))
         return
     
-    # ✅ Now shuffle the actual list
-    rd.shuffle(matches)
-    
-    user_state.update_data(
-        user_id,
-        {
-            "current_matches": matches,
-            "current_index": 0
-        }
-    )
-    
     # Show first match
-    await show_next_profile(message, matches, 0)
-    
-async def show_next_profile(message: Message, matches: list, current_index: int = 0):
-    user_lang = get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
+    await show_next_profile(message, matches, 0, user_lang)
     
-    if current_index >= len(matches):
+async def show_next_profile(message: Message, match_ids: array, current_index: int = 0,
+                            user_lang: str = None, user_id: int = None):
+    """Show the candidate at ``current_index``, loading its row through the profile cache"""
+    if user_id is None:
+        user_id = message.from_user.id
+    if user_lang is None:
+        user_lang = await get_user_language(user_id, db)  # ✅ GET USER LANGUAGE
+    
+    # Skip candidates deleted or deactivated since their page was fetched,
+    # going on to the next page of the pass when the rest of this one is gone
+    profile = None
+    while True:
+        if current_index >= len(match_ids):
+            match_ids = await load_next_match_page(user_id)
+            current_index = 0
+            if not match_ids:
+                break
+        profile = await db.get_user(match_ids[current_index])
+        if profile and profile.get('is_active'):
+            break
+        profile = None
+        current_index += 1
+    
+    if profile is None:
         await message.answer(get_text('all_profiles_seen', user_lang))
         return
     
-    profile = matches[current_index]
     profile_text = format_profile_html(profile, user_lang)
     
     # Get photos
@@ -150,40 +186,33 @@ async def show_next_profile(message: Message, matches: list, current_index: int
             )
             
             # Send the media group (2 photos together)
-            await message.bot.send_media_group(
-                chat_id=message.chat.id,
-                media=media_group
-            )
+            await send_queue.send_media_group(message.chat.id, media_group)
             
             # Send action buttons separately with engaging text
-            await message.answer(
+            await send_queue.send_message(
+                message.chat.id,
                 get_text('action_prompt', user_lang),
                 reply_markup=get_profile_actions_keyboard(profile['user_id'])
             )
             
         elif photos:
             # Only one photo - send with caption and buttons
-            await message.bot.send_photo(
-                chat_id=message.chat.id,
-                photo=photos[0],
+            await send_queue.send_photo(
+                message.chat.id,
+                photos[0],
                 caption=profile_text,
                 reply_markup=get_profile_actions_keyboard(profile['user_id'])
             )
         else:
             # No photos available
-            await message.answer(
+            await send_queue.send_message(
+                message.chat.id,
                 profile_text,
                 reply_markup=get_profile_actions_keyboard(profile['user_id'])
             )
         
         # Store current match index for navigation
-        user_state.update_data(
-            message.from_user.id, 
-            {
-                "current_matches": matches,
-                "current_index": current_index
-            }
-        )
+        await user_state.update_data(user_id, {"current_index": current_index})
         
     except Exception as e:
         logging.error(f"Error showing profile: {e}")
@@ -194,9 +223,9 @@ async def show_next_profile(message: Message, matches: list, current_index: int
         
         try:
             if photos:
-                await message.bot.send_photo(
-                    chat_id=message.chat.id,
-                    photo=photos[0],
+                await send_queue.send_photo(
+                    message.chat.id,
+                    photos[0],
                     caption=simple_text,
                     reply_markup=get_profile_actions_keyboard(profile['user_id'])
                 )
@@ -207,98 +236,107 @@ async def show_next_profile(message: Message, matches: list, current_index: int
                 )
             
             # Store current match index for navigation
-            user_state.update_data(
-                message.from_user.id, 
-                {
-                    "current_matches": matches,
-                    "current_index": current_index
-                }
-            )
+            await user_state.update_data(user_id, {"current_index": current_index})
         except Exception as e2:
             logging.error(f"Even simple text failed: {e2}")
             await message.answer(get_text('profile_display_error', user_lang))
 
 @router.callback_query(F.data.startswith("like_"))
-async def process_like(callback: CallbackQuery):
+async def process_like(callback: CallbackQuery, user_lang: str, db_user: dict):
     user_id = callback.from_user.id
-    user_lang = get_user_language(user_id, db)  # ✅ GET USER LANGUAGE
     liked_user_id = int(callback.data.split("_")[1])
     
-    # Add like to database
-    success = db.add_like(user_id, liked_user_id)
+    # Record the like (written to the database in the next batch)
+    result = await swipe_buffer.add_like(user_id, liked_user_id)
     
-    if success:
+    if result.added:
         await callback.answer(get_text('like_sent', user_lang))
+        if result.mutual:
+            await notify_match(user_id, liked_user_id)
     else:
         await callback.answer(get_text('already_liked', user_lang))
     
     # Show next profile
-    await show_next_after_action(callback, user_id)
+    await show_next_after_action(callback, user_id, user_lang, db_user)
 
 @router.callback_query(F.data.startswith("skip_"))
-async def process_skip(callback: CallbackQuery):
+async def process_skip(callback: CallbackQuery, user_lang: str, db_user: dict):
     user_id = callback.from_user.id
-    user_lang = get_user_language(user_id, db)  # ✅ GET USER LANGUAGE
+    skipped_user_id = int(callback.data.split("_")[1])
+    
+    # Keep the profile out of this user's candidates for the skip cooldown
+    await swipe_buffer.add_skip(user_id, skipped_user_id)
     
     await callback.answer(get_text('skipped', user_lang))
-    await show_next_after_action(callback, user_id)
+    await show_next_after_action(callback, user_id, user_lang, db_user)
 
-async def show_next_after_action(callback: CallbackQuery, user_id: int):
-    """Show next profile with random shuffle (no cooldown needed)"""
-    user_lang = get_user_language(user_id, db)
-    user_data = user_state.get_data(user_id)
+async def show_next_after_action(callback: CallbackQuery, user_id: int, user_lang: str, db_user: dict = None):
+    """Show next profile, pulling the next candidate page when needed (no cooldown needed)"""
+    user_data = await user_state.get_data(user_id)
     
-    matches = user_data.get('current_matches', [])
+    matches = unpack_ids(user_data.get('match_ids'))
     current_index = user_data.get('current_index', 0) + 1
     
     # Check if matches list is empty
     if not matches:
         await callback.message.answer(get_text('no_matches_found', user_lang))
         # Set current_index to 0 and save to prevent continuous refetch attempts
-        user_state.update_data(user_id, {
-            "current_matches": [],
+        await user_state.update_data(user_id, {
+            "match_ids": pack_ids([]),
             "current_index": 0
         })
         return
         
-    # Check if we've reached the end of current matches
+    # Check if we've reached the end of the current page
     if current_index >= len(matches):
-        await callback.answer(get_text('fetching_matches', user_lang))
-        
-        user_profile_data = db.get_user(user_id)
+        user_profile_data = db_user or await db.get_user(user_id)
         if not user_profile_data or not user_profile_data.get('gender'):
             await callback.message.answer(get_text('profile_setup_required', user_lang))
             return
         
-        fresh_matches = db.get_users_for_matching(user_id, user_profile_data['gender'])
+        gender = user_profile_data['gender']
+        seed = user_data.get('match_seed')
+        fresh_matches, next_cursor = [], None
+        
+        # Pull the next page of the current pass
+        if seed and user_data.get('match_cursor'):
+            fresh_matches, next_cursor = await get_candidate_ids(
+                user_id, gender, seed, user_data['match_cursor'], config.MATCH_PAGE_SIZE
+            )
+        
+        # Pass exhausted - start a new randomized one
+        if not fresh_matches:
+            await callback.answer(get_text('fetching_matches', user_lang))
+            seed = new_match_seed(user_id)
+            fresh_matches, next_cursor = await get_candidate_ids(
+                user_id, gender, seed, limit=config.MATCH_PAGE_SIZE
+            )
         
         if not fresh_matches:
             await callback.message.answer(get_text('no_matches_found', user_lang))
             # Update state to prevent continuous refetch attempts
-            user_state.update_data(user_id, {
-                "current_matches": matches,
-                "current_index": current_index
+            await user_state.update_data(user_id, {
+                "current_index": current_index,
+                "match_cursor": None
             })
             return
         
-        # ✅ Shuffle the fresh matches for random order
-        rd.shuffle(fresh_matches)
         matches = fresh_matches
         current_index = 0
+        await user_state.update_data(user_id, {
+            "match_ids": pack_ids(matches),
+            "match_seed": seed,
+            "match_cursor": next_cursor
+        })
     
-    # Always update state
-    user_state.update_data(user_id, {
-        "current_matches": matches,
-        "current_index": current_index
-    })
-    
-    await show_next_profile(callback.message, matches, current_index)
+    # Shows the profile and stores the index it ended up on
+    await show_next_profile(callback.message, matches, current_index, user_lang, user_id)
     
 @router.callback_query(F.data.startswith("message_"))
 async def process_message_init(callback: CallbackQuery, state: FSMContext):
-    user_lang = get_user_language(callback.from_user.id, db)
+    user_lang = await get_user_language(callback.from_user.id, db)
     to_user_id = int(callback.data.split("_")[1])
-    to_user_data = db.get_user(to_user_id)
+    to_user_data = await db.get_user(to_user_id)
     
     if not to_user_data:
         await callback.answer(get_text('user_not_found', user_lang))
@@ -314,8 +352,9 @@ async def process_message_init(callback: CallbackQuery, state: FSMContext):
     await callback.answer()
 
 @router.message(MessageStates.waiting_for_media_message)
+@flags.once
 async def process_media_message_send(message: Message, state: FSMContext):
-    user_lang = get_user_language(message.from_user.id, db)
+    user_lang = await get_user_language(message.from_user.id, db)
     user_data = await state.get_data()
     to_user_id = user_data.get('to_user_id')
     
@@ -325,7 +364,7 @@ async def process_media_message_send(message: Message, state: FSMContext):
         return
     
     # Check coins
-    user_info = db.get_user(message.from_user.id)
+    user_info = await db.get_user(message.from_user.id)
     user_coins = user_info.get('coins', 0)
     cost = config.COIN_CONFIG['message_cost']
     
@@ -342,7 +381,7 @@ async def process_media_message_send(message: Message, state: FSMContext):
     
     if success:
         # Deduct coins only if message was sent successfully
-        db.deduct_user_coins(message.from_user.id, cost)
+        await db.deduct_user_coins(message.from_user.id, cost)
         await message.answer(get_text('message_sent', user_lang))
     else:
         await message.answer(get_text('message_send_error', user_lang))
@@ -350,10 +389,14 @@ async def process_media_message_send(message: Message, state: FSMContext):
     await state.clear()
 
 async def process_and_send_media_message(message: Message, to_user_id: int, user_lang: str) -> bool:
-    """Process and send any type of message (text, photo, video, voice, sticker, etc.)"""
+    """Process and send any type of message (text, photo, video, voice, sticker, etc.)
+
+    Goes through the rate-limited send queue and waits for delivery, so the
+    message is only saved (and paid for) once it actually went out.
+    """
     try:
-        from_user_data = db.get_user(message.from_user.id)
-        recipient_lang = get_user_language(to_user_id, db)
+        from_user_data = await db.get_user(message.from_user.id)
+        recipient_lang = await get_user_language(to_user_id, db)
         
         # Header text for all message types
         header_text = f"💌 {get_text('new_message_from', recipient_lang, first_name=from_user_data['first_name'], age=from_user_data.get('age', 'N/A'))}:\n\n"
@@ -362,100 +405,100 @@ async def process_and_send_media_message(message: Message, to_user_id: int, user
         if message.text:
             # Text message
             message_text = f"{header_text}\"{message.text}\""
-            await message.bot.send_message(
+            await send_queue.send(SendMessage(
                 chat_id=to_user_id,
                 text=message_text,
                 reply_markup=get_message_actions_keyboard(message.from_user.id)
-            )
+            ))
             # Save to database
-            return db.add_message(message.from_user.id, to_user_id, f"📝 {message.text}")
+            return await db.add_message(message.from_user.id, to_user_id, f"📝 {message.text}")
             
         elif message.photo:
             # Photo with optional caption
             caption = f"{header_text}{message.caption}" if message.caption else header_text
-            await message.bot.send_photo(
+            await send_queue.send(SendPhoto(
                 chat_id=to_user_id,
                 photo=message.photo[-1].file_id,  # Highest quality photo
                 caption=caption,
                 reply_markup=get_message_actions_keyboard(message.from_user.id)
-            )
+            ))
             # Save to database
             caption_text = f"📷 {message.caption}" if message.caption else "📷 Photo"
-            return db.add_message(message.from_user.id, to_user_id, caption_text)
+            return await db.add_message(message.from_user.id, to_user_id, caption_text)
             
         elif message.video:
             # Video with optional caption
             caption = f"{header_text}{message.caption}" if message.caption else header_text
-            await message.bot.send_video(
+            await send_queue.send(SendVideo(
                 chat_id=to_user_id,
                 video=message.video.file_id,
                 caption=caption,
                 reply_markup=get_message_actions_keyboard(message.from_user.id)
-            )
+            ))
             # Save to database
             caption_text = f"🎥 {message.caption}" if message.caption else "🎥 Video"
-            return db.add_message(message.from_user.id, to_user_id, caption_text)
+            return await db.add_message(message.from_user.id, to_user_id, caption_text)
             
         elif message.voice:
             # Voice message with optional caption
             caption = header_text if header_text else None
-            await message.bot.send_voice(
+            await send_queue.send(SendVoice(
                 chat_id=to_user_id,
                 voice=message.voice.file_id,
                 caption=caption,
                 reply_markup=get_message_actions_keyboard(message.from_user.id)
-            )
+            ))
             # Save to database
-            return db.add_message(message.from_user.id, to_user_id, "🎤 Voice message")
+            return await db.add_message(message.from_user.id, to_user_id, "🎤 Voice message")
             
         elif message.audio:
             # Audio file with optional caption
             caption = f"{header_text}{message.caption}" if message.caption else header_text
-            await message.bot.send_audio(
+            await send_queue.send(SendAudio(
                 chat_id=to_user_id,
                 audio=message.audio.file_id,
                 caption=caption,
                 reply_markup=get_message_actions_keyboard(message.from_user.id)
-            )
+            ))
             # Save to database
             caption_text = f"🎵 {message.caption}" if message.caption else "🎵 Audio"
-            return db.add_message(message.from_user.id, to_user_id, caption_text)
+            return await db.add_message(message.from_user.id, to_user_id, caption_text)
             
         elif message.document:
             # Document with optional caption
             caption = f"{header_text}{message.caption}" if message.caption else header_text
-            await message.bot.send_document(
+            await send_queue.send(SendDocument(
                 chat_id=to_user_id,
                 document=message.document.file_id,
                 caption=caption,
                 reply_markup=get_message_actions_keyboard(message.from_user.id)
-            )
+            ))
             # Save to database
             caption_text = f"📄 {message.caption}" if message.caption else "📄 Document"
-            return db.add_message(message.from_user.id, to_user_id, caption_text)
+            return await db.add_message(message.from_user.id, to_user_id, caption_text)
             
         elif message.sticker:
             # Sticker
-            await message.bot.send_sticker(
+            await send_queue.send(SendSticker(
                 chat_id=to_user_id,
                 sticker=message.sticker.file_id,
                 reply_markup=get_message_actions_keyboard(message.from_user.id)
-            )
+            ))
             # Save to database
-            return db.add_message(message.from_user.id, to_user_id, "😊 Sticker")
+            return await db.add_message(message.from_user.id, to_user_id, "😊 Sticker")
             
         elif message.animation:  # GIF
             # GIF with optional caption
             caption = f"{header_text}{message.caption}" if message.caption else header_text
-            await message.bot.send_animation(
+            await send_queue.send(SendAnimation(
                 chat_id=to_user_id,
                 animation=message.animation.file_id,
                 caption=caption,
                 reply_markup=get_message_actions_keyboard(message.from_user.id)
-            )
+            ))
             # Save to database
             caption_text = f"🎬 {message.caption}" if message.caption else "🎬 GIF"
-            return db.add_message(message.from_user.id, to_user_id, caption_text)
+            return await db.add_message(message.from_user.id, to_user_id, caption_text)
             
         else:
             # Unsupported message type
@@ -469,9 +512,9 @@ async def process_and_send_media_message(message: Message, to_user_id: int, user
 
 @router.callback_query(F.data.startswith("reply_"))
 async def process_reply_init(callback: CallbackQuery, state: FSMContext):
-    user_lang = get_user_language(callback.from_user.id, db)
+    user_lang = await get_user_language(callback.from_user.id, db)
     to_user_id = int(callback.data.split("_")[1])
-    to_user_data = db.get_user(to_user_id)
+    to_user_data = await db.get_user(to_user_id)
     
     await state.set_state(MessageStates.waiting_for_media_message)
     await state.update_data(to_user_id=to_user_id)
@@ -485,14 +528,14 @@ async def process_reply_init(callback: CallbackQuery, state: FSMContext):
 
 @router.callback_query(F.data.startswith("view_"))
 async def process_view_profile(callback: CallbackQuery):
-    user_lang = get_user_language(callback.from_user.id, db)  # ✅ GET USER LANGUAGEprint(f"DEBUG: callback.data = {callback.data}")
+    user_lang = await get_user_language(callback.from_user.id, db)  # ✅ GET USER LANGUAGEprint(f"DEBUG: callback.data = {callback.data}")
     
     # Get the last part as user ID
     parts = callback.data.split("_")
     
     # The user ID should be the last part
     profile_user_id = int(parts[-1])
-    profile_data = db.get_user(profile_user_id)
+    profile_data = await db.get_user(profile_user_id)
     
     if not profile_data:
         await callback.answer(get_text('profile_not_found', user_lang))
@@ -519,25 +562,20 @@ async def process_view_profile(callback: CallbackQuery):
                 InputMediaPhoto(media=photos[1])
             )
             
-            await callback.bot.send_media_group(
-                chat_id=callback.from_user.id,
-                media=media_group
-            )
+            await send_queue.send_media_group(callback.from_user.id, media_group)
             
             # If there are more than 2 photos, mention it
             if len(photos) > 2:
-                await callback.message.answer(get_text('total_photos', user_lang, count=len(photos)))
+                await send_queue.send_message(
+                    callback.from_user.id, get_text('total_photos', user_lang, count=len(photos))
+                )
             
         elif photos:
             # Only one photo
-            await callback.bot.send_photo(
-                chat_id=callback.from_user.id,
-                photo=photos[0],
-                caption=profile_text
-            )
+            await send_queue.send_photo(callback.from_user.id, photos[0], caption=profile_text)
         else:
             # No photos
-            await callback.message.answer(profile_text)
+            await send_queue.send_message(callback.from_user.id, profile_text)
         
         await callback.answer()
     except Exception as e:
@@ -546,12 +584,13 @@ async def process_view_profile(callback: CallbackQuery):
 
 @router.callback_query(F.data.startswith("block_"))
 async def process_block(callback: CallbackQuery):
-    user_lang = get_user_language(callback.from_user.id, db)  # ✅ GET USER LANGUAGE
+    user_lang = await get_user_language(callback.from_user.id, db)  # ✅ GET USER LANGUAGE
     blocked_user_id = int(callback.data.split("_")[1])
     
-    success = db.add_block(callback.from_user.id, blocked_user_id)
+    success = await db.add_block(callback.from_user.id, blocked_user_id)
     
     if success:
+        matching_index.record_block(callback.from_user.id, blocked_user_id)
         await callback.answer(get_text('user_blocked', user_lang))
         await callback.message.answer(get_text('block_success', user_lang))
     else:
@@ -559,7 +598,7 @@ async def process_block(callback: CallbackQuery):
 
 @router.callback_query(F.data == "cancel")
 async def process_cancel(callback: CallbackQuery, state: FSMContext):
-    user_lang = get_user_language(callback.from_user.id, db)  # ✅ GET USER LANGUAGE
+    user_lang = await get_user_language(callback.from_user.id, db)  # ✅ GET USER LANGUAGE
     
     await state.clear()
     await callback.message.answer(get_text('cancelled', user_lang))
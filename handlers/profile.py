@@ -2,8 +2,10 @@ from aiogram import Router, F
 from aiogram.types import Message, CallbackQuery, InputMediaPhoto
 from aiogram.filters import Command
 
-from database import db
+from async_database import db
+from config import config
 from utils.helpers import format_profile_safe, parse_photos
+from utils.send_queue import send_queue
 from utils.translations import get_text, get_user_language  # ✅ ADD THIS IMPORT
 
 router = Router()
@@ -11,14 +13,14 @@ router = Router()
 @router.message(F.text == "👤 My Profile")
 @router.message(Command("myprofile"))
 async def show_profile(message: Message):
-    user_lang = get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
-    user_data = db.get_user(message.from_user.id)
+    user_lang = await get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
+    user_data = await db.get_user(message.from_user.id)
     
     if not user_data:
         await message.answer(get_text('incomplete_profile_registration', user_lang))
         return
     
-    profile_text = format_profile_safe(user_data, user_lang)  
+    profile_text = await format_profile_safe(user_data, user_lang)  
     photos = parse_photos(user_data.get('photos', '[]'))
     
     if photos and len(photos) >= 2:
@@ -38,28 +40,93 @@ async def show_profile(message: Message):
             InputMediaPhoto(media=photos[1]) 
         )
         
-        await message.bot.send_media_group(
-            chat_id=message.chat.id,
-            media=media_group
-        )
+        await send_queue.send_media_group(message.chat.id, media_group)
         
         # If there are more than 2 photos, mention it
         if len(photos) > 2:
-            await message.answer(get_text('total_photos_count', user_lang, count=len(photos)))
+            await send_queue.send_message(
+                message.chat.id, get_text('total_photos_count', user_lang, count=len(photos))
+            )
         
     elif photos:
         # Only one photo
-        await message.bot.send_photo(
-            chat_id=message.chat.id,
-            photo=photos[0],
-            caption=profile_text
-        )
+        await send_queue.send_photo(message.chat.id, photos[0], caption=profile_text)
     else:
         # No photos
-        await message.answer(profile_text)
+        await send_queue.send_message(message.chat.id, profile_text)
 
 @router.message(F.text == "💌 My Messages")
 async def show_messages(message: Message):
-    user_lang = get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
+    user_lang = await get_user_language(message.from_user.id, db)  # ✅ GET USER LANGUAGE
+    
+    await message.answer(get_text('messages_empty', user_lang))
+
+def format_preferences(user_data: dict, user_lang: str) -> str:
+    """Current matching preferences of a user"""
+    any_text = get_text('preferences_any', user_lang)
+    min_age, max_age = user_data.get('pref_min_age'), user_data.get('pref_max_age')
+    if min_age or max_age:
+        age = f"{min_age or config.MIN_AGE}-{max_age or config.MAX_AGE}"
+    else:
+        age = any_text
+    return get_text('preferences_current', user_lang,
+                    age=age,
+                    religions=", ".join(user_data.get('pref_religions') or []) or any_text,
+                    cities=", ".join(user_data.get('pref_cities') or []) or any_text)
+
+def parse_age_range(text: str):
+    """(min_age, max_age) from "20-30" (or a single age), None when invalid"""
+    parts = [part.strip() for part in text.replace("–", "-").split("-")]
+    if len(parts) == 1:
+        parts = parts * 2
+    if len(parts) != 2 or not all(part.isdigit() for part in parts):
+        return None
+    min_age, max_age = int(parts[0]), int(parts[1])
+    if not config.MIN_AGE <= min_age <= max_age <= config.MAX_AGE:
+        return None
+    return min_age, max_age
+
+@router.message(Command("preferences"))
+async def preferences_command(message: Message):
+    """Show or change who the user wants to see while browsing"""
+    user_lang = await get_user_language(message.from_user.id, db)
+    user_data = await db.get_user(message.from_user.id)
+    
+    if not user_data:
+        await message.answer(get_text('incomplete_profile_registration', user_lang))
+        return
+    
+    # /preferences <field> <value>
+    parts = message.text.split(maxsplit=2)
+    if len(parts) == 1:
+        await message.answer(format_preferences(user_data, user_lang))
+        return
+    
+    field = parts[1].lower()
+    value = parts[2].strip() if len(parts) > 2 else ""
+    clear = value.lower() in ("", "any")
+    
+    if field == "reset":
+        updates = {'pref_min_age': None, 'pref_max_age': None, 'pref_religions': None, 'pref_cities': None}
+    elif field == "age":
+        age_range = None if clear else parse_age_range(value)
+        if not clear and age_range is None:
+            await message.answer(get_text('preferences_invalid_age', user_lang,
+                                          min_age=config.MIN_AGE, max_age=config.MAX_AGE))
+            return
+        min_age, max_age = age_range or (None, None)
+        updates = {'pref_min_age': min_age, 'pref_max_age': max_age}
+    elif field in ("religion", "city"):
+        values = None if clear else [item.strip() for item in value.split(",") if item.strip()]
+        updates = {'pref_religions' if field == "religion" else 'pref_cities': values or None}
+    else:
+        await message.answer(get_text('preferences_unknown_field', user_lang))
+        return
+    
+    if not await db.update_user_profile(message.from_user.id, **updates):
+        await message.answer(get_text('preferences_failed', user_lang))
+        return
     
-    await message.answer(get_text('messages_empty', user_lang))
\ No newline at end of file
+    user_data.update(updates)
+    await message.answer(get_text('preferences_updated', user_lang))
+    await message.answer(format_preferences(user_data, user_lang))
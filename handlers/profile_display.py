@@ -1,13 +1,13 @@
 import logging
 import time
-from aiogram import Router, F
+from aiogram import Router, F, flags
 from aiogram.types import Message, CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup
 from aiogram.filters import Command
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.fsm.context import FSMContext
 from aiogram.types import InputMediaPhoto
 
-from database import db
+from async_database import db
 from config import config
 from keyboards.inline import (
     get_coin_packages_keyboard,
@@ -15,7 +15,14 @@ from keyboards.inline import (
     get_message_actions_keyboard, 
     get_cancel_keyboard
 )
-from utils.helpers import format_profile_html, format_profile_safe, parse_photos, user_state
+from utils.candidates import get_candidate_ids, get_candidate_page
+from utils.helpers import (
+    format_profile_html, format_profile_safe, new_match_seed, notify_match, pack_ids, parse_photos, unpack_ids,
+    user_state
+)
+from utils.send_queue import send_queue
+from utils.swipes import swipe_buffer
+from storage import kv_store
 from utils.translations import get_text, get_user_language
 
 router = Router()
@@ -23,58 +30,109 @@ router = Router()
 class MessageStates(StatesGroup):
     waiting_for_message = State()
 
-# Global state to track user's current viewing session
-user_viewing_sessions = {}
+def session_key(user_id: int) -> str:
+    """Key of a user's viewing session in the shared key-value store"""
+    return f"viewing_session:{user_id}"
+
+async def save_session(user_id: int, session: dict):
+    """Persist a viewing session (expires after config.SESSION_TTL idle seconds)"""
+    await kv_store.set(session_key(user_id), session, config.SESSION_TTL)
 
-async def start_profile_session(user_id: int, profiles: list, session_type: str = "search"):
-    """Start or update a profile viewing session for a user"""
-    user_viewing_sessions[user_id] = {
-        "profiles": profiles,
+async def start_profile_session(user_id: int, profiles: list, session_type: str = "search",
+                                gender: str = None, seed: str = None, cursor: str = None):
+    """Start or update a profile viewing session for a user
+    
+    Only the profile ids are kept; rows are looked up (through the profile
+    cache) as they are shown. Search sessions hold one candidate page at a
+    time; ``seed`` and ``cursor`` let the next page be pulled when this one
+    runs out.
+    """
+    session = {
+        "profile_ids": pack_ids(profile['user_id'] for profile in profiles),
         "current_index": 0,
+        "offset": 0,
+        "gender": gender,
+        "seed": seed,
+        "cursor": cursor,
         "session_type": session_type,
         "last_fetch_time": time.time(),
         "is_active": True
     }
-    return user_viewing_sessions[user_id]
+    await save_session(user_id, session)
+    return session
+
+async def load_next_page(user_id: int, session: dict) -> bool:
+    """Pull the next candidate page into a search session"""
+    if not session.get("cursor") or not session.get("gender"):
+        return False
+    
+    profile_ids, next_cursor = await get_candidate_ids(
+        user_id, session["gender"], session["seed"], session["cursor"], config.MATCH_PAGE_SIZE
+    )
+    session["cursor"] = next_cursor
+    if not profile_ids:
+        return False
+    
+    session["offset"] += len(unpack_ids(session.get("profile_ids")))
+    session["profile_ids"] = pack_ids(profile_ids)
+    session["current_index"] = 0
+    await save_session(user_id, session)
+    return True
 
 async def get_current_session(user_id: int):
     """Get current viewing session for user"""
-    return user_viewing_sessions.get(user_id)
+    return await kv_store.get(session_key(user_id))
 
 async def update_session_index(user_id: int, new_index: int):
     """Update the current index in user's session"""
-    if user_id in user_viewing_sessions:
-        user_viewing_sessions[user_id]["current_index"] = new_index
+    session = await get_current_session(user_id)
+    if session:
+        session["current_index"] = new_index
+        await save_session(user_id, session)
         return True
     return False
 
 async def clear_session(user_id: int):
     """Clear user's viewing session"""
-    if user_id in user_viewing_sessions:
-        del user_viewing_sessions[user_id]
+    await kv_store.delete(session_key(user_id))
 
 async def show_profile_by_index(message: Message, user_id: int, index: int = None):
     """Show profile at specific index in current session"""
     session = await get_current_session(user_id)
-    user_lang = get_user_language(user_id, db)
+    user_lang = await get_user_language(user_id, db)
     
     if not session or not session.get("is_active"):
         await message.answer(get_text('no_active_session', user_lang))
         return False
     
-    profiles = session["profiles"]
-    
     # Use provided index or current index
     if index is None:
         index = session["current_index"]
     
-    if index >= len(profiles):
-        # End of profiles reached
-        await handle_end_of_profiles(message, user_id, session)
-        return False
+    profile_ids = unpack_ids(session.get("profile_ids"))
     
-    profile = profiles[index]
-    await display_single_profile(message, profile, user_lang, index + 1, len(profiles))
+    while True:
+        if index >= len(profile_ids) and await load_next_page(user_id, session):
+            index = 0
+            profile_ids = unpack_ids(session.get("profile_ids"))
+        
+        if index >= len(profile_ids):
+            # End of profiles reached
+            await handle_end_of_profiles(message, user_id, session)
+            return False
+        
+        profile = await db.get_user(profile_ids[index])
+        if profile and profile.get('is_active'):
+            break
+        # Deactivated or deleted since the page was fetched
+        index += 1
+    
+    await display_single_profile(
+        message, profile, user_lang,
+        session["offset"] + index + 1,
+        session["offset"] + len(profile_ids),
+        has_more=bool(session.get("cursor"))
+    )
     
     # Update the session index
     await update_session_index(user_id, index)
@@ -89,10 +147,11 @@ async def show_next_profile(message: Message, user_id: int):
     next_index = session["current_index"] + 1
     return await show_profile_by_index(message, user_id, next_index)
 
-async def display_single_profile(message: Message, profile: dict, user_lang: str, current_num: int, total: int):
+async def display_single_profile(message: Message, profile: dict, user_lang: str, current_num: int, total: int, has_more: bool = False):
     """Display a single profile with proper formatting"""
+    total_text = f"{total}+" if has_more else f"{total}"
     profile_text = format_profile_html(profile, user_lang)
-    profile_text += f"\n\n📊 {current_num}/{total}"
+    profile_text += f"\n\n📊 {current_num}/{total_text}"
     
     photos = parse_photos(profile.get('photos', '[]'))
     
@@ -109,25 +168,24 @@ async def display_single_profile(message: Message, profile: dict, user_lang: str
                 InputMediaPhoto(media=photos[1])
             )
             
-            await message.bot.send_media_group(
-                chat_id=message.chat.id,
-                media=media_group
-            )
+            await send_queue.send_media_group(message.chat.id, media_group)
             
-            await message.answer(
+            await send_queue.send_message(
+                message.chat.id,
                 get_text('action_prompt', user_lang),
                 reply_markup=get_profile_actions_keyboard(profile['user_id'])
             )
             
         elif photos:
-            await message.bot.send_photo(
-                chat_id=message.chat.id,
-                photo=photos[0],
+            await send_queue.send_photo(
+                message.chat.id,
+                photos[0],
                 caption=profile_text,
                 reply_markup=get_profile_actions_keyboard(profile['user_id'])
             )
         else:
-            await message.answer(
+            await send_queue.send_message(
+                message.chat.id,
                 profile_text,
                 reply_markup=get_profile_actions_keyboard(profile['user_id'])
             )
@@ -138,7 +196,7 @@ async def display_single_profile(message: Message, profile: dict, user_lang: str
         simple_text = f"👤 {profile.get('first_name', get_text('unknown_user', user_lang))}"
         if profile.get('age'):
             simple_text += f", {profile['age']}"
-        simple_text += f"\n\n📊 {current_num}/{total}"
+        simple_text += f"\n\n📊 {current_num}/{total_text}"
         
         await message.answer(
             simple_text,
@@ -147,7 +205,7 @@ async def display_single_profile(message: Message, profile: dict, user_lang: str
 
 async def handle_end_of_profiles(message: Message, user_id: int, session: dict):
     """Handle when user reaches end of profile list"""
-    user_lang = get_user_language(user_id, db)
+    user_lang = await get_user_language(user_id, db)
     session_type = session.get("session_type", "search")
     
     # Check if we should refetch or show cooldown
@@ -173,13 +231,14 @@ async def handle_end_of_profiles(message: Message, user_id: int, session: dict):
         )
         # Keep session active but mark as ended
         session["is_active"] = False
+        await save_session(user_id, session)
     else:
         # Try to refetch new profiles
         await refetch_and_continue(message, user_id, session_type, user_lang)
 
 async def refetch_and_continue(message: Message, user_id: int, session_type: str, user_lang: str):
     """Refetch profiles and continue showing"""
-    user_data = db.get_user(user_id)
+    user_data = await db.get_user(user_id)
     
     if not user_data or not user_data.get('gender'):
         await message.answer(get_text('profile_setup_required', user_lang))
@@ -187,16 +246,21 @@ async def refetch_and_continue(message: Message, user_id: int, session_type: str
         return
     
     # Fetch new matches based on session type
+    seed, next_cursor = None, None
     if session_type == "search":
-        new_profiles = db.get_users_for_matching(user_id, user_data['gender'])
+        seed = new_match_seed(user_id)
+        new_profiles, next_cursor = await get_candidate_page(
+            user_id, user_data['gender'], seed, limit=config.MATCH_PAGE_SIZE
+        )
     elif session_type == "likes":
-        new_profiles = db.get_user_likes(user_id)
+        new_profiles, _, _ = await db.get_user_likes(user_id, limit=config.MATCH_PAGE_SIZE)
     else:
         new_profiles = []
     
     if new_profiles:
         # Start new session with fresh profiles
-        await start_profile_session(user_id, new_profiles, session_type)
+        await start_profile_session(user_id, new_profiles, session_type,
+                                    gender=user_data['gender'], seed=seed, cursor=next_cursor)
         await show_profile_by_index(message, user_id, 0)
         await message.answer(get_text('new_profiles_found', user_lang, count=len(new_profiles)))
     else:
@@ -205,8 +269,8 @@ async def refetch_and_continue(message: Message, user_id: int, session_type: str
 
 async def browse_profiles_for_user(callback: CallbackQuery, user_id: int):
     """Browse profiles for a specific user from callback context"""
-    user_lang = get_user_language(user_id, db)
-    user_data = db.get_user(user_id)
+    user_lang = await get_user_language(user_id, db)
+    user_data = await db.get_user(user_id)
     
     if not user_data:
         await callback.message.answer(get_text('incomplete_registration', user_lang))
@@ -220,29 +284,34 @@ async def browse_profiles_for_user(callback: CallbackQuery, user_id: int):
         await callback.message.answer(get_text('incomplete_profile', user_lang))
         return
     
-    # Get potential matches
-    matches = db.get_users_for_matching(user_id, user_data['gender'])
+    # Get the first page of potential matches
+    seed = new_match_seed(user_id)
+    matches, next_cursor = await get_candidate_page(
+        user_id, user_data['gender'], seed, limit=config.MATCH_PAGE_SIZE
+    )
     
     if not matches:
         await callback.message.answer(get_text('no_matches_found', user_lang))
         return
     
     # Start viewing session
-    await start_profile_session(user_id, matches, "search")
+    await start_profile_session(user_id, matches, "search",
+                                gender=user_data['gender'], seed=seed, cursor=next_cursor)
     await show_profile_by_index(callback.message, user_id, 0)
 
 # Like/Skip handlers - these work for ANY profile source
 @router.callback_query(F.data.startswith("like_"))
-async def process_like(callback: CallbackQuery):
+async def process_like(callback: CallbackQuery, user_lang: str):
     user_id = callback.from_user.id
-    user_lang = get_user_language(user_id, db)
     liked_user_id = int(callback.data.split("_")[1])
     
-    # Add like to database
-    success = db.add_like(user_id, liked_user_id)
+    # Record the like (written to the database in the next batch)
+    result = await swipe_buffer.add_like(user_id, liked_user_id)
     
-    if success:
+    if result.added:
         await callback.answer(get_text('like_sent', user_lang))
+        if result.mutual:
+            await notify_match(user_id, liked_user_id)
     else:
         await callback.answer(get_text('already_liked', user_lang))
     
@@ -250,9 +319,12 @@ async def process_like(callback: CallbackQuery):
     await show_next_profile(callback.message, user_id)
 
 @router.callback_query(F.data.startswith("skip_"))
-async def process_skip(callback: CallbackQuery):
+async def process_skip(callback: CallbackQuery, user_lang: str):
     user_id = callback.from_user.id
-    user_lang = get_user_language(user_id, db)
+    skipped_user_id = int(callback.data.split("_")[1])
+    
+    # Keep the profile out of this user's candidates for the skip cooldown
+    await swipe_buffer.add_skip(user_id, skipped_user_id)
     
     await callback.answer(get_text('skipped', user_lang))
     await show_next_profile(callback.message, user_id)
@@ -261,7 +333,7 @@ async def process_skip(callback: CallbackQuery):
 async def try_again_later(callback: CallbackQuery):
     """Handle try again button"""
     user_id = callback.from_user.id
-    user_lang = get_user_language(user_id, db)
+    user_lang = await get_user_language(user_id, db)
     
     session = await get_current_session(user_id)
     if session:
@@ -272,9 +344,9 @@ async def try_again_later(callback: CallbackQuery):
 # Message handling (keep your existing message handlers)
 @router.callback_query(F.data.startswith("message_"))
 async def process_message_init(callback: CallbackQuery, state: FSMContext):
-    user_lang = get_user_language(callback.from_user.id, db)
+    user_lang = await get_user_language(callback.from_user.id, db)
     to_user_id = int(callback.data.split("_")[1])
-    to_user_data = db.get_user(to_user_id)
+    to_user_data = await db.get_user(to_user_id)
     
     if not to_user_data:
         await callback.answer(get_text('user_not_found', user_lang))
@@ -290,8 +362,9 @@ async def process_message_init(callback: CallbackQuery, state: FSMContext):
     await callback.answer()
 
 @router.message(MessageStates.waiting_for_message)
+@flags.once
 async def process_message_send(message: Message, state: FSMContext):
-    user_lang = get_user_language(message.from_user.id, db)
+    user_lang = await get_user_language(message.from_user.id, db)
     user_data = await state.get_data()
     to_user_id = user_data.get('to_user_id')
     
@@ -301,7 +374,7 @@ async def process_message_send(message: Message, state: FSMContext):
         return
     
     # Check coins and send message (your existing logic)
-    user_info = db.get_user(message.from_user.id)
+    user_info = await db.get_user(message.from_user.id)
     user_coins = user_info.get('coins', 0)
     cost = config.COIN_CONFIG['message_cost']
     
@@ -313,17 +386,17 @@ async def process_message_send(message: Message, state: FSMContext):
         await state.clear()
         return
     
-    success = db.add_message(message.from_user.id, to_user_id, message.text)
+    success = await db.add_message(message.from_user.id, to_user_id, message.text)
     
     if success:
-        db.deduct_user_coins(message.from_user.id, cost)
-        from_user_data = db.get_user(message.from_user.id)
-        recipient_lang = get_user_language(to_user_id, db)
+        await db.deduct_user_coins(message.from_user.id, cost)
+        from_user_data = await db.get_user(message.from_user.id)
+        recipient_lang = await get_user_language(to_user_id, db)
         
         try:
-            await message.bot.send_message(
-                chat_id=to_user_id,
-                text=f"💌 {get_text('new_message_from', recipient_lang, first_name=from_user_data['first_name'], age=from_user_data.get('age', 'N/A'))}:\n\n"
+            await send_queue.send_message(
+                to_user_id,
+                f"💌 {get_text('new_message_from', recipient_lang, first_name=from_user_data['first_name'], age=from_user_data.get('age', 'N/A'))}:\n\n"
                      f"\"{message.text}\"",
                 reply_markup=get_message_actions_keyboard(message.from_user.id)
             )
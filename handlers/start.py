@@ -1,18 +1,20 @@
 import asyncio
 import logging
-from aiogram import Router, F
+from aiogram import Router, F, flags
 from aiogram.types import Message
 from aiogram.filters import CommandStart, Command
 from aiogram.fsm.state import State, StatesGroup
 from aiogram.fsm.context import FSMContext
 # Save photos to database
 from utils.helpers import save_photos
-from database import db
+from async_database import db
 from config import config
 from handlers.matching import browse_profiles, show_browse_profiles
 from keyboards.reply import *
 from keyboards.inline import *
 from utils.helpers import user_state
+from utils.matching_index import matching_index
+from utils.send_queue import ADMIN, send_queue
 from utils.translations import get_text, get_user_language  # ✅ ADD THIS IMPORT
 
 router = Router()
@@ -29,6 +31,7 @@ class RegistrationStates(StatesGroup):
     sharing_photos = State()
 
 @router.message(CommandStart())
+@flags.once
 async def cmd_start(message: Message, state: FSMContext):
     user_id = message.from_user.id
     username = message.from_user.username or get_text('no_username', 'english')
@@ -36,11 +39,11 @@ async def cmd_start(message: Message, state: FSMContext):
     last_name = message.from_user.last_name or ""
     
     # Check if user already exists and has completed registration
-    existing_user = db.get_user(user_id)
+    existing_user = await db.get_user(user_id)
     
     if existing_user and existing_user.get('is_active') and existing_user.get('photos'):
         # User is already registered and has photos - redirect to search/browse
-        user_lang = get_user_language(user_id, db)
+        user_lang = await get_user_language(user_id, db)
         
         await message.answer(
             get_text('welcome_back', user_lang, first_name=first_name),
@@ -55,11 +58,11 @@ async def cmd_start(message: Message, state: FSMContext):
         return
     
     # Add/update user in database (for new users or incomplete registration)
-    db.add_user(user_id, username, first_name, last_name)
+    await db.add_user(user_id, username, first_name, last_name)
     
     # If user exists but hasn't completed registration, check what's missing
     if existing_user:
-        user_lang = get_user_language(user_id, db)
+        user_lang = await get_user_language(user_id, db)
         
         # Check what registration steps are missing
         missing_fields = []
@@ -93,13 +96,10 @@ async def cmd_start(message: Message, state: FSMContext):
                             last_name=last_name,
                             user_id=user_id,
                             username=username)
-        try:
-            await message.bot.send_message(config.ADMIN_ID, admin_text)
-        except Exception as e:
-            print(f"Failed to notify admin: {e}")
+        send_queue.send_message(config.ADMIN_ID, admin_text, priority=ADMIN)
     
     # Get user language for registration (default to English for new users)
-    user_lang = get_user_language(user_id, db)
+    user_lang = await get_user_language(user_id, db)
     
     # Start registration process
     await message.answer(
@@ -119,8 +119,8 @@ async def process_language(message: Message, state: FSMContext):
     }
     
     language = language_map[message.text]
-    db.update_user_language(message.from_user.id, language=language)
-    user_state.update_data(message.from_user.id, {"language": language})
+    await db.update_user_language(message.from_user.id, language=language)
+    await user_state.update_data(message.from_user.id, {"language": language})
     
     # Get the updated language for the user
     user_lang = language
@@ -133,15 +133,15 @@ async def process_language(message: Message, state: FSMContext):
 
 @router.message(RegistrationStates.entering_name)
 async def process_name(message: Message, state: FSMContext):
-    user_lang = get_user_language(message.from_user.id, db)
+    user_lang = await get_user_language(message.from_user.id, db)
     name = message.text.strip()
     
     if len(name) < 2:
         await message.answer(get_text('invalid_name', user_lang))
         return
     
-    db.update_user_profile(message.from_user.id, first_name=name)
-    user_state.update_data(message.from_user.id, {"name": name})
+    await db.update_user_profile(message.from_user.id, first_name=name)
+    await user_state.update_data(message.from_user.id, {"name": name})
     
     await message.answer(
         get_text('contact_prompt', user_lang),
@@ -158,11 +158,11 @@ async def process_name(message: Message, state: FSMContext):
 
 @router.message(RegistrationStates.sharing_contact, F.contact)
 async def process_contact(message: Message, state: FSMContext):
-    user_lang = get_user_language(message.from_user.id, db)
+    user_lang = await get_user_language(message.from_user.id, db)
     contact = message.contact
     phone_number = contact.phone_number
     
-    db.update_user_profile(message.from_user.id, phone=phone_number)
+    await db.update_user_profile(message.from_user.id, phone=phone_number)
     
     await message.answer(
         get_text('age_prompt', user_lang),
@@ -172,7 +172,7 @@ async def process_contact(message: Message, state: FSMContext):
 
 @router.message(RegistrationStates.entering_age)
 async def process_age(message: Message, state: FSMContext):
-    user_lang = get_user_language(message.from_user.id, db)
+    user_lang = await get_user_language(message.from_user.id, db)
     
     try:
         age = int(message.text)
@@ -185,8 +185,8 @@ async def process_age(message: Message, state: FSMContext):
         await message.answer(get_text('invalid_age_number', user_lang))
         return
     
-    db.update_user_profile(message.from_user.id, age=age)
-    user_state.update_data(message.from_user.id, {"age": age})
+    await db.update_user_profile(message.from_user.id, age=age)
+    await user_state.update_data(message.from_user.id, {"age": age})
     
     await message.answer(
         get_text('gender_prompt', user_lang),
@@ -196,11 +196,11 @@ async def process_age(message: Message, state: FSMContext):
 
 @router.message(RegistrationStates.choosing_gender, F.text.in_(["Male", "Female"]))
 async def process_gender(message: Message, state: FSMContext):
-    user_lang = get_user_language(message.from_user.id, db)
+    user_lang = await get_user_language(message.from_user.id, db)
     gender = "male" if message.text == "Male" else "female"
     
-    db.update_user_profile(message.from_user.id, gender=gender)
-    user_state.update_data(message.from_user.id, {"gender": gender})
+    await db.update_user_profile(message.from_user.id, gender=gender)
+    await user_state.update_data(message.from_user.id, {"gender": gender})
     
     await message.answer(
         get_text('religion_prompt', user_lang),
@@ -210,11 +210,11 @@ async def process_gender(message: Message, state: FSMContext):
 
 @router.message(RegistrationStates.choosing_religion)
 async def process_religion(message: Message, state: FSMContext):
-    user_lang = get_user_language(message.from_user.id, db)
+    user_lang = await get_user_language(message.from_user.id, db)
     religion = message.text
     
-    db.update_user_profile(message.from_user.id, religion=religion)
-    user_state.update_data(message.from_user.id, {"religion": religion})
+    await db.update_user_profile(message.from_user.id, religion=religion)
+    await user_state.update_data(message.from_user.id, {"religion": religion})
     
     await message.answer(
         get_text('location_prompt', user_lang),
@@ -224,12 +224,12 @@ async def process_religion(message: Message, state: FSMContext):
 
 @router.message(RegistrationStates.sharing_location, F.location)
 async def process_location(message: Message, state: FSMContext):
-    user_lang = get_user_language(message.from_user.id, db)
+    user_lang = await get_user_language(message.from_user.id, db)
     location = message.location
     latitude = location.latitude
     longitude = location.longitude
     
-    db.update_user_profile(
+    await db.update_user_profile(
         message.from_user.id, 
         latitude=latitude, 
         longitude=longitude,
@@ -244,11 +244,11 @@ async def process_location(message: Message, state: FSMContext):
 
 @router.message(RegistrationStates.sharing_location, F.text)
 async def process_city(message: Message, state: FSMContext):
-    user_lang = get_user_language(message.from_user.id, db)
+    user_lang = await get_user_language(message.from_user.id, db)
     city = message.text
     
-    db.update_user_profile(message.from_user.id, city=city)
-    user_state.update_data(message.from_user.id, {"city": city})
+    await db.update_user_profile(message.from_user.id, city=city)
+    await user_state.update_data(message.from_user.id, {"city": city})
     
     await message.answer(
         get_text('bio_prompt', user_lang),
@@ -258,23 +258,23 @@ async def process_city(message: Message, state: FSMContext):
 
 @router.message(RegistrationStates.entering_bio)
 async def process_bio(message: Message, state: FSMContext):
-    user_lang = get_user_language(message.from_user.id, db)
+    user_lang = await get_user_language(message.from_user.id, db)
     bio = message.text
     
-    db.update_user_profile(message.from_user.id, bio=bio)
-    user_state.update_data(message.from_user.id, {"bio": bio})
+    await db.update_user_profile(message.from_user.id, bio=bio)
+    await user_state.update_data(message.from_user.id, {"bio": bio})
     
     await message.answer(
         get_text('photos_prompt', user_lang),
         reply_markup=remove_keyboard
     )
     await state.set_state(RegistrationStates.sharing_photos)
-    user_state.update_data(message.from_user.id, {"photos": []})
+    await user_state.update_data(message.from_user.id, {"photos": []})
 
 @router.message(RegistrationStates.sharing_photos, F.photo)
 async def process_photos(message: Message, state: FSMContext):
     user_id = message.from_user.id
-    user_lang = get_user_language(user_id, db)
+    user_lang = await get_user_language(user_id, db)
     user_data = await state.get_data()
     photos = user_data.get('photos', [])
     
@@ -305,7 +305,7 @@ async def process_photos(message: Message, state: FSMContext):
 @router.message(RegistrationStates.sharing_photos, Command("done"))
 async def complete_manually(message: Message, state: FSMContext):
     user_id = message.from_user.id
-    user_lang = get_user_language(user_id, db)
+    user_lang = await get_user_language(user_id, db)
     user_data = await state.get_data()
     photos = user_data.get('photos', [])
     
@@ -339,15 +339,18 @@ async def complete_registration(message: Message, state: FSMContext, photos: lis
     
     # Save photos to database
     photos_str = save_photos(photos)
-    success = db.update_user_profile(user_id, photos=photos_str)
+    success = await db.update_user_profile(user_id, photos=photos_str)
     
     if success:
         # Award free coins
         free_coins = config.COIN_CONFIG['message_cost'] * config.COIN_CONFIG['free_messages']
-        db.add_user_coins(user_id, free_coins)
+        await db.add_user_coins(user_id, free_coins)
+        
+        # Make the new profile browsable without waiting for an index rebuild
+        await matching_index.refresh_user(user_id)
         
         # Get the user's registered name from database
-        user = db.get_user(user_id)
+        user = await db.get_user(user_id)
         registered_name = user.get('first_name', 'User')  # Fallback to 'User' if not found
             
         await message.answer(
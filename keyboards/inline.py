@@ -11,6 +11,22 @@ def get_profile_actions_keyboard(profile_user_id: int):
     keyboard.adjust(3)
     return keyboard.as_markup()
 
+# Sent to both users of a new match
+def get_match_keyboard(match_user_id: int):
+    keyboard = InlineKeyboardBuilder()
+    keyboard.add(InlineKeyboardButton(text="💌 Message", callback_data=f"message_{match_user_id}"))
+    return keyboard.as_markup()
+
+# Previous/next buttons under a page of /matches or /likes
+def get_page_navigation_keyboard(prev_data: str = None, next_data: str = None):
+    keyboard = InlineKeyboardBuilder()
+    if prev_data:
+        keyboard.add(InlineKeyboardButton(text="⬅️ Previous", callback_data=prev_data))
+    if next_data:
+        keyboard.add(InlineKeyboardButton(text="Next ➡️", callback_data=next_data))
+    keyboard.adjust(2)
+    return keyboard.as_markup()
+
 # Message actions
 def get_message_actions_keyboard(from_user_id: int, message_id: int = None):
     keyboard = InlineKeyboardBuilder()
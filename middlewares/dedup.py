@@ -0,0 +1,92 @@
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Set
+
+from aiogram import BaseMiddleware
+from aiogram.dispatcher.flags import get_flag
+from aiogram.types import TelegramObject, Update
+
+from async_database import db
+from config import config
+
+
+class RecentUpdates:
+    """The last ``maxsize`` update ids seen, oldest forgotten first"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.ids: Set[int] = set()
+        self.order: Deque[int] = deque()
+
+    def add(self, update_id: int) -> bool:
+        """Remember an update id; False if it is already there"""
+        if update_id in self.ids:
+            return False
+        self.ids.add(update_id)
+        self.order.append(update_id)
+        if len(self.order) > self.maxsize:
+            self.ids.discard(self.order.popleft())
+        return True
+
+
+class UpdateDedupMiddleware(BaseMiddleware):
+    """Drop updates delivered again (webhook retries) before any work is done.
+
+    Registered as the first of our outer update middlewares, it checks the
+    update id against the last ``RECENT_UPDATES_SIZE`` seen by this
+    process. With several workers a user's updates always reach the same
+    one, so its memory is enough until a restart.
+    """
+
+    def __init__(self, maxsize: int = None):
+        self.recent = RecentUpdates(maxsize or config.RECENT_UPDATES_SIZE)
+        self.duplicates = 0
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        if isinstance(event, Update) and not self.recent.add(event.update_id):
+            self.duplicates += 1
+            logging.info(f"♻️ Dropped repeated update {event.update_id}")
+            return None
+        return await handler(event, data)
+
+
+class OnceMiddleware(BaseMiddleware):
+    """Run handlers flagged ``@flags.once`` at most once per update, across restarts.
+
+    For handlers that move coins or notify the admin: the update id is
+    recorded in ``processed_updates`` before the handler runs, and a
+    delivery whose id is already there is dropped. If the handler raises,
+    the record is deleted again, so a redelivery of the update is retried.
+    """
+
+    def __init__(self):
+        self.duplicates = 0
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        update = data.get('event_update')
+        if not get_flag(data, 'once') or update is None:
+            return await handler(event, data)
+        if not await db.claim_update(update.update_id):
+            self.duplicates += 1
+            logging.warning(f"♻️ Dropped repeated update {update.update_id} for a once-only handler")
+            return None
+        try:
+            return await handler(event, data)
+        except Exception:
+            await db.release_update(update.update_id)
+            raise
+
+
+# Global deduplication middlewares (see bot.py)
+update_dedup = UpdateDedupMiddleware()
+once_middleware = OnceMiddleware()
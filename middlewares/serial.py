@@ -0,0 +1,167 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from aiogram import BaseMiddleware
+from aiogram.fsm.middleware import FSMContextMiddleware
+from aiogram.types import TelegramObject, Update
+
+from config import config
+
+
+class UserLane:
+    """Updates of one user: the one being handled and those waiting for it"""
+
+    def __init__(self):
+        self.lock = asyncio.Lock()  # FIFO: updates run in arrival order
+        self.waiting = 0
+        self.taps: Set[Tuple[int, str]] = set()  # (message id, callback data) queued or running
+
+
+class UserSerialMiddleware(BaseMiddleware):
+    """Handle one update at a time per user, and different users in parallel.
+
+    Registered as an outer update middleware ahead of aiogram's FSM
+    middleware, so each update reads the state and browsing session the
+    previous one left. At most ``USER_QUEUE_DEPTH`` updates wait per user;
+    beyond that, and for a callback button tapped again while the same tap
+    is still queued or running, the update is dropped (the button is
+    answered so the client stops spinning). Messages of a user in an FSM
+    state, such as an album sent while registering, may wait up to
+    ``USER_FSM_QUEUE_DEPTH``; the state is read through ``fsm``, aiogram's
+    FSM middleware, set when the dispatcher is built. ``drain`` waits for
+    every update in progress, for shutting down without cutting handlers off.
+    """
+
+    def __init__(self, max_depth: int = None, fsm_max_depth: int = None):
+        self.max_depth = max_depth or config.USER_QUEUE_DEPTH
+        self.fsm_max_depth = max(fsm_max_depth or config.USER_FSM_QUEUE_DEPTH, self.max_depth)
+        self.fsm: Optional[FSMContextMiddleware] = None
+        self.lanes: Dict[int, UserLane] = {}
+        self.queued = 0  # waiting, all users together
+        self.peak_queued = 0
+        self.peak_depth = 0  # deepest single-user queue seen
+        self.handled = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.active = 0  # updates queued or running
+        self.idle = asyncio.Event()
+        self.idle.set()
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        self.active += 1
+        self.idle.clear()
+        try:
+            return await self.handle_in_lane(handler, event, data)
+        finally:
+            self.active -= 1
+            if not self.active:
+                self.idle.set()
+
+    async def handle_in_lane(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        from_user = data.get('event_from_user')
+        if from_user is None:
+            return await handler(event, data)
+
+        lane = self.lanes.get(from_user.id)
+        if lane is None:
+            lane = self.lanes[from_user.id] = UserLane()
+
+        tap = self.tap_key(event)
+        if tap is not None and tap in lane.taps:
+            self.coalesced += 1
+            logging.warning(f"⚠️ Dropped a repeated tap from user {from_user.id}: the same one is in progress")
+            await self.answer_dropped(event)
+            return None
+        if lane.waiting >= self.max_depth and not await self.in_conversation(event, data, lane):
+            self.dropped += 1
+            logging.warning(f"⚠️ Dropped an update from user {from_user.id}: {lane.waiting} already waiting")
+            await self.answer_dropped(event)
+            return None
+
+        if tap is not None:
+            lane.taps.add(tap)
+        lane.waiting += 1
+        self.queued += 1
+        self.peak_depth = max(self.peak_depth, lane.waiting)
+        self.peak_queued = max(self.peak_queued, self.queued)
+        waiting = True
+        try:
+            async with lane.lock:
+                lane.waiting -= 1
+                self.queued -= 1
+                waiting = False
+                self.handled += 1
+                return await handler(event, data)
+        finally:
+            if waiting:  # cancelled before its turn
+                lane.waiting -= 1
+                self.queued -= 1
+            lane.taps.discard(tap)
+            if not lane.waiting and not lane.lock.locked() and self.lanes.get(from_user.id) is lane:
+                del self.lanes[from_user.id]
+
+    async def in_conversation(self, event: TelegramObject, data: Dict[str, Any], lane: UserLane) -> bool:
+        """Whether a message past the queue depth comes from a user in an FSM state"""
+        if self.fsm is None or lane.waiting >= self.fsm_max_depth:
+            return False
+        if not isinstance(event, Update) or event.message is None:
+            return False
+        try:
+            context = self.fsm.resolve_event_context(data['bot'], data)
+            return context is not None and await context.get_state() is not None
+        except Exception as e:
+            logging.error(f"Error reading FSM state of a queued message: {e}")
+            return False
+
+    @staticmethod
+    def tap_key(event: TelegramObject) -> Optional[Tuple[int, str]]:
+        """Identify a callback button press, so repeated taps can be coalesced"""
+        callback = event.callback_query if isinstance(event, Update) else None
+        if callback is None or callback.message is None or callback.data is None:
+            return None
+        return callback.message.message_id, callback.data
+
+    @staticmethod
+    async def answer_dropped(event: TelegramObject):
+        if isinstance(event, Update) and event.callback_query is not None:
+            try:
+                await event.callback_query.answer()
+            except Exception as e:
+                logging.error(f"Error answering dropped callback: {e}")
+
+    async def drain(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for the updates in progress; False if some are left"""
+        try:
+            await asyncio.wait_for(self.idle.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            logging.warning(f"⚠️ {self.active} updates still in progress after {timeout}s")
+            return False
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for monitoring the per-user queues"""
+        return {
+            'users': len(self.lanes),
+            'active': self.active,
+            'queued': self.queued,
+            'peak_queued': self.peak_queued,
+            'peak_depth': self.peak_depth,
+            'handled': self.handled,
+            'dropped': self.dropped,
+            'coalesced': self.coalesced,
+        }
+
+
+# Global per-user update serializer (see bot.py)
+user_serial = UserSerialMiddleware()
@@ -0,0 +1,27 @@
+from typing import Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+
+from async_database import db
+
+
+class UserMiddleware(BaseMiddleware):
+    """Load the sender's user row once per update.
+
+    Handlers can take it as ``db_user`` (None for unregistered users) and
+    their language as ``user_lang`` instead of querying for them again.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        from_user = data.get('event_from_user')
+        if from_user is not None:
+            user = await db.get_user(from_user.id)
+            data['db_user'] = user
+            data['user_lang'] = user.get('language', 'english') if user else 'english'
+        return await handler(event, data)
@@ -0,0 +1,370 @@
+import logging
+import psycopg2
+
+# Versioned schema migrations.
+#
+# Each step is (version, description, statements). Steps run once, in
+# order, and the version is recorded in schema_version inside the same
+# transaction. When the database is already current, startup costs a
+# single query. Add new steps at the end and never edit an applied one.
+
+# Key for pg_advisory_xact_lock so concurrent workers don't migrate twice
+MIGRATION_LOCK_ID = 4_471_001
+
+MIGRATIONS = [
+    (1, "Base schema", [
+        # Users table with all possible columns
+        '''
+        CREATE TABLE IF NOT EXISTS users (
+            user_id BIGINT PRIMARY KEY,
+            username TEXT,
+            first_name TEXT,
+            last_name TEXT,
+            language TEXT DEFAULT 'english',
+            phone TEXT,
+            age INTEGER,
+            gender TEXT,
+            religion TEXT,
+            city TEXT,
+            latitude REAL,
+            longitude REAL,
+            bio TEXT,
+            photos TEXT,
+            is_active BOOLEAN DEFAULT TRUE,
+            coins INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        # Columns added after the first deployments
+        '''
+        ALTER TABLE users
+            ADD COLUMN IF NOT EXISTS last_name TEXT,
+            ADD COLUMN IF NOT EXISTS language TEXT,
+            ADD COLUMN IF NOT EXISTS phone TEXT,
+            ADD COLUMN IF NOT EXISTS age INTEGER,
+            ADD COLUMN IF NOT EXISTS gender TEXT,
+            ADD COLUMN IF NOT EXISTS religion TEXT,
+            ADD COLUMN IF NOT EXISTS city TEXT,
+            ADD COLUMN IF NOT EXISTS latitude REAL,
+            ADD COLUMN IF NOT EXISTS longitude REAL,
+            ADD COLUMN IF NOT EXISTS bio TEXT,
+            ADD COLUMN IF NOT EXISTS photos TEXT,
+            ADD COLUMN IF NOT EXISTS is_active BOOLEAN,
+            ADD COLUMN IF NOT EXISTS coins INTEGER
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS likes (
+            id SERIAL PRIMARY KEY,
+            user_id BIGINT,
+            liked_user_id BIGINT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users (user_id) ON DELETE CASCADE,
+            FOREIGN KEY (liked_user_id) REFERENCES users (user_id) ON DELETE CASCADE,
+            UNIQUE(user_id, liked_user_id)
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS messages (
+            id SERIAL PRIMARY KEY,
+            from_user_id BIGINT,
+            to_user_id BIGINT,
+            message_text TEXT,
+            message_type VARCHAR(20) DEFAULT 'text',
+            media_file_id TEXT,
+            is_read BOOLEAN DEFAULT FALSE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (from_user_id) REFERENCES users (user_id) ON DELETE CASCADE,
+            FOREIGN KEY (to_user_id) REFERENCES users (user_id) ON DELETE CASCADE
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS blocks (
+            id SERIAL PRIMARY KEY,
+            user_id BIGINT,
+            blocked_user_id BIGINT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users (user_id) ON DELETE CASCADE,
+            FOREIGN KEY (blocked_user_id) REFERENCES users (user_id) ON DELETE CASCADE,
+            UNIQUE(user_id, blocked_user_id)
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS complaints (
+            id SERIAL PRIMARY KEY,
+            user_id BIGINT,
+            reported_user_id BIGINT,
+            complaint_type TEXT,
+            complaint_text TEXT,
+            status TEXT DEFAULT 'pending',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users (user_id) ON DELETE CASCADE,
+            FOREIGN KEY (reported_user_id) REFERENCES users (user_id) ON DELETE CASCADE
+        )
+        ''',
+        # Payments table for tracking payment requests
+        '''
+        CREATE TABLE IF NOT EXISTS payments (
+            id SERIAL PRIMARY KEY,
+            user_id BIGINT,
+            package_name TEXT,
+            coins_amount INTEGER,
+            price REAL,
+            status TEXT DEFAULT 'pending', -- pending, approved, rejected
+            screenshot_file_id TEXT,
+            admin_notes TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            processed_at TIMESTAMP,
+            processed_by BIGINT,
+            FOREIGN KEY (user_id) REFERENCES users (user_id) ON DELETE CASCADE
+        )
+        ''',
+    ]),
+    (2, "Indexes for matching, likes, blocks and messages", [
+        # Candidate browsing filters on gender + is_active
+        'CREATE INDEX IF NOT EXISTS idx_users_gender_active ON users (gender, is_active)',
+        # "Who liked me", like counts and reverse-like (mutual match) lookups.
+        # likes(user_id) is already covered by UNIQUE(user_id, liked_user_id).
+        'CREATE INDEX IF NOT EXISTS idx_likes_liked_user ON likes (liked_user_id, user_id)',
+        # blocks(user_id) is covered by UNIQUE(user_id, blocked_user_id);
+        # the reverse side is needed by ON DELETE CASCADE
+        'CREATE INDEX IF NOT EXISTS idx_blocks_blocked_user ON blocks (blocked_user_id)',
+        # Inbox lookups, and the cascade from either side on account deletion
+        'CREATE INDEX IF NOT EXISTS idx_messages_to_user ON messages (to_user_id, created_at)',
+        'CREATE INDEX IF NOT EXISTS idx_messages_from_user ON messages (from_user_id)',
+    ]),
+    (3, "Like and match counters maintained by triggers", [
+        '''
+        ALTER TABLE users
+            ADD COLUMN IF NOT EXISTS likes_count INTEGER NOT NULL DEFAULT 0,
+            ADD COLUMN IF NOT EXISTS matches_count INTEGER NOT NULL DEFAULT 0
+        ''',
+        # Every insert/delete on likes (including ON DELETE CASCADE from an
+        # account deletion) adjusts the liked user's likes_count and, when the
+        # reverse like exists, both users' matches_count. Locking the pair of
+        # user rows in id order serializes A->B against B->A, so a match made
+        # by two concurrent likes is counted exactly once.
+        #
+        # Deletes are counted BEFORE the row goes: when an account deletion
+        # cascades to both A->B and B->A, AFTER triggers would only run once
+        # both rows are gone and never see the match.
+        '''
+        CREATE OR REPLACE FUNCTION update_like_counters() RETURNS trigger AS $$
+        DECLARE
+            liker BIGINT;
+            liked BIGINT;
+            delta INTEGER;
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                liker := NEW.user_id;
+                liked := NEW.liked_user_id;
+                delta := 1;
+            ELSE
+                liker := OLD.user_id;
+                liked := OLD.liked_user_id;
+                delta := -1;
+            END IF;
+
+            PERFORM 1 FROM users WHERE user_id IN (liker, liked)
+                ORDER BY user_id FOR NO KEY UPDATE;
+
+            UPDATE users SET likes_count = likes_count + delta WHERE user_id = liked;
+
+            IF EXISTS (SELECT 1 FROM likes WHERE user_id = liked AND liked_user_id = liker) THEN
+                UPDATE users SET matches_count = matches_count + delta
+                WHERE user_id IN (liker, liked);
+            END IF;
+            IF TG_OP = 'DELETE' THEN
+                RETURN OLD;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        ''',
+        'DROP TRIGGER IF EXISTS likes_counters_insert ON likes',
+        '''
+        CREATE TRIGGER likes_counters_insert
+            AFTER INSERT ON likes
+            FOR EACH ROW EXECUTE FUNCTION update_like_counters()
+        ''',
+        'DROP TRIGGER IF EXISTS likes_counters_delete ON likes',
+        '''
+        CREATE TRIGGER likes_counters_delete
+            BEFORE DELETE ON likes
+            FOR EACH ROW EXECUTE FUNCTION update_like_counters()
+        ''',
+        # Backfill from the existing likes
+        '''
+        UPDATE users u SET
+            likes_count = (SELECT COUNT(*) FROM likes l WHERE l.liked_user_id = u.user_id),
+            matches_count = (
+                SELECT COUNT(*) FROM likes l1
+                INNER JOIN likes l2 ON l1.user_id = l2.liked_user_id AND l1.liked_user_id = l2.user_id
+                WHERE l1.liked_user_id = u.user_id
+            )
+        ''',
+    ]),
+    (4, "Key-value store for FSM state and browsing sessions", [
+        '''
+        CREATE TABLE IF NOT EXISTS kv_store (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            expires_at TIMESTAMP
+        )
+        ''',
+        # Expired entries are purged periodically
+        'CREATE INDEX IF NOT EXISTS idx_kv_store_expires ON kv_store (expires_at) WHERE expires_at IS NOT NULL',
+    ]),
+    (5, "Index for nearby candidate lookups", [
+        # Bounding-box scans of get_nearby_candidates: range on latitude,
+        # longitude checked from the index
+        '''
+        CREATE INDEX IF NOT EXISTS idx_users_gender_location ON users (gender, latitude, longitude)
+            WHERE is_active = TRUE AND latitude IS NOT NULL AND longitude IS NOT NULL
+        ''',
+    ]),
+    (6, "Matching preferences", [
+        # What a user wants to see; NULL means any
+        '''
+        ALTER TABLE users
+            ADD COLUMN IF NOT EXISTS pref_min_age INTEGER,
+            ADD COLUMN IF NOT EXISTS pref_max_age INTEGER,
+            ADD COLUMN IF NOT EXISTS pref_religions TEXT[],
+            ADD COLUMN IF NOT EXISTS pref_cities TEXT[]
+        ''',
+        # Candidate filters of build_preference_conditions, on the
+        # expressions it compares
+        'CREATE INDEX IF NOT EXISTS idx_users_gender_age ON users (gender, age) WHERE is_active = TRUE',
+        '''
+        CREATE INDEX IF NOT EXISTS idx_users_gender_religion_age
+            ON users (gender, LOWER(TRIM(religion)), age) WHERE is_active = TRUE
+        ''',
+        '''
+        CREATE INDEX IF NOT EXISTS idx_users_gender_city_age
+            ON users (gender, LOWER(TRIM(city)), age) WHERE is_active = TRUE
+        ''',
+    ]),
+    (7, "Random sampling key for candidate pages", [
+        # random() is volatile, so every existing row gets its own value
+        'ALTER TABLE users ADD COLUMN IF NOT EXISTS random_key DOUBLE PRECISION NOT NULL DEFAULT random()',
+        '''
+        CREATE INDEX IF NOT EXISTS idx_users_gender_random_key
+            ON users (gender, random_key, user_id) WHERE is_active = TRUE
+        ''',
+    ]),
+    (8, "Skipped profiles", [
+        '''
+        CREATE TABLE IF NOT EXISTS swipes (
+            user_id BIGINT REFERENCES users (user_id) ON DELETE CASCADE,
+            target_user_id BIGINT REFERENCES users (user_id) ON DELETE CASCADE,
+            swiped_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (user_id, target_user_id)
+        )
+        ''',
+        # Cascade from the skipped side, and the periodic purge
+        'CREATE INDEX IF NOT EXISTS idx_swipes_target_user ON swipes (target_user_id)',
+        'CREATE INDEX IF NOT EXISTS idx_swipes_swiped_at ON swipes (swiped_at)',
+    ]),
+    (9, "Likes received in like-time order", [
+        # Pages of /likes walk this newest first (see build_like_list_query)
+        'CREATE INDEX IF NOT EXISTS idx_likes_liked_user_created ON likes (liked_user_id, created_at, user_id)',
+    ]),
+    (10, "Updates handled by once-only handlers", [
+        '''
+        CREATE TABLE IF NOT EXISTS processed_updates (
+            update_id BIGINT PRIMARY KEY,
+            processed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        'CREATE INDEX IF NOT EXISTS idx_processed_updates_at ON processed_updates (processed_at)',
+    ]),
+    # Adds a like and tells whether it completes a match. It takes the pair
+    # lock of the counter triggers before inserting, so of A->B and B->A
+    # arriving together the second waits for the first to commit, and
+    # exactly one of them reports the match.
+    (11, "Like insert reporting mutual matches", [
+        '''
+        CREATE OR REPLACE FUNCTION add_like_and_match(liker BIGINT, liked BIGINT,
+                                                      OUT added BOOLEAN, OUT mutual BOOLEAN) AS $$
+        BEGIN
+            PERFORM 1 FROM users WHERE user_id IN (liker, liked)
+                ORDER BY user_id FOR NO KEY UPDATE;
+
+            INSERT INTO likes (user_id, liked_user_id) VALUES (liker, liked)
+                ON CONFLICT (user_id, liked_user_id) DO NOTHING;
+            added := FOUND;
+
+            mutual := added AND EXISTS (
+                SELECT 1 FROM likes WHERE user_id = liked AND liked_user_id = liker
+            );
+        END;
+        $$ LANGUAGE plpgsql
+        ''',
+    ]),
+    # The matching index keeps coordinates as doubles: with REAL columns its
+    # distances differed from the SQL ones in the last digits, where a
+    # nearby pass hands its cursor over from one to the other
+    (12, "Double precision coordinates", [
+        '''
+        ALTER TABLE users
+            ALTER COLUMN latitude TYPE DOUBLE PRECISION,
+            ALTER COLUMN longitude TYPE DOUBLE PRECISION
+        ''',
+    ]),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn) -> int:
+    """Current schema version (0 when the database predates migrations)"""
+    autocommit = conn.autocommit
+    conn.autocommit = True  # a single round-trip, no BEGIN/COMMIT
+    cursor = conn.cursor()
+    try:
+        cursor.execute('SELECT COALESCE(MAX(version), 0) FROM schema_version')
+        return cursor.fetchone()[0]
+    except psycopg2.errors.UndefinedTable:
+        return 0
+    finally:
+        cursor.close()
+        conn.autocommit = autocommit
+
+
+def migrate(conn):
+    """Apply every pending migration step on ``conn``"""
+    if get_schema_version(conn) >= LATEST_VERSION:
+        logging.info(f"✅ Database schema is current (version {LATEST_VERSION})")
+        return
+
+    cursor = conn.cursor()
+    try:
+        # Serialize concurrent workers, then re-read the version under the lock
+        cursor.execute('SELECT pg_advisory_xact_lock(%s)', (MIGRATION_LOCK_ID,))
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                description TEXT,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        cursor.execute('SELECT COALESCE(MAX(version), 0) FROM schema_version')
+        current_version = cursor.fetchone()[0]
+
+        for version, description, statements in MIGRATIONS:
+            if version <= current_version:
+                continue
+            for statement in statements:
+                cursor.execute(statement)
+            cursor.execute('''
+                INSERT INTO schema_version (version, description)
+                VALUES (%s, %s)
+            ''', (version, description))
+            logging.info(f"✅ Applied migration {version}: {description}")
+
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        logging.error(f"❌ Database migration failed: {e}")
+        raise
+    finally:
+        cursor.close()
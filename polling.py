@@ -0,0 +1,100 @@
+import asyncio
+import logging
+from typing import Set
+
+from aiogram import Bot, Dispatcher
+from aiogram.exceptions import TelegramUnauthorizedError
+from aiogram.methods import GetUpdates
+from aiogram.types import Update
+from aiogram.utils.backoff import Backoff, BackoffConfig
+
+from config import config
+from utils.send_queue import send_queue
+
+BACKOFF_CONFIG = BackoffConfig(min_delay=1.0, max_delay=30.0, factor=1.5, jitter=0.1)
+
+
+class PollingRunner:
+    """Fetch updates with long polling and handle them concurrently.
+
+    Each ``getUpdates`` call takes up to ``POLLING_BATCH_SIZE`` updates,
+    which are handled as separate tasks, at most ``POLLING_CONCURRENCY`` at
+    a time. No new batch is fetched while all slots are busy or while the
+    send queue holds more than ``POLLING_MAX_PENDING_SENDS`` messages, so
+    a backlog waits at Telegram instead of in memory. ``stop`` lets the
+    running handlers finish and confirms the handled updates to Telegram.
+    """
+
+    def __init__(self, dp: Dispatcher, bot: Bot, batch_size: int = None, concurrency: int = None,
+                 timeout: int = None):
+        self.dp = dp
+        self.bot = bot
+        self.batch_size = batch_size or config.POLLING_BATCH_SIZE
+        self.concurrency = concurrency or config.POLLING_CONCURRENCY
+        self.timeout = timeout or config.POLLING_TIMEOUT
+        self.slots = asyncio.Semaphore(self.concurrency)
+        self.tasks: Set[asyncio.Task] = set()
+        self.offset = None  # id of the next update to fetch
+        self.handled = 0
+        self.failed = 0
+
+    async def run(self):
+        """Poll until cancelled"""
+        backoff = Backoff(config=BACKOFF_CONFIG)
+        get_updates = GetUpdates(limit=self.batch_size, timeout=self.timeout,
+                                 allowed_updates=self.dp.resolve_used_update_types())
+        # Wait longer than Telegram holds the request open
+        request_timeout = int(self.bot.session.timeout + self.timeout)
+        while True:
+            await self.wait_for_senders()
+            get_updates.offset = self.offset
+            try:
+                updates = await self.bot(get_updates, request_timeout=request_timeout)
+            except TelegramUnauthorizedError:
+                raise
+            except Exception as e:
+                logging.error(f"Error fetching updates: {e}")
+                await backoff.asleep()
+                continue
+            backoff.reset()
+
+            for update in updates:
+                await self.slots.acquire()
+                task = asyncio.create_task(self.handle(update))
+                self.tasks.add(task)
+                task.add_done_callback(self.task_done)
+                self.offset = update.update_id + 1
+
+    async def wait_for_senders(self):
+        """Hold off fetching while the send queue is saturated"""
+        while send_queue.pending() > config.POLLING_MAX_PENDING_SENDS:
+            await asyncio.sleep(0.1)
+
+    async def handle(self, update: Update):
+        try:
+            await self.dp.feed_update(self.bot, update)
+            self.handled += 1
+        except Exception as e:
+            self.failed += 1
+            logging.error(f"Error handling update {update.update_id}: {e}")
+
+    def task_done(self, task: asyncio.Task):
+        self.tasks.discard(task)
+        self.slots.release()
+
+    async def stop(self, timeout: float = None):
+        """Let running handlers finish (up to ``timeout`` seconds), then confirm the handled updates"""
+        timeout = timeout if timeout is not None else config.SHUTDOWN_DRAIN_TIMEOUT
+        if self.tasks:
+            done, pending = await asyncio.wait(set(self.tasks), timeout=timeout)
+            if pending:
+                logging.warning(f"⚠️ Polling stopped with {len(pending)} updates still being handled")
+                for task in pending:
+                    task.cancel()
+        if self.offset is not None:
+            # Telegram forgets updates below the offset of the next call
+            try:
+                await self.bot(GetUpdates(offset=self.offset, limit=1, timeout=0))
+            except Exception as e:
+                logging.error(f"Error confirming handled updates: {e}")
+        logging.info(f"📊 Polling: {self.handled} updates handled, {self.failed} failed")
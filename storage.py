@@ -0,0 +1,168 @@
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import BaseStorage, DefaultKeyBuilder, StateType, StorageKey
+
+from config import config
+
+
+def dumps(value: Any) -> str:
+    """Compact JSON (timestamps in rows are stored as strings)"""
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False, default=str)
+
+
+class KVStore:
+    """Expiring key-value store for FSM state and browsing sessions.
+
+    Values are anything JSON-serializable. Backends: ``MemoryKVStore``
+    (bounded, single process), ``PostgresKVStore`` (the bot's database;
+    survives restarts and is shared by all workers) and ``RedisKVStore``
+    (any Redis-compatible server; needs the ``redis`` package).
+    """
+
+    async def get(self, key: str) -> Any:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: Any, ttl: int = None):
+        raise NotImplementedError
+
+    async def delete(self, key: str):
+        raise NotImplementedError
+
+    async def purge_expired(self) -> int:
+        """Drop expired entries the backend doesn't expire on its own"""
+        return 0
+
+    async def close(self):
+        pass
+
+
+class MemoryKVStore(KVStore):
+    """In-process store, evicting the least recently used entry beyond ``maxsize``"""
+
+    def __init__(self, maxsize: int = None):
+        self.maxsize = maxsize or config.KV_MEMORY_MAX_KEYS
+        self.entries: OrderedDict = OrderedDict()  # key -> (expires_at, serialized value)
+
+    async def get(self, key: str) -> Any:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.entries[key]
+            return None
+        self.entries.move_to_end(key)
+        return json.loads(value)
+
+    async def set(self, key: str, value: Any, ttl: int = None):
+        expires_at = time.monotonic() + ttl if ttl else None
+        # Stored serialized, so callers never share mutable state with the store
+        self.entries[key] = (expires_at, dumps(value))
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    async def delete(self, key: str):
+        self.entries.pop(key, None)
+
+    async def purge_expired(self) -> int:
+        now = time.monotonic()
+        expired = [key for key, (expires_at, _) in self.entries.items()
+                   if expires_at is not None and expires_at <= now]
+        for key in expired:
+            del self.entries[key]
+        return len(expired)
+
+
+class PostgresKVStore(KVStore):
+    """Store in the ``kv_store`` table through the awaitable database backend"""
+
+    def __init__(self, database=None):
+        if database is None:
+            from async_database import db as database
+        self.db = database
+
+    async def get(self, key: str) -> Any:
+        value = await self.db.kv_get(key)
+        return json.loads(value) if value is not None else None
+
+    async def set(self, key: str, value: Any, ttl: int = None):
+        await self.db.kv_set(key, dumps(value), ttl)
+
+    async def delete(self, key: str):
+        await self.db.kv_delete(key)
+
+    async def purge_expired(self) -> int:
+        return await self.db.kv_purge_expired()
+
+
+class RedisKVStore(KVStore):
+    """Store on a Redis-compatible server, which expires keys itself"""
+
+    def __init__(self, url: str = None):
+        try:
+            from redis.asyncio import Redis
+        except ImportError:
+            raise RuntimeError("KV_BACKEND=redis needs the 'redis' package (pip install redis)")
+        self.redis = Redis.from_url(url or config.REDIS_URL)
+
+    async def get(self, key: str) -> Any:
+        value = await self.redis.get(key)
+        return json.loads(value) if value is not None else None
+
+    async def set(self, key: str, value: Any, ttl: int = None):
+        await self.redis.set(key, dumps(value), ex=ttl or None)
+
+    async def delete(self, key: str):
+        await self.redis.delete(key)
+
+    async def close(self):
+        await self.redis.aclose()
+
+
+class KVStorage(BaseStorage):
+    """aiogram FSM storage on top of a ``KVStore``"""
+
+    def __init__(self, store: KVStore, ttl: int = None):
+        self.store = store
+        self.ttl = ttl or config.FSM_TTL
+        self.key_builder = DefaultKeyBuilder(with_bot_id=True, with_destiny=True)
+
+    async def set_state(self, key: StorageKey, state: StateType = None) -> None:
+        if isinstance(state, State):
+            state = state.state
+        if state is None:
+            await self.store.delete(self.key_builder.build(key, 'state'))
+        else:
+            await self.store.set(self.key_builder.build(key, 'state'), state, self.ttl)
+
+    async def get_state(self, key: StorageKey) -> Optional[str]:
+        return await self.store.get(self.key_builder.build(key, 'state'))
+
+    async def set_data(self, key: StorageKey, data: Dict[str, Any]) -> None:
+        if not data:
+            await self.store.delete(self.key_builder.build(key, 'data'))
+        else:
+            await self.store.set(self.key_builder.build(key, 'data'), data, self.ttl)
+
+    async def get_data(self, key: StorageKey) -> Dict[str, Any]:
+        return await self.store.get(self.key_builder.build(key, 'data')) or {}
+
+    async def close(self) -> None:
+        await self.store.close()
+
+
+def create_kv_store() -> KVStore:
+    """Build the store selected by ``config.KV_BACKEND``"""
+    if config.KV_BACKEND == 'memory':
+        return MemoryKVStore()
+    if config.KV_BACKEND == 'redis':
+        return RedisKVStore()
+    return PostgresKVStore()
+
+
+kv_store = create_kv_store()
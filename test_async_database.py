@@ -0,0 +1,83 @@
+import asyncio
+
+import psycopg2
+import pytest
+
+from async_database import AsyncDatabase
+from database import db as sync_db
+
+USER_IDS = [990000001, 990000002, 990000003]
+
+
+def postgres_available():
+    try:
+        sync_db.connect()
+        return True
+    except psycopg2.Error:
+        return False
+
+
+pytestmark = pytest.mark.skipif(not postgres_available(), reason="PostgreSQL is not reachable")
+
+
+def run(coro_fn):
+    """Run a test body against a fresh pool and clean up its users"""
+    async def main():
+        backend = AsyncDatabase(minsize=1, maxsize=3)
+        try:
+            return await coro_fn(backend)
+        finally:
+            for user_id in USER_IDS:
+                await backend.delete_user_account(user_id)
+            await backend.close()
+
+    return asyncio.run(main())
+
+
+def test_add_and_get_user():
+    async def body(backend):
+        await backend.add_user(USER_IDS[0], "alice", "Alice")
+        user = await backend.get_user(USER_IDS[0])
+        assert user['username'] == "alice"
+        assert await backend.get_user(USER_IDS[1]) is None
+
+    run(body)
+
+
+def test_connect_twice_keeps_one_pool():
+    async def body(backend):
+        pool = await backend.connect()
+        assert await backend.connect() is pool
+
+    run(body)
+
+
+def test_concurrent_queries_share_the_pool():
+    async def body(backend):
+        await asyncio.gather(*(backend.add_user(user_id, f"u{user_id}", "U") for user_id in USER_IDS))
+        users = await asyncio.gather(*(backend.get_user(user_id) for user_id in USER_IDS * 4))
+        assert [user['user_id'] for user in users] == USER_IDS * 4
+        assert backend.pool.size <= backend.maxsize
+
+    run(body)
+
+
+def test_coins_round_trip():
+    async def body(backend):
+        await backend.add_user(USER_IDS[0], "alice", "Alice")
+        before = await backend.get_user_coins(USER_IDS[0])
+        assert await backend.add_user_coins(USER_IDS[0], 5)
+        assert await backend.get_user_coins(USER_IDS[0]) == before + 5
+
+    run(body)
+
+
+def test_close_then_reconnect():
+    async def body(backend):
+        await backend.connect()
+        await backend.close()
+        assert backend.pool is None
+        await backend.add_user(USER_IDS[0], "alice", "Alice")
+        assert await backend.get_user(USER_IDS[0]) is not None
+
+    run(body)
@@ -0,0 +1,62 @@
+import asyncio
+
+from async_database import CachedDatabase
+
+
+class FakeUsers:
+    """User rows with the counters the likes triggers maintain"""
+
+    def __init__(self):
+        self.rows = {user_id: {'user_id': user_id, 'likes_count': 0, 'matches_count': 0, 'is_active': True}
+                     for user_id in (1, 2, 3)}
+        self.likes = set()
+
+    async def get_user(self, user_id):
+        return dict(self.rows[user_id])
+
+    def like(self, user_id, liked_user_id):
+        self.likes.add((user_id, liked_user_id))
+        self.rows[liked_user_id]['likes_count'] += 1
+        if (liked_user_id, user_id) in self.likes:
+            self.rows[user_id]['matches_count'] += 1
+            self.rows[liked_user_id]['matches_count'] += 1
+
+    async def add_like(self, user_id, liked_user_id):
+        self.like(user_id, liked_user_id)
+        return True
+
+    async def add_like_and_match(self, user_id, liked_user_id):
+        self.like(user_id, liked_user_id)
+        return True, (liked_user_id, user_id) in self.likes
+
+    async def record_likes(self, pairs):
+        for user_id, liked_user_id in pairs:
+            self.like(user_id, liked_user_id)
+        return len(pairs)
+
+    async def reconcile_counters(self):
+        for row in self.rows.values():
+            row['likes_count'] = 9
+        return len(self.rows)
+
+
+def test_likes_refresh_both_users_counters():
+    cache = CachedDatabase(FakeUsers(), maxsize=10, ttl=60)
+
+    async def counters():
+        return [((await cache.get_user(user_id))['likes_count'], (await cache.get_user(user_id))['matches_count'])
+                for user_id in (1, 2, 3)]
+
+    async def main():
+        await counters()
+        await cache.add_like(1, 2)
+        assert await counters() == [(0, 0), (1, 0), (0, 0)]
+        await cache.add_like_and_match(2, 1)
+        assert await counters() == [(1, 1), (1, 1), (0, 0)]
+        await cache.record_likes([(3, 1), (1, 3)])
+        assert await counters() == [(2, 2), (1, 1), (1, 1)]
+        await cache.reconcile_counters()
+        assert [likes for likes, matches in await counters()] == [9, 9, 9]
+
+    asyncio.run(main())
+    assert cache.cache_stats()['evictions'] == 0
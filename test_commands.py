@@ -0,0 +1,146 @@
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+import handlers.commands
+from config import config
+from database import split_like_list_page
+from utils.translations import get_text
+
+
+class FakeDatabase:
+    """Likers of user 1 and coins, enough for the /likers handlers"""
+
+    def __init__(self, likers=7, coins=100):
+        now = datetime(2024, 5, 1, 12, 0)
+        self.likers = [{'user_id': 100 + n, 'first_name': f"Liker{n}", 'age': 25, 'city': "Addis",
+                        'religion': "x", 'bio': "hi", 'photos': '[]', 'language': 'english',
+                        'liked_at': now - timedelta(minutes=n)} for n in range(likers)]
+        self.coins = coins
+
+    async def get_user(self, user_id):
+        return {'user_id': user_id, 'language': 'english', 'coins': self.coins}
+
+    async def get_user_likes_count(self, user_id):
+        return len(self.likers)
+
+    async def get_user_likes(self, user_id, cursor_token=None, limit=5):
+        rows = self.likers
+        if cursor_token:
+            position = next(i for i, row in enumerate(rows) if str(row['user_id']) == cursor_token.split(':')[-1])
+            rows = rows[position + 1:]
+        return split_like_list_page(rows[:limit + 1], limit, cursor_token)
+
+    async def deduct_user_coins(self, user_id, coins):
+        self.coins -= coins
+        return True
+
+
+class FakeMessage:
+    def __init__(self, sent):
+        self.from_user = SimpleNamespace(id=1)
+        self.chat = SimpleNamespace(id=1)
+        self.sent = sent
+
+    async def answer(self, text, **kwargs):
+        self.sent.append(text)
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    sent = []
+    store = {}
+
+    async def kv_set(key, value, ttl=None):
+        store[key] = value
+
+    async def kv_get(key):
+        return store.get(key)
+
+    monkeypatch.setattr(handlers.commands, 'kv_store', SimpleNamespace(set=kv_set, get=kv_get))
+    monkeypatch.setattr(handlers.commands, 'send_queue', SimpleNamespace(
+        send_message=lambda chat_id, text, **kwargs: sent.append(text),
+        send_photo=lambda chat_id, photo, **kwargs: sent.append(kwargs.get('caption')),
+        send_media_group=lambda chat_id, media: sent.append(media[0].caption),
+    ))
+    return sent
+
+
+@pytest.mark.parametrize('free', [0, 3])
+def test_likers_show_count_and_paywall(monkeypatch, sent, free):
+    monkeypatch.setitem(config.COIN_CONFIG, 'free_likers_display', free)
+    monkeypatch.setattr(handlers.commands, 'db', FakeDatabase(likers=7))
+
+    asyncio.run(handlers.commands.who_liked_me(FakeMessage(sent)))
+
+    assert sent[0] == get_text('likes_count', 'english', count=7)
+    assert sum('Liker' in text for text in sent) == free
+    assert sent[-1] == get_text('more_likers_available', 'english', count=7 - free,
+                                cost=config.COIN_CONFIG['view_all_likers_cost'])
+
+
+def test_no_likers(monkeypatch, sent):
+    monkeypatch.setitem(config.COIN_CONFIG, 'free_likers_display', 0)
+    monkeypatch.setattr(handlers.commands, 'db', FakeDatabase(likers=0))
+
+    asyncio.run(handlers.commands.who_liked_me(FakeMessage(sent)))
+
+    assert sent == [get_text('no_likes_yet', 'english')]
+
+
+@pytest.mark.parametrize('free', [0, 3])
+def test_view_all_likers_starts_after_the_free_ones(monkeypatch, sent, free):
+    monkeypatch.setitem(config.COIN_CONFIG, 'free_likers_display', free)
+    database = FakeDatabase(likers=7)
+    monkeypatch.setattr(handlers.commands, 'db', database)
+
+    handler = getattr(handlers.commands.view_all_likers, '__wrapped__', handlers.commands.view_all_likers)
+    asyncio.run(handler(FakeMessage(sent)))
+
+    assert database.coins == 100 - config.COIN_CONFIG['view_all_likers_cost']
+    shown = [text for text in sent if text and 'Liker' in text]
+    assert shown and f"Liker{free}" in shown[0]
+
+
+def test_unreadable_page_button_is_answered(monkeypatch, sent):
+    monkeypatch.setattr(handlers.commands, 'db', FakeDatabase())
+    answers = []
+
+    async def answer(text=None, **kwargs):
+        answers.append(text)
+
+    for data in ("likers_page:x:5:n:1:2", "matches_page:5"):
+        callback = SimpleNamespace(data=data, from_user=SimpleNamespace(id=1), message=None, answer=answer)
+        asyncio.run(handlers.commands.like_list_page(callback))
+
+    assert answers == [get_text('error_try_again', 'english')] * 2
+
+
+def test_page_button_cannot_ask_for_more_than_a_page(monkeypatch, sent):
+    database = FakeDatabase(likers=40)
+    monkeypatch.setattr(handlers.commands, 'db', database)
+    requested = []
+    get_user_likes = database.get_user_likes
+
+    async def spy(user_id, cursor_token=None, limit=5):
+        requested.append(limit)
+        return await get_user_likes(user_id, cursor_token, limit)
+
+    database.get_user_likes = spy
+    answers = []
+
+    async def answer(text=None, **kwargs):
+        answers.append(text)
+
+    async def main():
+        await handlers.commands.kv_store.set(handlers.commands.likers_unlocked_key(1), True)
+        for data in ("likers_page:0:100000:", "likers_page:0:0:", "likers_page:-5:5:"):
+            callback = SimpleNamespace(data=data, from_user=SimpleNamespace(id=1),
+                                       message=FakeMessage(sent), answer=answer)
+            await handlers.commands.like_list_page(callback)
+
+    asyncio.run(main())
+    assert requested == [config.LIKES_PAGE_SIZE, 1]
+    assert answers == [None, None, get_text('error_try_again', 'english')]
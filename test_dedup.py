@@ -0,0 +1,101 @@
+import asyncio
+from types import SimpleNamespace
+
+from aiogram.types import Update
+
+import middlewares.dedup
+from middlewares.dedup import OnceMiddleware, RecentUpdates, UpdateDedupMiddleware
+
+
+def test_recent_updates_forget_the_oldest():
+    recent = RecentUpdates(maxsize=2)
+    assert recent.add(1) and recent.add(2)
+    assert not recent.add(1)
+    assert recent.add(3)
+    assert recent.add(1)  # fell out
+
+
+def test_dedup_drops_repeated_updates():
+    dedup = UpdateDedupMiddleware(maxsize=10)
+    handled = []
+
+    async def handler(event, data):
+        handled.append(event.update_id)
+
+    async def main():
+        for update_id in (1, 2, 1, 3, 2):
+            await dedup(handler, Update(update_id=update_id), {})
+
+    asyncio.run(main())
+    assert handled == [1, 2, 3]
+    assert dedup.duplicates == 2
+
+
+def test_once_runs_flagged_handlers_once_per_update(monkeypatch):
+    claimed = set()
+
+    async def claim_update(update_id):
+        if update_id in claimed:
+            return False
+        claimed.add(update_id)
+        return True
+
+    monkeypatch.setattr(middlewares.dedup, 'db', SimpleNamespace(claim_update=claim_update))
+    once = OnceMiddleware()
+    handled = []
+
+    async def handler(event, data):
+        handled.append(data['event_update'].update_id)
+
+    def data(update_id, flagged=True):
+        return {'event_update': Update(update_id=update_id),
+                'handler': SimpleNamespace(flags={'once': True} if flagged else {})}
+
+    async def main():
+        await once(handler, None, data(1))
+        await once(handler, None, data(1))
+        await once(handler, None, data(2, flagged=False))
+        await once(handler, None, data(2, flagged=False))
+
+    asyncio.run(main())
+    assert handled == [1, 2, 2]
+    assert once.duplicates == 1
+
+
+def test_once_releases_the_update_when_the_handler_fails(monkeypatch):
+    claimed = set()
+
+    async def claim_update(update_id):
+        if update_id in claimed:
+            return False
+        claimed.add(update_id)
+        return True
+
+    async def release_update(update_id):
+        claimed.discard(update_id)
+        return True
+
+    monkeypatch.setattr(middlewares.dedup, 'db', SimpleNamespace(claim_update=claim_update,
+                                                                 release_update=release_update))
+    once = OnceMiddleware()
+    attempts = []
+
+    async def handler(event, data):
+        attempts.append(data['event_update'].update_id)
+        if len(attempts) == 1:
+            raise ConnectionError("database went away")
+
+    data = {'event_update': Update(update_id=1), 'handler': SimpleNamespace(flags={'once': True})}
+
+    async def main():
+        try:
+            await once(handler, None, data)
+        except ConnectionError:
+            pass
+        # Redelivered: runs again, then never a third time
+        await once(handler, None, data)
+        await once(handler, None, data)
+
+    asyncio.run(main())
+    assert attempts == [1, 1]
+    assert claimed == {1} and once.duplicates == 1
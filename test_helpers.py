@@ -0,0 +1,8 @@
+from utils.helpers import pack_ids, unpack_ids
+
+
+def test_pack_ids_round_trip():
+    user_ids = [1, 2 ** 40, 7, 7]
+    assert list(unpack_ids(pack_ids(user_ids))) == user_ids
+    assert list(unpack_ids(pack_ids([]))) == []
+    assert list(unpack_ids(None)) == []
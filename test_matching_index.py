@@ -0,0 +1,148 @@
+import asyncio
+import random
+from types import SimpleNamespace
+
+import pytest
+
+import utils.matching_index
+import utils.swipes
+from utils.geo import distance_km
+from utils.matching_index import Bucket, Filter, MatchingIndex
+from utils.swipes import BUFFERED, SwipeBuffer
+
+
+def make_profiles(count=1500):
+    rng = random.Random(5)
+    rows = []
+    for user_id in range(1, count + 1):
+        row = {'user_id': user_id, 'gender': 'female' if user_id % 2 else 'male',
+               'age': rng.choice([None, 20, 25, 30, 40]),
+               'city': rng.choice(['Addis', 'adama', 'Gondar ', None]),
+               'religion': rng.choice(['a', 'b', None])}
+        if rng.random() < 0.8:
+            row['latitude'] = 9.0 + rng.uniform(-0.5, 0.5)
+            row['longitude'] = 38.7 + rng.uniform(-0.5, 0.5)
+        rows.append(row)
+    return rows
+
+
+EXCLUDED = [5, 7, 9]
+
+
+@pytest.fixture
+def index(monkeypatch):
+    rows = make_profiles()
+
+    async def get_matching_snapshot():
+        return rows
+
+    async def get_excluded_user_ids(user_id):
+        return EXCLUDED
+
+    monkeypatch.setattr(utils.matching_index, 'db', SimpleNamespace(
+        get_matching_snapshot=get_matching_snapshot, get_excluded_user_ids=get_excluded_user_ids
+    ))
+    index = MatchingIndex()
+    asyncio.run(index.load())
+    index.rows = rows
+    return index
+
+
+def walk(page, *args, **kwargs):
+    """Every id of a pass, page after page"""
+    async def main():
+        found, cursor = [], None
+        while True:
+            ids, cursor = await page(*args, cursor, **kwargs)
+            found += ids
+            if not cursor:
+                return found
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize('preferences', [
+    None,
+    {'cities': ['addis', 'gondar']},
+    {'religions': ['a'], 'max_age': 30},
+    {'cities': ['nowhere']},
+])
+def test_candidate_pass_returns_each_match_once(index, preferences):
+    found = walk(index.candidate_page, 2, 'male', 'seed', limit=17, preferences=preferences)
+    preferences = preferences or {}
+    expected = {
+        row['user_id'] for row in index.rows
+        if row['gender'] == 'female' and row['user_id'] not in EXCLUDED
+        and (not preferences.get('cities') or (row['city'] or '').strip().lower() in preferences['cities'])
+        and (not preferences.get('religions') or row['religion'] in preferences['religions'])
+        and (not preferences.get('max_age') or (row['age'] and row['age'] <= preferences['max_age']))
+    }
+    assert len(found) == len(set(found))
+    assert set(found) == expected
+
+
+def test_candidate_pass_order_depends_on_the_seed(index):
+    first = walk(index.candidate_page, 2, 'male', 'one', limit=20)
+    assert walk(index.candidate_page, 2, 'male', 'one', limit=20) == first
+    assert walk(index.candidate_page, 2, 'male', 'two', limit=20) != first
+
+
+def test_bad_cursor_ends_the_pass(index):
+    assert asyncio.run(index.candidate_page(2, 'male', 'seed', 'ix:1:2')) == ([], None)
+
+
+@pytest.mark.parametrize('preferences', [None, {'min_age': 25}])
+def test_nearby_pass_is_nearest_first(index, preferences):
+    latitude, longitude, radius = 9.05, 38.72, 30
+    found = walk(index.nearby_page, 2, 'male', latitude, longitude, radius, limit=20, preferences=preferences)
+    expected = sorted(
+        (distance_km(latitude, longitude, row['latitude'], row['longitude']), row['user_id'])
+        for row in index.rows
+        if row['gender'] == 'female' and 'latitude' in row and row['user_id'] not in EXCLUDED
+        and (not preferences or (row['age'] or 0) >= preferences['min_age'])
+    )
+    assert found == [user_id for distance, user_id in expected if distance <= radius]
+
+
+def test_bad_nearby_cursor_ends_the_pass(index):
+    assert asyncio.run(index.nearby_page(2, 'male', 9.0, 38.7, 30, 'far')) == ([], None)
+
+
+def test_filter_leaves_out_missing_ages_when_bounded():
+    bucket = Bucket()
+    bucket.append(1, None, 0, 0)
+    bucket.append(2, 30, 0, 0)
+    assert [Filter(max_age=40).accepts(bucket, i) for i in range(2)] == [False, True]
+    assert [Filter(min_age=18).accepts(bucket, i) for i in range(2)] == [False, True]
+    assert [Filter().accepts(bucket, i) for i in range(2)] == [True, True]
+
+
+def test_skipped_profile_leaves_the_pass(index, monkeypatch):
+    monkeypatch.setattr(utils.matching_index.config, 'SKIP_COOLDOWN_HOURS', 24)
+    first = walk(index.candidate_page, 2, 'male', 'seed', limit=20)
+    index.record_skip(2, first[3])
+    assert walk(index.candidate_page, 2, 'male', 'seed', limit=20) == first[:3] + first[4:]
+
+    monkeypatch.setattr(utils.matching_index.config, 'SKIP_COOLDOWN_HOURS', 0)
+    index.record_skip(2, first[5])
+    assert first[5] in walk(index.candidate_page, 2, 'male', 'seed', limit=20)
+
+
+def test_buffered_swipes_stay_excluded_when_exclusions_reload(index, monkeypatch):
+    buffer = SwipeBuffer(mode=BUFFERED)
+    monkeypatch.setattr(utils.swipes, 'swipe_buffer', buffer)
+    first = walk(index.candidate_page, 2, 'male', 'seed', limit=20)
+    buffer.likes[(2, first[0])] = None
+    buffer.skips[(2, first[1])] = None
+    buffer.likes[(4, first[2])] = None
+    # Expired or evicted while the swipes still wait for a flush
+    index.exclusions.pop(2)
+    assert walk(index.candidate_page, 2, 'male', 'seed', limit=20) == first[2:]
+
+
+def test_bucket_keeps_coordinates_at_full_precision():
+    bucket = Bucket()
+    bucket.append(1, 30, 0, 0, 9.123456789012345, 38.76543210987654)
+    bucket.append(2, 30, 0, 0)
+    assert (bucket.lats[0], bucket.lons[0]) == (9.123456789012345, 38.76543210987654)
+    # No location is never within a radius
+    assert distance_km(9.0, 38.7, bucket.lats[1], bucket.lons[1]) > 20000
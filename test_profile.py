@@ -0,0 +1,22 @@
+import pytest
+
+from config import config
+from handlers.profile import parse_age_range
+
+
+@pytest.mark.parametrize('text, expected', [
+    ("20-30", (20, 30)),
+    (" 20 – 30 ", (20, 30)),
+    ("25", (25, 25)),
+    ("30-20", None),
+    ("abc", None),
+    ("20-30-40", None),
+    ("", None),
+])
+def test_parse_age_range(text, expected):
+    assert parse_age_range(text) == expected
+
+
+def test_parse_age_range_stays_within_the_allowed_ages():
+    assert parse_age_range(f"{config.MIN_AGE - 1}-{config.MIN_AGE + 5}") is None
+    assert parse_age_range(f"{config.MAX_AGE}-{config.MAX_AGE + 1}") is None
@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from database import (
+    build_candidate_page_query,
+    build_like_list_query,
+    build_nearby_candidates_query,
+    like_cursor,
+    split_candidate_page,
+    split_like_batch,
+    split_like_list_page,
+    split_nearby_page,
+)
+
+
+def liker(user_id, minutes_ago):
+    return {'user_id': user_id, 'liked_at': datetime(2024, 5, 1, 12, 0) - timedelta(minutes=minutes_ago)}
+
+
+def test_candidate_cursor_round_trip():
+    rows = [{'user_id': 7, 'random_key': 0.1, 'lap': 0},
+            {'user_id': 3, 'random_key': 0.30000000000000004, 'lap': 0}]
+    profiles, cursor = split_candidate_page(rows, limit=2)
+    assert [profile['user_id'] for profile in profiles] == [7, 3]
+    assert all('lap' not in profile for profile in profiles)
+
+    query, params = build_candidate_page_query(1, 'male', 'seed', cursor, limit=2)
+    # The key comes back exactly, so the keyset resumes after the last row
+    assert 0.30000000000000004 in params and 3 in params
+    assert query.count('SELECT u.*') == 2
+
+
+def test_candidate_cursor_second_lap_skips_the_first():
+    _, cursor = split_candidate_page([{'user_id': 3, 'random_key': 0.2, 'lap': 1}], limit=1)
+    query, params = build_candidate_page_query(1, 'male', 'seed', cursor, limit=1)
+    assert query.count('SELECT u.*') == 1
+    assert params[0] == 1
+
+
+def test_candidate_short_page_ends_the_pass():
+    assert split_candidate_page([{'user_id': 3, 'random_key': 0.2, 'lap': 0}], limit=5)[1] is None
+
+
+@pytest.mark.parametrize('cursor', ['garbage', '0:x:1', '0:0.5'])
+def test_bad_candidate_cursor_raises(cursor):
+    with pytest.raises(ValueError):
+        build_candidate_page_query(1, 'male', 'seed', cursor)
+
+
+def test_nearby_cursor_round_trip():
+    rows = [{'user_id': 4, 'distance_km': 1.5}, {'user_id': 9, 'distance_km': 2.0000000000000004}]
+    _, cursor = split_nearby_page(rows, limit=2)
+    _, params = build_nearby_candidates_query(1, 'male', 9.0, 38.7, 50, cursor, limit=2)
+    assert 2.0000000000000004 in params and 9 in params
+
+
+def test_bad_nearby_cursor_raises():
+    with pytest.raises(ValueError):
+        build_nearby_candidates_query(1, 'male', 9.0, 38.7, 50, 'x:y')
+
+
+def test_like_batch_never_holds_both_directions():
+    parts = split_like_batch([(1, 2), (2, 1), (3, 4), (5, 3)])
+    for part in parts:
+        assert not any((b, a) in part for a, b in part)
+    assert sorted(pair for part in parts for pair in part) == [(1, 2), (2, 1), (3, 4), (5, 3)]
+
+
+def test_like_list_pages_forward_and_back():
+    rows = [liker(user_id, minutes) for minutes, user_id in enumerate([10, 11, 12, 13])]
+
+    first, prev_cursor, next_cursor = split_like_list_page(rows, limit=3)
+    assert [row['user_id'] for row in first] == [10, 11, 12]
+    assert prev_cursor is None and next_cursor == like_cursor('n', rows[2])
+
+    # Fetched oldest first after the cursor, one extra row to see if there is more
+    second, prev_cursor, next_cursor = split_like_list_page(rows[3:], limit=3, cursor_token=next_cursor)
+    assert [row['user_id'] for row in second] == [13]
+    assert next_cursor is None and prev_cursor == like_cursor('p', rows[3])
+
+    # Going back, rows come newest last and are put back in order
+    back, prev_cursor, next_cursor = split_like_list_page(list(reversed(rows[:3])), limit=3,
+                                                         cursor_token=prev_cursor)
+    assert [row['user_id'] for row in back] == [10, 11, 12]
+    assert next_cursor is not None
+
+
+def test_like_list_cursor_round_trip():
+    row = liker(5, 3)
+    query, params = build_like_list_query('likers', 1, like_cursor('n', row), limit=5)
+    assert params[2:] == (row['liked_at'], 5, 6)
+    assert 'ORDER BY liked_at DESC' in query
+
+    query, _ = build_like_list_query('matches', 1, like_cursor('p', row), limit=5)
+    assert 'ORDER BY liked_at ASC' in query
+
+
+@pytest.mark.parametrize('cursor', ['x:20240501120000000000:1', 'n:yesterday:1', 'n:1'])
+def test_bad_like_list_cursor_raises(cursor):
+    with pytest.raises(ValueError):
+        build_like_list_query('likers', 1, cursor)
+
+
+def test_like_list_page_with_no_limit_is_empty():
+    # With no free likers the preview fetches one row and shows none of it
+    assert split_like_list_page([liker(10, 0)], limit=0) == ([], None, None)
@@ -0,0 +1,32 @@
+import pytest
+
+import utils.send_queue
+from utils.send_queue import TokenBucket
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(utils.send_queue.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_token_bucket_refills_at_its_rate(clock):
+    bucket = TokenBucket(rate=2, capacity=4)
+    assert bucket.wait_time() == 0
+    for _ in range(4):
+        assert bucket.reserve() == 0
+    assert bucket.wait_time() == pytest.approx(0.5)
+    clock[0] += 0.5
+    assert bucket.wait_time() == 0
+    clock[0] += 100
+    assert bucket.is_full() and bucket.tokens == 4
+
+
+def test_token_bucket_reserve_goes_into_debt(clock):
+    bucket = TokenBucket(rate=10, capacity=1)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1)
+    assert bucket.reserve() == pytest.approx(0.2)
+    # Asking for more than fits waits for a full bucket, not forever
+    assert TokenBucket(rate=1, capacity=2).wait_time(5) == 0
@@ -0,0 +1,141 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+from aiogram.types import CallbackQuery, Chat, Message, Update, User
+
+from middlewares.serial import UserSerialMiddleware
+
+
+def from_user(user_id):
+    return {'event_from_user': SimpleNamespace(id=user_id)}
+
+
+def tap(update_id, user_id=1, message_id=3, data="like_5"):
+    user = User(id=user_id, is_bot=False, first_name="A")
+    message = Message(message_id=message_id, date=datetime.now(), chat=Chat(id=user_id, type="private"))
+    return Update(update_id=update_id, callback_query=CallbackQuery(
+        id=str(update_id), from_user=user, chat_instance="c", data=data, message=message
+    ))
+
+
+def test_serial_runs_a_users_updates_in_order_and_users_in_parallel():
+    serial = UserSerialMiddleware(max_depth=10)
+    log = []
+
+    async def handler(event, data):
+        log.append(('start', event))
+        await asyncio.sleep(0.01 if event[1] == 0 else 0)
+        log.append(('end', event))
+
+    async def main():
+        await asyncio.gather(*(serial(handler, (user_id, n), from_user(user_id))
+                               for n in range(3) for user_id in (1, 2)))
+
+    asyncio.run(main())
+    for user_id in (1, 2):
+        steps = [step for step in log if step[1][0] == user_id]
+        # One at a time, in arrival order
+        assert steps == [(kind, (user_id, n)) for n in range(3) for kind in ('start', 'end')]
+    # User 2 started before user 1's first (slow) update finished
+    assert log.index(('start', (2, 0))) < log.index(('end', (1, 0)))
+    assert serial.stats()['handled'] == 6 and serial.lanes == {}
+
+
+def test_serial_drops_updates_beyond_the_queue_depth():
+    serial = UserSerialMiddleware(max_depth=2)
+    handled = []
+
+    async def handler(event, data):
+        await asyncio.sleep(0.01)
+        handled.append(event)
+
+    async def main():
+        await asyncio.gather(*(serial(handler, n, from_user(1)) for n in range(5)))
+
+    asyncio.run(main())
+    # One running, two waiting, the rest dropped
+    assert handled == [0, 1, 2]
+    assert serial.dropped == 2
+
+
+def test_serial_coalesces_repeated_taps_of_one_button():
+    serial = UserSerialMiddleware(max_depth=10)
+    handled = []
+
+    async def handler(event, data):
+        await asyncio.sleep(0.01)
+        handled.append(event.update_id)
+
+    async def main():
+        await asyncio.gather(serial(handler, tap(1), from_user(1)), serial(handler, tap(2), from_user(1)),
+                             serial(handler, tap(3, data="skip_5"), from_user(1)))
+        # Once handled, the same button can be used again
+        await serial(handler, tap(4), from_user(1))
+
+    asyncio.run(main())
+    assert handled == [1, 3, 4]
+    assert serial.coalesced == 1
+
+
+def test_serial_drain_waits_for_updates_in_progress():
+    serial = UserSerialMiddleware()
+
+    async def handler(event, data):
+        await asyncio.sleep(0.05)
+
+    async def main():
+        task = asyncio.create_task(serial(handler, 0, from_user(1)))
+        await asyncio.sleep(0)
+        assert not await serial.drain(0.01)
+        assert await serial.drain(1)
+        assert task.done()
+
+    asyncio.run(main())
+
+
+def text(update_id, user_id=1):
+    user = User(id=user_id, is_bot=False, first_name="A")
+    return Update(update_id=update_id, message=Message(
+        message_id=update_id, date=datetime.now(), chat=Chat(id=user_id, type="private"), from_user=user, text="hi"
+    ))
+
+
+def test_serial_keeps_messages_of_a_user_in_a_conversation(caplog):
+    serial = UserSerialMiddleware(max_depth=1, fsm_max_depth=4)
+    states = {1: "RegistrationStates:photos", 2: None}
+
+    async def get_state(user_id):
+        return states[user_id]
+
+    serial.fsm = SimpleNamespace(resolve_event_context=lambda bot, data: SimpleNamespace(
+        get_state=lambda: get_state(data['event_from_user'].id)
+    ))
+    answered = []
+
+    async def answer_dropped(event):
+        answered.append(event.update_id)
+
+    serial.answer_dropped = answer_dropped
+    handled = []
+
+    async def handler(event, data):
+        await asyncio.sleep(0.01)
+        handled.append(event.update_id)
+
+    def data(user_id):
+        return {**from_user(user_id), 'bot': None}
+
+    async def main():
+        await asyncio.gather(*(serial(handler, text(n), data(1)) for n in range(8)),
+                             *(serial(handler, text(n), data(2)) for n in range(10, 14)),
+                             *(serial(handler, tap(n, message_id=n), data(1)) for n in range(20, 22)))
+
+    asyncio.run(main())
+    # An album of photos: one running and four waiting, the rest still over the limit
+    assert sorted(n for n in handled if n < 10) == [0, 1, 2, 3, 4]
+    # Without a state the usual depth applies, and taps aren't messages
+    assert sorted(n for n in handled if n >= 10) == [10, 11]
+    assert serial.dropped == 3 + 2 + 2
+    assert len(answered) == 7 and answered[-2:] == [20, 21]
+    assert sum('Dropped' in record.message for record in caplog.records) == 7
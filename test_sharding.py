@@ -0,0 +1,24 @@
+from collections import Counter
+
+from utils.sharding import pick_worker, update_shard_key
+
+
+def test_pick_worker_is_stable_and_spread():
+    assert all(pick_worker(user_id, 4) == pick_worker(user_id, 4) for user_id in range(100))
+    counts = Counter(pick_worker(user_id, 4) for user_id in range(4000))
+    assert set(counts) == {0, 1, 2, 3}
+    assert min(counts.values()) > 800
+    assert all(pick_worker(user_id, 1) == 0 for user_id in range(100))
+
+
+def test_pick_worker_only_moves_users_of_the_added_worker():
+    moved = [user_id for user_id in range(4000) if pick_worker(user_id, 4) != pick_worker(user_id, 5)]
+    assert all(pick_worker(user_id, 5) == 4 for user_id in moved)
+    assert 500 < len(moved) < 1100
+
+
+def test_update_shard_key():
+    assert update_shard_key({'update_id': 1, 'message': {'from': {'id': 42}, 'chat': {'id': -5}}}) == 42
+    assert update_shard_key({'update_id': 1, 'callback_query': {'from': {'id': 7}}}) == 7
+    assert update_shard_key({'update_id': 1, 'channel_post': {'chat': {'id': -5}}}) == -5
+    assert update_shard_key({'update_id': 9}) == 9
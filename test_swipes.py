@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+
+import utils.swipes
+from config import config
+from utils.sharding import pick_worker
+from utils.swipes import BUFFERED, IMMEDIATE, SwipeBuffer
+
+
+class FakeLikes:
+    """The likes table, with a round trip (a yield to the loop) per query"""
+
+    def __init__(self):
+        self.rows = set()
+        self.atomic_calls = 0
+
+    async def has_liked(self, user_id, liked_user_id):
+        await asyncio.sleep(0)
+        return (user_id, liked_user_id) in self.rows
+
+    async def add_like_and_match(self, user_id, liked_user_id):
+        self.atomic_calls += 1
+        await asyncio.sleep(0)
+        if (user_id, liked_user_id) in self.rows:
+            return False, False
+        self.rows.add((user_id, liked_user_id))
+        return True, (liked_user_id, user_id) in self.rows
+
+    async def record_likes(self, pairs):
+        await asyncio.sleep(0)
+        self.rows.update(pairs)
+        return len(pairs)
+
+    async def record_skips(self, pairs):
+        return len(pairs)
+
+
+@pytest.fixture
+def likes(monkeypatch):
+    likes = FakeLikes()
+    monkeypatch.setattr(utils.swipes, 'db', likes)
+    return likes
+
+
+def test_repeated_like_is_not_added(likes):
+    buffer = SwipeBuffer(mode=BUFFERED)
+
+    async def main():
+        first = await buffer.add_like(1, 2)
+        pending = await buffer.add_like(1, 2)
+        await buffer.flush()
+        return first, pending, await buffer.add_like(1, 2)
+
+    first, pending, flushed = asyncio.run(main())
+    assert first.added and not pending.added and not flushed.added
+
+
+def test_likes_for_another_workers_user_are_written_at_once(likes, monkeypatch):
+    monkeypatch.setattr(config, 'WEBHOOK_WORKERS', 2)
+    local = next(user_id for user_id in range(1, 100) if pick_worker(user_id, 2) == 0)
+    remote = next(user_id for user_id in range(1, 100) if pick_worker(user_id, 2) == 1)
+    workers = [SwipeBuffer(mode=BUFFERED), SwipeBuffer(mode=BUFFERED)]
+
+    async def main():
+        monkeypatch.setattr(config, 'WORKER_INDEX', 0)
+        first = await workers[0].add_like(local, remote)
+        monkeypatch.setattr(config, 'WORKER_INDEX', 1)
+        second = await workers[1].add_like(remote, local)
+        return first, second
+
+    first, second = asyncio.run(main())
+    # Neither like waited in a buffer the other worker can't see
+    assert (first.mutual, second.mutual) == (False, True)
+    assert likes.atomic_calls == 2
+    assert [worker.pending() for worker in workers] == [0, 0]
+
+
+def like_each_other(buffer, pairs, flush_between=False):
+    async def flusher():
+        while True:
+            await buffer.flush()
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.create_task(flusher()) if flush_between else None
+        results = await asyncio.gather(*(buffer.add_like(a, b) for first, second in pairs
+                                         for a, b in ((first, second), (second, first))))
+        if task:
+            task.cancel()
+        await buffer.flush()
+        return results
+
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize('mode, flush_between', [(BUFFERED, False), (BUFFERED, True), (IMMEDIATE, False)])
+def test_each_match_is_reported_once(likes, mode, flush_between):
+    buffer = SwipeBuffer(mode=mode)
+    pairs = [(n, n + 1) for n in range(1, 60, 2)]
+    results = like_each_other(buffer, pairs, flush_between)
+    assert all(result.added for result in results)
+    assert sum(result.mutual for result in results) == len(pairs)
+    assert len(likes.rows) == 2 * len(pairs)
+    assert buffer.pair_locks.locks == {}
+
+
+def test_swipes_being_flushed_are_still_pending(likes, monkeypatch):
+    buffer = SwipeBuffer(mode=BUFFERED)
+    monkeypatch.setattr(config, 'SKIP_COOLDOWN_HOURS', 24)
+    seen = []
+
+    async def record_skips(pairs):
+        seen.append(sorted(buffer.pending_targets(1)))
+        return len(pairs)
+
+    likes.record_skips = record_skips
+
+    async def main():
+        await buffer.add_like(1, 2)
+        await buffer.add_skip(1, 3)
+        await buffer.add_skip(4, 5)
+        await buffer.flush()
+
+    asyncio.run(main())
+    assert seen == [[2, 3]]
+    assert buffer.pending_targets(1) == []
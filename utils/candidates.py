@@ -0,0 +1,121 @@
+from array import array
+from typing import List, Optional, Tuple
+
+from async_database import db
+from config import config
+from utils.matching_index import matching_index, normalize
+from utils.swipes import swipe_buffer
+
+
+def get_origin(user_data: Optional[dict]) -> Optional[Tuple[float, float]]:
+    """The user's shared location, when nearby profiles should come first"""
+    if not config.GEO_MATCHING_ENABLED or not user_data:
+        return None
+    if user_data.get('latitude') is None or user_data.get('longitude') is None:
+        return None
+    return user_data['latitude'], user_data['longitude']
+
+
+async def flush_pending_swipes(user_id: int):
+    """The SQL candidate queries only see committed likes and skips"""
+    if swipe_buffer.pending_targets(user_id):
+        await swipe_buffer.flush()
+
+
+def get_preferences(user_data: Optional[dict]) -> Optional[dict]:
+    """The user's matching preferences in the form the candidate queries take (None: anyone)"""
+    if not user_data:
+        return None
+    preferences = {
+        'min_age': user_data.get('pref_min_age'),
+        'max_age': user_data.get('pref_max_age'),
+        'religions': [normalize(value) for value in user_data.get('pref_religions') or []],
+        'cities': [normalize(value) for value in user_data.get('pref_cities') or []],
+    }
+    return preferences if any(preferences.values()) else None
+
+
+async def get_candidate_page(user_id: int, gender: str, seed: str, cursor_token: str = None,
+                             limit: int = None) -> Tuple[List[dict], Optional[str]]:
+    """Next page of candidate profiles for a browsing pass.
+
+    Users who shared a location first get the profiles within
+    ``GEO_RADIUS_KM``, nearest first ("geo:" cursors), then everyone else
+    in the pass's random order ("far:" cursors). Only profiles matching the
+    user's preferences are returned. Served from the in-memory matching
+    index once it is loaded (the page is then hydrated with a single
+    primary-key query), otherwise from SQL.
+    """
+    limit = limit or config.MATCH_PAGE_SIZE
+    user_data = await db.get_user(user_id)
+    origin = get_origin(user_data)
+    preferences = get_preferences(user_data)
+
+    if origin and (not cursor_token or cursor_token.startswith("geo:")):
+        profiles, next_cursor = await get_nearby_page(
+            user_id, gender, origin, cursor_token[4:] if cursor_token else None, limit, preferences
+        )
+        if next_cursor:
+            return profiles, f"geo:{next_cursor}"
+        # Nearby profiles are used up: go on with everyone farther away
+        cursor_token = "far:"
+        if profiles:
+            return profiles, cursor_token
+    elif cursor_token and cursor_token.startswith("geo:"):
+        # Location removed mid-pass: let the caller start over
+        return [], None
+
+    far = bool(cursor_token) and cursor_token.startswith("far:")
+    if far:
+        cursor_token = cursor_token[4:] or None
+    exclude_near = (origin[0], origin[1], config.GEO_RADIUS_KM) if far and origin else None
+
+    profiles, next_cursor = await get_random_page(user_id, gender, seed, cursor_token, limit,
+                                                  exclude_near, preferences)
+    if far and next_cursor:
+        next_cursor = f"far:{next_cursor}"
+    return profiles, next_cursor
+
+
+async def get_nearby_page(user_id: int, gender: str, origin: Tuple[float, float], cursor_token: str,
+                          limit: int, preferences: dict = None) -> Tuple[List[dict], Optional[str]]:
+    """Candidates within ``GEO_RADIUS_KM`` of ``origin``, nearest first"""
+    latitude, longitude = origin
+    if matching_index.ready:
+        user_ids, next_cursor = await matching_index.nearby_page(
+            user_id, gender, latitude, longitude, config.GEO_RADIUS_KM, cursor_token, limit,
+            preferences=preferences
+        )
+        return await db.get_users_by_ids(user_ids), next_cursor
+    await flush_pending_swipes(user_id)
+    return await db.get_nearby_candidates(
+        user_id, gender, latitude, longitude, config.GEO_RADIUS_KM, cursor_token, limit, preferences
+    )
+
+
+async def get_random_page(user_id: int, gender: str, seed: str, cursor_token: str, limit: int,
+                          exclude_near: Tuple[float, float, float] = None,
+                          preferences: dict = None) -> Tuple[List[dict], Optional[str]]:
+    """Candidates in the random order fixed by ``seed``"""
+    if matching_index.ready:
+        user_ids, next_cursor = await matching_index.candidate_page(
+            user_id, gender, seed, cursor_token, limit, preferences=preferences, exclude_near=exclude_near
+        )
+        return await db.get_users_by_ids(user_ids), next_cursor
+
+    if cursor_token and cursor_token.startswith("ix:"):
+        # Pass started on the index, which is gone: let the caller start over
+        return [], None
+    await flush_pending_swipes(user_id)
+    return await db.get_candidate_page(user_id, gender, seed, cursor_token, limit, exclude_near, preferences)
+
+
+async def get_candidate_ids(user_id: int, gender: str, seed: str, cursor_token: str = None,
+                            limit: int = None) -> Tuple[array, Optional[str]]:
+    """Ids of the next candidate page, for sessions that keep only ids.
+
+    The rows fetched on the way stay in the shared profile cache, so showing
+    them one by one afterwards doesn't go back to the database.
+    """
+    profiles, next_cursor = await get_candidate_page(user_id, gender, seed, cursor_token, limit)
+    return array('q', (profile['user_id'] for profile in profiles)), next_cursor
@@ -0,0 +1,29 @@
+import math
+from typing import Tuple
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+def distance_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle (haversine) distance between two points, in km"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = (math.sin((phi2 - phi1) / 2) ** 2
+         + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bounding_box(latitude: float, longitude: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """(min_lat, max_lat, min_lon, max_lon) enclosing the circle of ``radius_km`` around a point"""
+    delta_lat = radius_km / KM_PER_DEGREE
+    min_lat, max_lat = latitude - delta_lat, latitude + delta_lat
+    cos_lat = math.cos(math.radians(latitude))
+    if min_lat <= -90 or max_lat >= 90 or cos_lat <= 0:
+        return max(min_lat, -90.0), min(max_lat, 90.0), -180.0, 180.0
+
+    delta_lon = delta_lat / cos_lat
+    min_lon, max_lon = longitude - delta_lon, longitude + delta_lon
+    if min_lon < -180 or max_lon > 180:
+        # Crosses the antimeridian: don't bound longitude
+        min_lon, max_lon = -180.0, 180.0
+    return min_lat, max_lat, min_lon, max_lon
@@ -1,8 +1,15 @@
+import base64
 import json
 import logging
 import html
+import random
+from array import array
 from typing import List, Optional, Dict, Any
 from aiogram.types import Message
+from config import config
+from keyboards.inline import get_match_keyboard
+from storage import kv_store
+from utils.send_queue import send_queue
 from utils.translations import get_text  # ✅ ADD THIS IMPORT
 
 def escape_markdown_v2(text: str) -> str:
@@ -15,9 +22,13 @@ def escape_markdown_v2(text: str) -> str:
     import re
     return re.sub(escape_chars, r'\\\g<0>', text)
 
-def format_profile_safe(user_data: dict, language: str = 'english') -> str:
-    """Format user profile in the specified style with real data"""
-    from database import db  # Import here to avoid circular imports
+async def format_profile_safe(user_data: dict, language: str = 'english', stats: dict = None) -> str:
+    """Format user profile in the specified style with real data.
+
+    Pass ``stats`` (an entry of ``db.get_users_stats``) when formatting
+    several profiles to fetch them all in one query.
+    """
+    from async_database import db  # Import here to avoid circular imports
     
     first_name = user_data.get('first_name', get_text('profile_unknown', language))
     age = user_data.get('age', '')
@@ -53,9 +64,11 @@ def format_profile_safe(user_data: dict, language: str = 'english') -> str:
     
     # REAL STATS - Get actual data from database
     user_id = user_data['user_id']
-    likes_count = db.get_user_likes_count(user_id)
-    matches_count = db.get_user_matches_count(user_id)
-    coins_balance = db.get_user_coins(user_id)
+    if stats is None:
+        stats = (await db.get_users_stats([user_id])).get(user_id, {})
+    likes_count = stats.get('likes', 0)
+    matches_count = stats.get('matches', 0)
+    coins_balance = stats.get('coins', 0)
     
     # ✅ KEEP EMOJIS AS REQUESTED - Use the specific format with emojis
     profile_text += get_text('profile_stats', language, likes=likes_count, matches=matches_count) + "\n\n"
@@ -63,6 +76,23 @@ def format_profile_safe(user_data: dict, language: str = 'english') -> str:
     
     return profile_text
 
+async def notify_match(user_id: int, other_user_id: int):
+    """Tell both users of a new match, through the send queue"""
+    from async_database import db  # Import here to avoid circular imports
+    
+    users = {user['user_id']: user for user in await db.get_users_by_ids([user_id, other_user_id])}
+    if len(users) < 2:
+        return  # One of them was deactivated meanwhile
+    
+    for recipient, partner in ((user_id, other_user_id), (other_user_id, user_id)):
+        language = users[recipient].get('language') or 'english'
+        name = users[partner].get('first_name') or get_text('profile_unknown', language)
+        send_queue.send_message(
+            recipient,
+            get_text('new_match', language, name=name),
+            reply_markup=get_match_keyboard(partner)
+        )
+
 def format_profile_html(user_data: dict, language: str = 'english') -> str:
     """Format user profile using HTML formatting for profile browsing view"""
     from database import db  # Import here to avoid circular imports
@@ -97,34 +127,44 @@ def format_profile_html(user_data: dict, language: str = 'english') -> str:
     return profile_text
 
 class UserState:
-    def __init__(self):
-        self.states = {}
-    
-    def set_state(self, user_id: int, state: str, data: dict = None):
-        if user_id not in self.states:
-            self.states[user_id] = {}
-        self.states[user_id]['state'] = state
+    """Per-user state and data, kept in the shared key-value store.
+
+    Entries expire after ``config.SESSION_TTL`` seconds without an update,
+    survive restarts and are visible to every worker.
+    """
+    def __init__(self, store=None, ttl: int = None):
+        self.store = store or kv_store
+        self.ttl = ttl or config.SESSION_TTL
+    
+    @staticmethod
+    def key(user_id: int) -> str:
+        return f"user_state:{user_id}"
+    
+    async def _load(self, user_id: int) -> dict:
+        return await self.store.get(self.key(user_id)) or {}
+    
+    async def set_state(self, user_id: int, state: str, data: dict = None):
+        entry = await self._load(user_id)
+        entry['state'] = state
         if data:
-            self.states[user_id]['data'] = data
-    
-    def get_state(self, user_id: int) -> Optional[str]:
-        user_data = self.states.get(user_id, {})
-        return user_data.get('state')
-    
-    def get_data(self, user_id: int) -> dict:
-        user_data = self.states.get(user_id, {})
-        return user_data.get('data', {})
-    
-    def update_data(self, user_id: int, kwargs):
-        if user_id not in self.states:
-            self.states[user_id] = {'data': {}}
-        if 'data' not in self.states[user_id]:
-            self.states[user_id]['data'] = {}
-        self.states[user_id]['data'].update(kwargs)
-    
-    def clear_state(self, user_id: int):
-        if user_id in self.states:
-            del self.states[user_id]
+            entry['data'] = data
+        await self.store.set(self.key(user_id), entry, self.ttl)
+    
+    async def get_state(self, user_id: int) -> Optional[str]:
+        entry = await self._load(user_id)
+        return entry.get('state')
+    
+    async def get_data(self, user_id: int) -> dict:
+        entry = await self._load(user_id)
+        return entry.get('data', {})
+    
+    async def update_data(self, user_id: int, kwargs):
+        entry = await self._load(user_id)
+        entry.setdefault('data', {}).update(kwargs)
+        await self.store.set(self.key(user_id), entry, self.ttl)
+    
+    async def clear_state(self, user_id: int):
+        await self.store.delete(self.key(user_id))
 
 def parse_photos(photos_json: str) -> List[str]:
     """Parse photos from JSON string"""
@@ -135,6 +175,23 @@ def parse_photos(photos_json: str) -> List[str]:
     except (json.JSONDecodeError, TypeError):
         return []
 
+def pack_ids(user_ids) -> str:
+    """Serialize user ids compactly (base64 of an int64 array) for stored sessions"""
+    return base64.b64encode(array('q', user_ids).tobytes()).decode('ascii')
+
+def unpack_ids(packed: Optional[str]) -> array:
+    """Inverse of pack_ids"""
+    user_ids = array('q')
+    if packed:
+        user_ids.frombytes(base64.b64decode(packed))
+    return user_ids
+
+def new_match_seed(user_id: int) -> str:
+    """Seed for a new browsing pass (fixes the random order of all its pages)"""
+    if config.MATCH_RANDOM_SEED:
+        return f"{user_id}-{config.MATCH_RANDOM_SEED}"
+    return f"{user_id}-{random.getrandbits(32)}"
+
 def save_photos(photos_list: List[str]) -> str:
     """Save photos list as JSON string"""
     try:
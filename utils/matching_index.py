@@ -0,0 +1,449 @@
+import asyncio
+import hashlib
+import heapq
+import logging
+import math
+import random
+from array import array
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+
+from cachetools import TTLCache
+
+from async_database import db
+from config import config
+from utils.geo import KM_PER_DEGREE, bounding_box, distance_km
+
+
+def opposite_gender(gender: str) -> str:
+    """Gender a user browses (the bot only matches opposite genders)"""
+    return "female" if gender.lower() == "male" else "male"
+
+def normalize(value) -> str:
+    """Bucket key form of a free-text attribute such as city or religion"""
+    return (value or "").strip().lower()
+
+def is_browsable(user_data: dict) -> bool:
+    """Same eligibility rules as the SQL candidate queries"""
+    return bool(
+        user_data.get('is_active')
+        and user_data.get('gender')
+        and user_data.get('photos') and user_data['photos'] != '[]'
+        and user_data.get('bio')
+    )
+
+def has_location(row: dict) -> bool:
+    return row.get('latitude') is not None and row.get('longitude') is not None
+
+def contains(sorted_ids: array, user_id: int) -> bool:
+    """Membership test on a sorted id array"""
+    position = bisect_left(sorted_ids, user_id)
+    return position < len(sorted_ids) and sorted_ids[position] == user_id
+
+
+class Bucket:
+    """Append-only profile ids with parallel arrays of the attributes candidates are filtered on"""
+    __slots__ = ('ids', 'ages', 'religions', 'cities', 'lats', 'lons')
+
+    def __init__(self):
+        self.ids = array('q')
+        self.ages = array('h')
+        self.religions = array('i')  # Codes from MatchingIndex.code
+        self.cities = array('i')
+        # Doubles, like the database columns, so distances here agree with
+        # the SQL ones a nearby cursor is handed over to. NaN: no location
+        self.lats = array('d')
+        self.lons = array('d')
+
+    def append(self, user_id: int, age: Optional[int], religion: int, city: int,
+               latitude: float = None, longitude: float = None):
+        self.ids.append(user_id)
+        self.ages.append(age or 0)
+        self.religions.append(religion)
+        self.cities.append(city)
+        self.lats.append(math.nan if latitude is None else latitude)
+        self.lons.append(math.nan if longitude is None else longitude)
+
+
+class Filter:
+    """A viewer's matching preferences, resolved against the index's attribute codes"""
+    __slots__ = ('min_age', 'max_age', 'religions', 'cities')
+
+    def __init__(self, min_age: int = None, max_age: int = None, religions: set = None, cities: set = None):
+        self.min_age = min_age
+        self.max_age = max_age
+        self.religions = religions  # None: any
+        self.cities = cities
+
+    def accepts(self, bucket: Bucket, position: int) -> bool:
+        age = bucket.ages[position]
+        if self.min_age or self.max_age:
+            # 0 is a missing age, which SQL's comparisons leave out too
+            if not age or (self.min_age and age < self.min_age) or (self.max_age and age > self.max_age):
+                return False
+        if self.religions is not None and bucket.religions[position] not in self.religions:
+            return False
+        if self.cities is not None and bucket.cities[position] not in self.cities:
+            return False
+        return True
+
+
+class MatchingIndex:
+    """Process-local index of browsable profiles for candidate generation.
+
+    Profiles are bucketed by gender, gender + city and gender + religion as
+    compact ``array('q')`` id lists, shuffled once when the index is built;
+    a viewer with preferred cities (or religions) only walks those
+    buckets. Profiles with a location are also put in a grid of
+    ``GEO_CELL_KM`` cells per gender, so nearby candidates are found by
+    scanning rings of cells outwards from the viewer, starting from the
+    distance the previous page reached. Each active user's
+    liked/blocked/skipped ids are a sorted ``array('q')`` that is loaded on
+    first use and updated in place on every like, block or skip, so a
+    candidate page is a walk over integers instead of an anti-join scan.
+
+    A browsing pass walks its buckets with a seeded start and stride, which
+    gives every session its own stable random order. Profiles that join
+    after a pass started are picked up by the next pass; profiles that
+    leave are skipped through ``removed`` until the next rebuild.
+    """
+
+    def __init__(self, max_users: int = None):
+        self.ready = False
+        self.generation = 0
+        self.buckets: Dict[tuple, Bucket] = {}
+        self.cells: Dict[tuple, Bucket] = {}
+        self.cell_degrees = config.GEO_CELL_KM / KM_PER_DEGREE
+        self.codes: Dict[str, int] = {"": 0}  # Normalized religion/city -> small int
+        self.members = set()
+        self.removed = set()
+        # Reloaded now and then so skips past their cooldown come back
+        self.exclusions = TTLCache(maxsize=max_users or config.MATCHING_INDEX_MAX_USERS,
+                                   ttl=config.MATCHING_EXCLUSIONS_TTL)
+
+    @staticmethod
+    def bucket_keys(gender: str, city: str = None, religion: str = None) -> List[tuple]:
+        keys = [('gender', normalize(gender))]
+        if normalize(city):
+            keys.append(('city', normalize(gender), normalize(city)))
+        if normalize(religion):
+            keys.append(('religion', normalize(gender), normalize(religion)))
+        return keys
+
+    def cell_of(self, latitude: float, longitude: float) -> Tuple[int, int]:
+        return math.floor(latitude / self.cell_degrees), math.floor(longitude / self.cell_degrees)
+
+    def code(self, value) -> int:
+        """Small int standing for a normalized attribute value (codes are never reused)"""
+        value = normalize(value)
+        if value not in self.codes:
+            self.codes[value] = len(self.codes)
+        return self.codes[value]
+
+    def make_filter(self, preferences: dict = None) -> Optional[Filter]:
+        """Filter for a viewer's preferences (see build_preference_conditions)"""
+        if not preferences:
+            return None
+
+        def codes(values):
+            if not values:
+                return None
+            # Values no profile has don't get a code: they can't match anyone
+            return {self.codes[value] for value in map(normalize, values) if value in self.codes}
+
+        return Filter(preferences.get('min_age'), preferences.get('max_age'),
+                      codes(preferences.get('religions')), codes(preferences.get('cities')))
+
+    def _add(self, buckets: Dict[tuple, Bucket], cells: Dict[tuple, Bucket], row: dict):
+        latitude, longitude = row.get('latitude'), row.get('longitude')
+        attributes = (row['user_id'], row.get('age'), self.code(row.get('religion')), self.code(row.get('city')),
+                      latitude, longitude)
+        for key in self.bucket_keys(row['gender'], row.get('city'), row.get('religion')):
+            if key not in buckets:
+                buckets[key] = Bucket()
+            buckets[key].append(*attributes)
+        if has_location(row):
+            key = (normalize(row['gender']),) + self.cell_of(latitude, longitude)
+            if key not in cells:
+                cells[key] = Bucket()
+            cells[key].append(*attributes)
+
+    async def load(self):
+        """(Re)build every bucket from the database"""
+        rows = list(await db.get_matching_snapshot())
+        if not rows:
+            # An empty snapshot is as likely a failed query as an empty table;
+            # keep serving what we have (or let SQL serve until we have data)
+            logging.warning("⚠️ Matching index snapshot was empty, keeping the current index")
+            return
+
+        if config.MATCH_RANDOM_SEED:
+            rows.sort(key=lambda row: row['user_id'])
+            random.Random(config.MATCH_RANDOM_SEED).shuffle(rows)
+        else:
+            random.shuffle(rows)
+        buckets, cells = {}, {}
+        for row in rows:
+            self._add(buckets, cells, row)
+
+        self.buckets = buckets
+        self.cells = cells
+        self.members = {row['user_id'] for row in rows}
+        self.removed = set()
+        self.generation += 1
+        self.ready = True
+        logging.info(f"✅ Matching index loaded: {len(rows)} profiles in {len(buckets)} buckets")
+
+    async def refresh_forever(self, interval: float = None):
+        """Rebuild periodically to pick up changes made by other processes"""
+        interval = interval or config.MATCHING_INDEX_REFRESH_SECONDS
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.load()
+            except Exception as e:
+                logging.error(f"Error refreshing matching index: {e}")
+
+    async def refresh_user(self, user_id: int):
+        """Add a profile that just became browsable (or drop one that no longer is)"""
+        if not self.ready:
+            return
+        user_data = await db.get_user(user_id)
+        if not user_data or not is_browsable(user_data):
+            self.removed.add(user_id)
+            return
+
+        self.removed.discard(user_id)
+        if user_id not in self.members:
+            self._add(self.buckets, self.cells, user_data)
+            self.members.add(user_id)
+
+    def remove_user(self, user_id: int):
+        """Forget a deleted account"""
+        self.removed.add(user_id)
+        self.exclusions.pop(user_id, None)
+
+    def record_like(self, user_id: int, liked_user_id: int):
+        """Exclude a liked profile from the user's future candidates"""
+        self._exclude(user_id, liked_user_id)
+
+    def record_block(self, user_id: int, blocked_user_id: int):
+        """Exclude a blocked profile from the user's future candidates"""
+        self._exclude(user_id, blocked_user_id)
+
+    def record_skip(self, user_id: int, skipped_user_id: int):
+        """Exclude a skipped profile until the exclusions are next reloaded"""
+        if config.SKIP_COOLDOWN_HOURS > 0:
+            self._exclude(user_id, skipped_user_id)
+
+    def _exclude(self, user_id: int, other_user_id: int):
+        excluded = self.exclusions.get(user_id)
+        # Not loaded yet: the next load finds it in the database or the swipe buffer
+        if excluded is not None and not contains(excluded, other_user_id):
+            insort(excluded, other_user_id)
+
+    async def get_exclusions(self, user_id: int) -> array:
+        """Sorted ids the user liked, blocked or recently skipped"""
+        excluded = self.exclusions.get(user_id)
+        if excluded is None:
+            from utils.swipes import swipe_buffer  # utils.swipes imports this module
+            # Buffered likes and skips aren't in the database yet; read them
+            # before and after the query, so a flush in between loses none
+            pending = swipe_buffer.pending_targets(user_id)
+            excluded = set(await db.get_excluded_user_ids(user_id))
+            excluded.update(pending, swipe_buffer.pending_targets(user_id))
+            excluded = array('q', sorted(excluded))
+            self.exclusions[user_id] = excluded
+        return excluded
+
+    def pass_buckets(self, target_gender: str, preferences: dict = None) -> List[Optional[Bucket]]:
+        """Buckets a browsing pass walks one after the other (None for a value no profile has yet)"""
+        if preferences and preferences.get('cities'):
+            keys = [('city', target_gender, city) for city in sorted(set(map(normalize, preferences['cities'])))]
+        elif preferences and preferences.get('religions'):
+            keys = [('religion', target_gender, religion)
+                    for religion in sorted(set(map(normalize, preferences['religions'])))]
+        else:
+            keys = [('gender', target_gender)]
+        return [self.buckets.get(key) for key in keys]
+
+    @staticmethod
+    def _walk(seed: str, size: int) -> Tuple[int, int]:
+        """Start and stride of a seeded full-cycle walk over ``size`` positions"""
+        digest = hashlib.blake2b(seed.encode(), digest_size=16).digest()
+        start = int.from_bytes(digest[:8], 'big') % size
+        stride = int.from_bytes(digest[8:], 'big') % size or 1
+        while math.gcd(stride, size) != 1:
+            stride = stride % size + 1
+        return start, stride
+
+    async def candidate_page(self, user_id: int, gender: str, seed: str, cursor_token: str = None,
+                             limit: int = 20, preferences: dict = None,
+                             exclude_near: Tuple[float, float, float] = None) -> Tuple[List[int], Optional[str]]:
+        """Next ``limit`` candidate ids of a browsing pass and the cursor after them.
+
+        ``preferences`` are the viewer's filters; ``exclude_near`` is a
+        (latitude, longitude, radius_km) circle whose profiles are skipped
+        (a nearby pass already showed them). The cursor is
+        "ix:<generation>:<bucket>:<size>:<step>", the position in the
+        ``bucket``-th of ``pass_buckets``.
+        """
+        buckets = self.pass_buckets(opposite_gender(gender), preferences)
+
+        if cursor_token:
+            try:
+                prefix, generation, part, size, step = cursor_token.split(":")
+                generation, part, size, step = int(generation), int(part), int(size), int(step)
+            except ValueError:
+                return [], None
+            # Rebuilt since this pass started: positions no longer line up
+            if prefix != "ix" or generation != self.generation:
+                return [], None
+        else:
+            part, size, step = 0, None, 0
+
+        excluded = await self.get_exclusions(user_id)
+        wanted = self.make_filter(preferences)
+        candidates = []
+
+        while part < len(buckets) and len(candidates) < limit:
+            bucket = buckets[part]
+            if size is None:
+                # Profiles added to the bucket after this point wait for the next pass
+                size = len(bucket.ids) if bucket is not None else 0
+            if size:
+                start, stride = self._walk(seed, size)
+            while step < size and len(candidates) < limit:
+                position = (start + step * stride) % size
+                step += 1
+                candidate_id = bucket.ids[position]
+                if candidate_id == user_id or candidate_id in self.removed or contains(excluded, candidate_id):
+                    continue
+                if wanted and not wanted.accepts(bucket, position):
+                    continue
+                if exclude_near and distance_km(exclude_near[0], exclude_near[1], bucket.lats[position],
+                                                bucket.lons[position]) <= exclude_near[2]:
+                    # Near. No location (NaN) comes out as half the earth's
+                    # circumference, so those profiles are kept here
+                    continue
+                candidates.append(candidate_id)
+            if step >= size:
+                part, size, step = part + 1, None, 0
+
+        if part >= len(buckets):
+            return candidates, None
+        if size is None:
+            size = len(buckets[part].ids) if buckets[part] is not None else 0
+        return candidates, f"ix:{self.generation}:{part}:{size}:{step}"
+
+    async def nearby_page(self, user_id: int, gender: str, latitude: float, longitude: float,
+                          radius_km: float, cursor_token: str = None, limit: int = 20,
+                          preferences: dict = None) -> Tuple[List[int], Optional[str]]:
+        """Next ``limit`` candidate ids within ``radius_km``, nearest first.
+
+        Same keyset cursor as ``Database.get_nearby_candidates`` (distance and
+        id of the last profile), so a pass can move between the index and SQL.
+        Cells are visited nearest first, skipping those wholly within the
+        cursor's distance and stopping at the first one farther than the
+        page's last profile, so a page only reads the cells around its own
+        distance band.
+        """
+        after = None
+        if cursor_token:
+            try:
+                last_distance, last_user_id = cursor_token.split(":")
+                after = (float(last_distance), int(last_user_id))
+            except ValueError:
+                return [], None
+
+        target_gender = normalize(opposite_gender(gender))
+        min_lat, max_lat, min_lon, max_lon = bounding_box(latitude, longitude, radius_km)
+        low_row, low_col = self.cell_of(min_lat, min_lon)
+        high_row, high_col = self.cell_of(max_lat, max_lon)
+        bounds = (low_row, high_row, low_col, high_col)
+        center_row, center_col = self.cell_of(latitude, longitude)
+        last_ring = max(center_row - low_row, high_row - center_row, center_col - low_col, high_col - center_col)
+
+        # Rings are the cells r steps away from the viewer's. Every point in
+        # ring r is at least r - 1 cells away in latitude or longitude, and
+        # at most r + 1 in both; cells are narrowest at the highest latitude.
+        cell_km = self.cell_degrees * KM_PER_DEGREE
+        highest_lat = min(90.0, max(abs(min_lat), abs(max_lat)) + self.cell_degrees)
+        near_km = 0.99 * cell_km * math.cos(math.radians(highest_lat))
+        far_km = 1.01 * cell_km * math.sqrt(2)
+
+        ring = 0
+        if after:
+            # Rings wholly within the cursor's distance were shown already
+            ring = max(0, min(last_ring + 1, math.ceil(after[0] / far_km) - 1))
+
+        excluded = await self.get_exclusions(user_id)
+        wanted = self.make_filter(preferences)
+        pending_cells = []  # (nearest possible distance, row, col), a heap
+        page = []  # (-distance, -id) of the nearest ones found, a heap
+        while True:
+            # Open rings until none left unopened can hold a nearer cell
+            while ring <= last_ring and (not pending_cells or pending_cells[0][0] >= (ring - 1) * near_km):
+                for row, col in self.ring_cells(center_row, center_col, ring, bounds):
+                    if (target_gender, row, col) in self.cells:
+                        nearest, farthest = self.cell_distances(latitude, longitude, row, col)
+                        if nearest <= radius_km and not (after and farthest < after[0]):
+                            heapq.heappush(pending_cells, (nearest, row, col))
+                ring += 1
+            if not pending_cells:
+                break
+            nearest, row, col = heapq.heappop(pending_cells)
+            if len(page) >= limit and -page[0][0] < nearest:
+                break  # The page is settled
+
+            cell = self.cells[(target_gender, row, col)]
+            for position, candidate_id in enumerate(cell.ids):
+                if candidate_id == user_id or candidate_id in self.removed:
+                    continue
+                if wanted and not wanted.accepts(cell, position):
+                    continue
+                distance = distance_km(latitude, longitude, cell.lats[position], cell.lons[position])
+                if distance > radius_km or (after and (distance, candidate_id) <= after):
+                    continue
+                if len(page) >= limit and (distance, candidate_id) >= (-page[0][0], -page[0][1]):
+                    continue
+                if contains(excluded, candidate_id):
+                    continue
+                heapq.heappush(page, (-distance, -candidate_id))
+                if len(page) > limit:
+                    heapq.heappop(page)
+
+        page = sorted((-distance, -candidate_id) for distance, candidate_id in page)
+        next_cursor = f"{page[-1][0]!r}:{page[-1][1]}" if len(page) >= limit else None
+        return [candidate_id for _, candidate_id in page], next_cursor
+
+    def cell_distances(self, latitude: float, longitude: float, row: int, col: int) -> Tuple[float, float]:
+        """Lower and upper bounds of the distance from a point to anywhere in a grid cell, in km"""
+        low_lat, low_lon = row * self.cell_degrees, col * self.cell_degrees
+        high_lat, high_lon = low_lat + self.cell_degrees, low_lon + self.cell_degrees
+        nearest = distance_km(latitude, longitude, min(max(latitude, low_lat), high_lat),
+                              min(max(longitude, low_lon), high_lon))
+        farthest = max(distance_km(latitude, longitude, corner_lat, corner_lon)
+                       for corner_lat in (low_lat, high_lat) for corner_lon in (low_lon, high_lon))
+        return 0.99 * nearest, 1.01 * farthest
+
+    @staticmethod
+    def ring_cells(center_row: int, center_col: int, ring: int, bounds: Tuple[int, int, int, int]):
+        """Cells exactly ``ring`` steps (in rows or columns) from the center cell, within
+        ``bounds`` (low_row, high_row, low_col, high_col)"""
+        low_row, high_row, low_col, high_col = bounds
+        cols = range(max(low_col, center_col - ring), min(high_col, center_col + ring) + 1)
+        for row in sorted({center_row - ring, center_row + ring}):
+            if low_row <= row <= high_row:
+                for col in cols:
+                    yield row, col
+        if ring == 0:
+            return
+        for col in (center_col - ring, center_col + ring):
+            if low_col <= col <= high_col:
+                for row in range(max(low_row, center_row - ring + 1), min(high_row, center_row + ring - 1) + 1):
+                    yield row, col
+
+
+# Global matching index
+matching_index = MatchingIndex()
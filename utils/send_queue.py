@@ -0,0 +1,230 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import SendMediaGroup, SendMessage, SendPhoto, TelegramMethod
+
+from config import config
+
+# Priority lanes, served in this order
+USER = 0   # Replies and notifications users are waiting for
+ADMIN = 1  # Notices to the admin chat
+LANES = (USER, ADMIN)
+
+
+class TokenBucket:
+    """Refills ``rate`` tokens per second up to ``capacity``"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, tokens: float = 1) -> float:
+        """Seconds until ``tokens`` are available (0 when they are now)"""
+        self._refill()
+        return max(0.0, (min(tokens, self.capacity) - self.tokens) / self.rate)
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take ``tokens`` now, going into debt if needed; returns how long to wait"""
+        self._refill()
+        self.tokens -= tokens
+        return max(0.0, -self.tokens / self.rate)
+
+    def is_full(self) -> bool:
+        self._refill()
+        return self.tokens >= self.capacity
+
+
+class SendJob:
+    __slots__ = ('method', 'priority', 'weight', 'future')
+
+    def __init__(self, method: TelegramMethod, priority: int, weight: int, future: asyncio.Future):
+        self.method = method
+        self.priority = priority
+        self.weight = weight
+        self.future = future
+
+
+class ChatQueue:
+    """Pending sends of one chat, delivered strictly in order"""
+    __slots__ = ('jobs', 'bucket', 'scheduled')
+
+    def __init__(self, bucket: TokenBucket):
+        self.jobs: Deque[SendJob] = deque()
+        self.bucket = bucket
+        self.scheduled = False  # Waiting in a lane or being sent by a worker
+
+
+class SendQueue:
+    """Rate-limited outbound queue for Telegram send calls.
+
+    Handlers hand over a ready method object (``SendMessage``, ``SendPhoto``,
+    ...) and get a future back right away; awaiting it is only needed when
+    the caller wants the result or the error. A fixed set of workers sends
+    for many chats at once while respecting a global token bucket and one
+    bucket per chat. Each chat's messages go out in the order they were
+    queued, user-facing sends are served before admin notices, and flood
+    control (``RetryAfter``) is waited out and retried.
+    """
+
+    def __init__(self, workers: int = None, global_rate: float = None, chat_rate: float = None,
+                 chat_burst: int = None, max_retries: int = None):
+        self.workers = workers or config.SEND_WORKERS
+        self.global_rate = global_rate or config.SEND_GLOBAL_RATE
+        self.chat_rate = chat_rate or config.SEND_CHAT_RATE
+        self.chat_burst = chat_burst or config.SEND_CHAT_BURST
+        self.max_retries = max_retries if max_retries is not None else config.SEND_MAX_RETRIES
+
+        self.bot: Optional[Bot] = None
+        self.global_bucket = TokenBucket(self.global_rate, self.global_rate)
+        self.chats: Dict[int, ChatQueue] = {}
+        self.lanes: Dict[int, Deque[int]] = {lane: deque() for lane in LANES}
+        self.wakeup = asyncio.Event()
+        self.tasks: List[asyncio.Task] = []
+
+    def start(self, bot: Bot):
+        """Start the workers that send through ``bot``"""
+        self.bot = bot
+        if not self.tasks:
+            self.tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+            logging.info(f"✅ Send queue started ({self.workers} workers)")
+
+    async def stop(self, timeout: float = 10):
+        """Give queued messages up to ``timeout`` seconds to go out, then stop"""
+        try:
+            await asyncio.wait_for(self._drained(), timeout)
+        except asyncio.TimeoutError:
+            logging.warning(f"⚠️ Send queue stopped with {self.pending()} messages unsent")
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+
+    def pending(self) -> int:
+        return sum(len(chat.jobs) for chat in self.chats.values())
+
+    async def _drained(self):
+        while any(chat.jobs or chat.scheduled for chat in self.chats.values()):
+            await asyncio.sleep(0.1)
+
+    def send(self, method: TelegramMethod, priority: int = USER) -> asyncio.Future:
+        """Queue a send method; the future resolves to its result"""
+        future = asyncio.get_running_loop().create_future()
+        # Fire-and-forget callers never look at the outcome: mark a failure
+        # as retrieved (it is logged by the worker) so asyncio doesn't warn
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+        weight = len(method.media) if isinstance(method, SendMediaGroup) else 1
+        chat = self.chats.get(method.chat_id)
+        if chat is None:
+            if len(self.chats) > config.SEND_MAX_IDLE_CHATS:
+                self._forget_idle_chats()
+            chat = self.chats[method.chat_id] = ChatQueue(TokenBucket(self.chat_rate, self.chat_burst))
+
+        chat.jobs.append(SendJob(method, priority, weight, future))
+        if not chat.scheduled:
+            chat.scheduled = True
+            self._schedule(method.chat_id)
+        return future
+
+    def send_message(self, chat_id: int, text: str, priority: int = USER, **kwargs) -> asyncio.Future:
+        return self.send(SendMessage(chat_id=chat_id, text=text, **kwargs), priority)
+
+    def send_photo(self, chat_id: int, photo: str, priority: int = USER, **kwargs) -> asyncio.Future:
+        return self.send(SendPhoto(chat_id=chat_id, photo=photo, **kwargs), priority)
+
+    def send_media_group(self, chat_id: int, media: list, priority: int = USER, **kwargs) -> asyncio.Future:
+        return self.send(SendMediaGroup(chat_id=chat_id, media=media, **kwargs), priority)
+
+    def _schedule(self, chat_id: int):
+        """Put a chat with pending jobs in the lane of its next job"""
+        chat = self.chats.get(chat_id)
+        if chat is None or not chat.jobs:
+            return
+        self.lanes[chat.jobs[0].priority].append(chat_id)
+        self.wakeup.set()
+
+    def _forget_idle_chats(self):
+        idle = [chat_id for chat_id, chat in self.chats.items()
+                if not chat.jobs and not chat.scheduled and chat.bucket.is_full()]
+        for chat_id in idle:
+            del self.chats[chat_id]
+
+    async def _next_chat(self) -> int:
+        while True:
+            for lane in LANES:
+                if self.lanes[lane]:
+                    return self.lanes[lane].popleft()
+            self.wakeup.clear()
+            await self.wakeup.wait()
+
+    async def _worker(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            chat_id = await self._next_chat()
+            chat = self.chats[chat_id]
+            job = chat.jobs[0]
+
+            # This chat is over its own limit: come back to it later and
+            # let the worker serve other chats meanwhile
+            wait = chat.bucket.wait_time(job.weight)
+            if wait > 0:
+                loop.call_later(wait, self._schedule, chat_id)
+                continue
+
+            chat.bucket.reserve(job.weight)
+            chat.jobs.popleft()
+            try:
+                await self._deliver(chat_id, job)
+            finally:
+                if chat.jobs:
+                    self._schedule(chat_id)
+                else:
+                    chat.scheduled = False
+
+    async def _deliver(self, chat_id: int, job: SendJob):
+        attempt = 0
+        while True:
+            wait = self.global_bucket.reserve(job.weight)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                result = await self.bot(job.method)
+            except TelegramRetryAfter as e:
+                attempt += 1
+                if attempt > self.max_retries:
+                    self._fail(chat_id, job, e)
+                    return
+                logging.warning(f"⚠️ Flood control for chat {chat_id}, retrying in {e.retry_after}s")
+                await asyncio.sleep(e.retry_after)
+                continue
+            except asyncio.CancelledError:
+                job.future.cancel()
+                raise
+            except Exception as e:
+                self._fail(chat_id, job, e)
+                return
+            if not job.future.done():
+                job.future.set_result(result)
+            return
+
+    @staticmethod
+    def _fail(chat_id: int, job: SendJob, error: Exception):
+        logging.error(f"Error sending {type(job.method).__name__} to {chat_id}: {error}")
+        if not job.future.done():
+            job.future.set_exception(error)
+
+
+# Global send queue
+send_queue = SendQueue()
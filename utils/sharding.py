@@ -0,0 +1,36 @@
+import hashlib
+
+from config import config
+
+
+def update_shard_key(update: dict) -> int:
+    """The id an incoming update is routed by: its sender, else its chat, else the update itself"""
+    for value in update.values():
+        if not isinstance(value, dict):
+            continue
+        user = value.get('from') or value.get('user')
+        if user and user.get('id') is not None:
+            return user['id']
+        chat = value.get('chat') or (value.get('message') or {}).get('chat')
+        if chat and chat.get('id') is not None:
+            return chat['id']
+    return update.get('update_id', 0)
+
+
+def pick_worker(key: int, workers: int) -> int:
+    """Worker (0..workers-1) owning ``key``, by rendezvous hashing.
+
+    Every key goes to the worker with the highest hash of (worker, key), so
+    the same user always lands on the same worker, and changing the number
+    of workers only moves the users of the workers added or removed.
+    """
+    return max(range(workers), key=lambda worker: hashlib.blake2b(
+        f"{worker}:{key}".encode(), digest_size=8
+    ).digest())
+
+
+def is_local_user(user_id: int) -> bool:
+    """Whether this process handles ``user_id``'s updates (always, unless it's one of several webhook workers)"""
+    if config.WORKER_INDEX < 0 or config.WEBHOOK_WORKERS <= 1:
+        return True
+    return pick_worker(user_id, config.WEBHOOK_WORKERS) == config.WORKER_INDEX
@@ -0,0 +1,156 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Dict, List, NamedTuple, Tuple
+
+from async_database import db
+from config import config
+from utils.matching_index import matching_index
+from utils.sharding import is_local_user
+
+BUFFERED = 'buffered'    # Write-behind: rows go out in batches
+IMMEDIATE = 'immediate'  # Every like/skip is written before the handler goes on
+
+
+class LikeResult(NamedTuple):
+    added: bool          # False when the user had already liked that profile
+    mutual: bool = False  # The other user liked them back first: it's a match
+
+
+class PairLocks:
+    """In-process locks on pairs of users, forgotten once nobody holds or awaits them"""
+
+    def __init__(self):
+        self.locks: Dict[Tuple[int, int], asyncio.Lock] = {}
+        self.users: Dict[Tuple[int, int], int] = {}
+
+    @asynccontextmanager
+    async def hold(self, user_id: int, other_user_id: int):
+        pair = (min(user_id, other_user_id), max(user_id, other_user_id))
+        lock = self.locks.setdefault(pair, asyncio.Lock())
+        self.users[pair] = self.users.get(pair, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self.users[pair] -= 1
+            if not self.users[pair]:
+                del self.users[pair]
+                del self.locks[pair]
+
+
+class SwipeBuffer:
+    """Likes and skips on their way to the ``likes`` and ``swipes`` tables.
+
+    In ``buffered`` mode (``SWIPE_WRITE_MODE``) a like or skip takes effect
+    in the matching index right away, and the rows are written as
+    multi-row inserts every ``SWIPE_FLUSH_SECONDS``, or as soon as
+    ``SWIPE_FLUSH_ROWS`` are waiting, instead of one transaction per button
+    press. Rows still buffered when the process dies are lost; ``immediate``
+    mode writes each one before returning. Pending likes can be looked up
+    with ``has_pending_like``, so ``add_like`` reports a match at once
+    even when the reverse like hasn't been flushed yet.
+
+    Only likes between two users handled by this process are buffered.
+    With several webhook workers, a like for a user of another worker is
+    written at once, since the reverse like may be waiting in that
+    worker's buffer where this one can't see it.
+    """
+
+    def __init__(self, mode: str = None, interval: float = None, max_rows: int = None):
+        self.mode = mode or config.SWIPE_WRITE_MODE
+        self.interval = interval or config.SWIPE_FLUSH_SECONDS
+        self.max_rows = max_rows or config.SWIPE_FLUSH_ROWS
+        # Ordered sets of (user_id, other_user_id)
+        self.likes: Dict[Tuple[int, int], None] = {}
+        self.skips: Dict[Tuple[int, int], None] = {}
+        self.flushing_likes = frozenset()  # Taken out of ``likes``, not committed yet
+        self.flushing_skips = frozenset()
+        self.pair_locks = PairLocks()
+        self.wakeup = asyncio.Event()
+        self.lock = asyncio.Lock()
+
+    def pending(self) -> int:
+        return len(self.likes) + len(self.skips)
+
+    def has_pending_like(self, user_id: int, liked_user_id: int) -> bool:
+        pair = (user_id, liked_user_id)
+        return pair in self.likes or pair in self.flushing_likes
+
+    def pending_targets(self, user_id: int) -> List[int]:
+        """Profiles the user liked or skipped whose rows aren't committed yet"""
+        return [other_user_id
+                for pairs in (self.likes, self.flushing_likes, self.skips, self.flushing_skips)
+                for swiper_id, other_user_id in pairs if swiper_id == user_id]
+
+    async def add_like(self, user_id: int, liked_user_id: int) -> LikeResult:
+        """Record a like and tell whether it completes a match.
+
+        Of two users liking each other at the same moment, exactly one is
+        told about the match.
+        """
+        if self.mode == IMMEDIATE or not is_local_user(liked_user_id):
+            # The database serializes the pair (see migration 11)
+            added, mutual = await db.add_like_and_match(user_id, liked_user_id)
+            if added:
+                matching_index.record_like(user_id, liked_user_id)
+            return LikeResult(added, mutual)
+
+        # Both likes of the pair go through this buffer: one at a time, the
+        # reverse like is either pending or already in the database
+        async with self.pair_locks.hold(user_id, liked_user_id):
+            if self.has_pending_like(user_id, liked_user_id) or await db.has_liked(user_id, liked_user_id):
+                return LikeResult(False)
+            self.likes[(user_id, liked_user_id)] = None
+            self._check_full()
+            matching_index.record_like(user_id, liked_user_id)
+            mutual = (self.has_pending_like(liked_user_id, user_id)
+                      or await db.has_liked(liked_user_id, user_id))
+            return LikeResult(True, mutual)
+
+    async def add_skip(self, user_id: int, skipped_user_id: int):
+        """Keep a skipped profile out of the user's candidates for the skip cooldown"""
+        if config.SKIP_COOLDOWN_HOURS <= 0:
+            return
+        matching_index.record_skip(user_id, skipped_user_id)
+        if self.mode == IMMEDIATE:
+            await db.record_skips([(user_id, skipped_user_id)])
+        else:
+            self.skips[(user_id, skipped_user_id)] = None
+            self._check_full()
+
+    def _check_full(self):
+        if self.pending() >= self.max_rows:
+            self.wakeup.set()
+
+    async def flush(self):
+        """Write everything pending"""
+        async with self.lock:
+            likes, self.likes = list(self.likes), {}
+            skips, self.skips = list(self.skips), {}
+            self.flushing_likes = frozenset(likes)
+            self.flushing_skips = frozenset(skips)
+            try:
+                if likes and await db.record_likes(likes) is None:
+                    # Keep them for the next flush (inserting a like twice is harmless)
+                    for pair in likes:
+                        self.likes.setdefault(pair, None)
+                    logging.warning(f"⚠️ {len(likes)} likes will be retried on the next flush")
+                if skips and not await db.record_skips(skips):
+                    logging.warning(f"⚠️ {len(skips)} skips were not recorded")
+            finally:
+                self.flushing_likes = self.flushing_skips = frozenset()
+
+    async def flush_forever(self):
+        """Flush on a timer, or early when the buffer fills up"""
+        while True:
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self.wakeup.clear()
+            await self.flush()
+
+
+# Global like/skip buffer
+swipe_buffer = SwipeBuffer()